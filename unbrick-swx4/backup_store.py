@@ -0,0 +1,191 @@
+#
+# -*- coding: UTF-8 -*-
+#
+# Spellchecker: words
+
+"""
+Content addressed store for the backups of the printer configuration file.
+
+Files are stored once, named by their SHA-256, and an index records every backup as a
+(printer, time, hash) entry. The index also keeps the CRC of each section of a file, so two
+backups are compared without parsing them again.
+
+	<folder>/
+		index.json
+		blobs/<first two hash digits>/<hash>.cfg
+"""
+
+import os
+import json
+import time
+import shutil
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from .my_env import Debug
+	from .my_lib import FileSha256
+else:
+	from my_env import Debug
+	from my_lib import FileSha256
+
+
+# Sub-folder of the work folder
+STORE_FOLDER = 'store'
+# Retention limits
+MAX_BYTES = 20 * 1024 * 1024
+MAX_AGE = 365 * 24 * 3600
+
+
+class BackupEntry:
+	" A backup of a printer "
+	def __init__(self, printer : str, timestamp : float, sha256 : str, name : str) -> None:
+		self.printer = printer
+		self.timestamp = timestamp
+		self.sha256 = sha256
+		# Original file name, like 'printer-20250501_101500.cfg'
+		self.name = name
+	def ToDict(self) -> dict:
+		return {'printer': self.printer, 'time': self.timestamp, 'hash': self.sha256, 'name': self.name}
+	@staticmethod
+	def FromDict(d : dict) -> "BackupEntry":
+		return BackupEntry(d['printer'], d['time'], d['hash'], d['name'])
+	def __repr__(self) -> str:
+		return f"BackupEntry({self.printer!r}, {self.timestamp!r}, {self.sha256!r}, {self.name!r})"
+
+
+class SectionDiff:
+	" Sections that differ between two backups "
+	def __init__(self, added : list[str], removed : list[str], changed : list[str]) -> None:
+		self.added = added
+		self.removed = removed
+		self.changed = changed
+	def IsEmpty(self) -> bool:
+		return not (self.added or self.removed or self.changed)
+	def __str__(self) -> str:
+		res = [f"+[{s}]" for s in self.added]
+		res += [f"-[{s}]" for s in self.removed]
+		res += [f"*[{s}]" for s in self.changed]
+		return ' '.join(res)
+
+
+class BackupStore:
+	"""
+	Stores configuration files once, evicting the least recently used ones beyond the size and age limits.
+	"""
+	# Shared by all stores, since fleet workers may use the same folder
+	lock = threading.RLock()
+
+	def __init__(self, folder : str, max_bytes = MAX_BYTES, max_age = MAX_AGE) -> None:
+		self.folder = folder
+		self.max_bytes = max_bytes
+		self.max_age = max_age
+		self.index_file = os.path.join(folder, 'index.json')
+		self.entries : list[BackupEntry] = []
+		# Per blob: size, last use and section CRCs
+		self.blobs : dict[str, dict] = {}
+		self._load_()
+
+	def _load_(self) -> None:
+		if os.path.isfile(self.index_file):
+			with open(self.index_file, 'rt', encoding='utf-8') as fr:
+				data = json.load(fr)
+			self.entries = [BackupEntry.FromDict(d) for d in data.get('entries', [])]
+			self.blobs = data.get('blobs', {})
+
+	def _save_(self) -> None:
+		if not os.path.isdir(self.folder):
+			os.makedirs(self.folder)
+		# Replaced atomically, so an interrupted run keeps the previous index
+		tmp = self.index_file + '.tmp'
+		with open(tmp, 'wt', encoding='utf-8') as fw:
+			json.dump({'entries': [e.ToDict() for e in self.entries], 'blobs': self.blobs}, fw, indent='\t')
+		os.replace(tmp, self.index_file)
+
+	def BlobPath(self, sha256 : str) -> str:
+		return os.path.join(self.folder, 'blobs', sha256[:2], sha256 + '.cfg')
+
+	def Put(self, fname : str, printer : str, name : str, sections : list[tuple[str, int]] | None = None, now : float | None = None) -> BackupEntry:
+		" Stores a backup of the file; content already stored is not copied again "
+		if now is None:
+			now = time.time()
+		sha256 = FileSha256(fname)
+		with self.lock:
+			# Another store may have changed the index
+			self._load_()
+			blob = self.BlobPath(sha256)
+			if not os.path.isfile(blob):
+				os.makedirs(os.path.dirname(blob), exist_ok=True)
+				shutil.copyfile(fname, blob)
+				Debug(f"Backup stored as '{blob}'")
+			info = self.blobs.setdefault(sha256, {'size': os.path.getsize(blob), 'sections': []})
+			info['used'] = now
+			if sections is not None:
+				info['sections'] = [[label, crc] for label, crc in sections]
+			entry = BackupEntry(printer, now, sha256, name)
+			self.entries.append(entry)
+			self.Prune(now)
+			self._save_()
+		return entry
+
+	def Get(self, entry : BackupEntry) -> str:
+		" Returns the file of a backup, marking it as recently used "
+		with self.lock:
+			self._load_()
+			if entry.sha256 in self.blobs:
+				self.blobs[entry.sha256]['used'] = time.time()
+				self._save_()
+		return self.BlobPath(entry.sha256)
+
+	def History(self, printer : str) -> list[BackupEntry]:
+		" Backups of a printer, oldest first "
+		return sorted([e for e in self.entries if e.printer == printer], key=lambda e : e.timestamp)
+
+	def Previous(self, entry : BackupEntry) -> BackupEntry | None:
+		" The backup of the same printer taken before this one "
+		res = None
+		for e in self.History(entry.printer):
+			if e.timestamp >= entry.timestamp:
+				break
+			res = e
+		return res
+
+	def Diff(self, old : BackupEntry, new : BackupEntry) -> SectionDiff | None:
+		" Compares the sections of two backups; returns None if section information is missing "
+		a = self.blobs.get(old.sha256, {}).get('sections')
+		b = self.blobs.get(new.sha256, {}).get('sections')
+		if not a or not b:
+			return None
+		a = {label : crc for label, crc in a}
+		b = {label : crc for label, crc in b}
+		return SectionDiff(
+			[s for s in b if s not in a],
+			[s for s in a if s not in b],
+			[s for s in b if (s in a) and (a[s] != b[s])])
+
+	def _evict_(self, sha256 : str) -> None:
+		self.entries = [e for e in self.entries if e.sha256 != sha256]
+		info = self.blobs.pop(sha256, None)
+		blob = self.BlobPath(sha256)
+		if os.path.isfile(blob):
+			os.unlink(blob)
+		Debug(f"Backup '{blob}' evicted ({info and info['size']} bytes)")
+
+	def Prune(self, now : float | None = None) -> int:
+		" Evicts old backups and the least recently used ones above the size limit; the latest of each printer is kept "
+		if now is None:
+			now = time.time()
+		with self.lock:
+			keep = set([self.History(p)[-1].sha256 for p in set([e.printer for e in self.entries])])
+			cnt = 0
+			for sha256, info in sorted(self.blobs.items(), key=lambda i : i[1]['used']):
+				if sha256 in keep:
+					continue
+				if (now - info['used'] > self.max_age) or (self.Size() > self.max_bytes):
+					self._evict_(sha256)
+					cnt += 1
+			return cnt
+
+	def Size(self) -> int:
+		" Total size of the stored files "
+		return sum([info['size'] for info in self.blobs.values()])
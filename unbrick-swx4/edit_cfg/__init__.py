@@ -3,8 +3,8 @@
 #
 # Spellchecker:	words MULT libtools
 
-from .libtools import EncodeB64, DecodeB64, CrcKey
+from .libtools import EncodeB64, DecodeB64, RecordCodec, CrcKey, CacheStats, CRC_CACHE_STATS
 from .line import *
-from .contents import FileBuffer, Contents
+from .contents import FileBuffer, Contents, ContentsSnapshot
 from .commands import Commands, SectionInfo, SectionInfoB64, KeyInfo, KeyInfoB64, MultiLineData
-
+from .diff import DiffContents, ContentsDiff, SectionChange, KeyChange
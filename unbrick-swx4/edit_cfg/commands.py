@@ -3,11 +3,12 @@
 #
 # Spellchecker: words fname libtools
 
+from contextlib import AbstractContextManager
 from functools import total_ordering
 
 from .contents import *
 from .line import *
-from .libtools import EncodeB64, DecodeB64, StringCRC, CrcKey
+from .libtools import RecordCodec, CrcKey
 
 
 @total_ordering
@@ -43,19 +44,19 @@ class SectionInfo(object):
 			and (self.active == o.active and self.is_head < o.is_head) \
 			and (self.is_head == o.is_head and self.crc < o.crc)
 class SectionInfoB64(str):
+	# Records: line number, active, head flag, CRC and label
+	CODEC = RecordCodec(b'SEC1', 'IBBI', 1)
 	def __new__(cls, value : str|list[SectionInfo]):
 		if not isinstance(value, str):
-			value = EncodeB64(repr(value))
+			value = cls.CODEC.Encode([(s.line_no, s.active, s.is_head, s.crc, s.label) for s in value])
 		return super().__new__(cls, value)
 	def __init__(self, value : str|list[SectionInfo]):
 		pass
 	def __repr__(self):
 		return f"SectionInfoB64({super().__repr__()})"
 	def Extract(self) -> list[SectionInfo]:
-		data = eval(DecodeB64(self))
-		assert isinstance(data, list), "Invalid use of this class. B64 is valid but cannot be reinterpreted."
-		assert len(data) == 0 or isinstance(data[0], SectionInfo),  "Invalid use of this class. B64 is valid but cannot be reinterpreted."
-		return data
+		return [SectionInfo(label, line_no, active != 0, is_head != 0, CrcKey(crc)) \
+			for line_no, active, is_head, crc, label in self.CODEC.Decode(self)]
 
 
 @total_ordering
@@ -92,19 +93,19 @@ class KeyInfo(object):
 			and (self.active == o.active and self.is_multiline < o.is_multiline) \
 			and (self.is_multiline == o.is_multiline and self.crc < o.crc)
 class KeyInfoB64(str):
+	# Records: line number, active, multi-line flag, CRC, section and key
+	CODEC = RecordCodec(b'KEY1', 'IBBI', 2)
 	def __new__(cls, value : str|list[KeyInfo]):
 		if not isinstance(value, str):
-			value = EncodeB64(repr(value))
+			value = cls.CODEC.Encode([(k.line_no, k.active, k.is_multiline, k.crc, k.section, k.key) for k in value])
 		return super().__new__(cls, value)
 	def __init__(self, value : str|list[KeyInfo]):
 		pass
 	def __repr__(self):
 		return f"KeyInfoB64({super().__repr__()})"
 	def Extract(self) -> list[KeyInfo]:
-		data = eval(DecodeB64(self))
-		assert isinstance(data, list), "Invalid use of this class. B64 is valid but cannot be reinterpreted."
-		assert len(data) == 0 or isinstance(data[0], KeyInfo),  "Invalid use of this class. B64 is valid but cannot be reinterpreted."
-		return data
+		return [KeyInfo(section, key, line_no, active != 0, is_multiline != 0, CrcKey(crc)) \
+			for line_no, active, is_multiline, crc, section, key in self.CODEC.Decode(self)]
 
 
 @total_ordering
@@ -138,19 +139,27 @@ class Commands(object):
 		self.fname = fname
 		self.contents = Contents()
 		self.contents.Load(fname)
+		# State of the file when it was loaded
+		self.original = self.contents.Snapshot()
 
 	def Save(self):
 		self.contents.file_buffer.Save(self.fname)
 
-	def ListSections(self, qry : str = '*') -> list[SectionInfo]:
+	def Batch(self) -> AbstractContextManager[Contents]:
+		" Applies the edits of a `with` block as a single transaction, which is undone if the block raises. "
+		" Sections are sorted just once, at the end of the block. "
+		return self.contents.Transaction()
+
+	def ListSections(self, qry : str = '*', with_crc : bool = True) -> list[SectionInfo]:
+		" Lists sections matching the query; pass `with_crc = False` when only labels are used "
 		res = []
 		for s in self.contents.file_buffer.MatchSection(qry):
 			is_head = False
 			crc = CrcKey(0)
 			if isinstance(s.buffer, SectionBuffer):
 				is_head = (s.buffer.header is s)
-				if is_head:
-					crc = s.buffer.GetLineEssence().GetCRC(0)
+				if is_head and with_crc:
+					crc = s.buffer.GetCRC()
 			res.append(SectionInfo(s.section_name, s.line_no, not s.inactive, is_head, crc))
 		return res
 	def ListSectionsB64(self, qry : str) -> SectionInfoB64:
@@ -159,7 +168,7 @@ class Commands(object):
 	def ListSection(self, section : str) -> SectionInfo | None:
 		buffer = self.contents.FindSection(section)
 		if buffer and buffer.header:
-			crc = buffer.GetLineEssence().GetCRC(0)
+			crc = buffer.GetCRC()
 			return SectionInfo(buffer.header.section_name, buffer.header.line_no, not buffer.header.inactive, True, crc)
 
 	def ReadSec(self, section : str) -> LinesB64|None:
@@ -169,18 +178,13 @@ class Commands(object):
 
 	def RenSec(self, old_name : str, new_name : str) -> int|None:
 		" Renames a section. "
-		buffer = self.contents.FindSection(old_name)
-		if buffer:
-			return buffer.RenSection(new_name)
+		return self.contents.RenameSection(old_name, new_name)
 
 	def DelSec(self, section : str) -> int|None:
 		" Renames a section. "
 		buffer = self.contents.FindSection(section)
 		if buffer:
-			ml = buffer.lines[:]	# shallow copy
-			pos = self.contents.file_buffer.RemoveLineList(ml)
-			self.contents.sections.remove(buffer)
-			return pos
+			return self.contents.RemoveSection(buffer)
 	
 	def AddSec(self, where : str|int, b64 : LinesB64|Lines):
 		" Adds a section to the specified position. Specify one of the following: "
@@ -205,8 +209,11 @@ class Commands(object):
 		else:
 			assert False, "Unexpected content"
 
-	def OvrSec(self, old_sec : str, b64 : LinesB64) -> bool:
-		ml = b64.Extract()
+	def OvrSec(self, old_sec : str, b64 : LinesB64|Lines) -> bool:
+		if isinstance(b64, LinesB64):
+			ml = b64.Extract()
+		else:
+			ml = b64
 		return self.contents.OverwriteSection(old_sec, ml)
 
 
@@ -217,14 +224,10 @@ class Commands(object):
 		if buffer:
 			l = buffer.FindAnyKey(key)
 			if isinstance(l, ValueLine):
-				crc = StringCRC(l.uncommented, 0)
+				crc = l.GetCRC()
 				return KeyInfo(section, l.key, l.line_no, not l.inactive, False, crc)
 			elif isinstance(l, MultiLineStartLine):
-				ml = buffer.GetMultiLine(l)
-				if ml:
-					crc = ml.GetLinesEssence().GetCRC(0)
-				else:
-					crc = CrcKey(0)
+				crc = buffer.GetMultiLineCRC(l)
 				return KeyInfo(section, l.key, l.line_no, not l.inactive, False, crc)
 
 	def ListKeys(self, section : str) -> list[KeyInfo]:
@@ -236,19 +239,17 @@ class Commands(object):
 			for l in buffer.lines:
 				crc = CrcKey(0)
 				if isinstance(l, ValueLine):
-					crc = StringCRC(l.uncommented, 0)
+					crc = l.GetCRC()
 					res.append(KeyInfo(section, l.key, l.line_no, not l.inactive, False, crc))
 				elif isinstance(l, MultiLineStartLine):
-					ml = buffer.GetMultiLine(l)
-					if ml:
-						crc = ml.GetLinesEssence().GetCRC(0)
+					crc = buffer.GetMultiLineCRC(l)
 					res.append(KeyInfo(section, l.key, l.line_no, not l.inactive, True, crc))
 		return res
 	def ListKeysB64(self, section : str) -> KeyInfoB64:
 		" Filters the list of section returning meta-data for each Section that matches the search criteria."
 		" This is similar to the `dir` command on the prompt, accepting wildcards as filters. "
 		" The result is an encoded base64 string, ideal for transport on normal strings. Decode with: "
-		"    eval(DecodeB64(data))"
+		"    data.Extract()"
 		return KeyInfoB64(self.ListKeys(section))
 
 	def GetKey(self, section : str, key : str) -> str|MultiLineData|None:
@@ -262,7 +263,7 @@ class Commands(object):
 				if not l.inactive:
 					ml = buffer.GetMultiLine(l)
 					if ml:
-						return MultiLineData(ml)
+						return MultiLineData(ml, buffer.GetMultiLineCRC(l))
 
 	def EditKey(self, section : str, key : str, value : str) -> bool|None:
 		" Allows to edit simple value. If the key does not exists a new is appended. "
@@ -281,19 +282,28 @@ class Commands(object):
 				buffer.AppendValue(key, value)
 				return True
 
-	def EditKeyML(self, section : str, key : str, value : LinesB64) -> bool|None:
+	def EditKeyML(self, section : str, key : str, value : LinesB64|Lines, crc : CrcKey|None = None) -> bool|None:
 		" Allows to replace the entire multi-line key. If the key does not exists a new is appended. "
 		" Note that Multi-line values replaces the entire data block, including heading comments and "
 		" the key itself. THis means that wrong data excludes any preexisting line containing a key. "
+		" When `crc` is given, a multi-line value having this CRC is already up to date and is kept. "
 		buffer = self.contents.FindSection(section)
-		nl = value.Extract()
-		assert len(nl) > 0, "We need some contents to be replaced. Consider one of the delete methods."
-
 		if buffer:
 			l = buffer.FindAnyKey(key)
 			if isinstance(l, ValueLine):
 				return False
 			elif isinstance(l, MultiLineStartLine):
+				if (crc is not None) and (buffer.GetMultiLineCRC(l) == crc):
+					return False
+		# Decoded only when the value is really written
+		if isinstance(value, LinesB64):
+			nl = value.Extract()
+		else:
+			nl = value
+		assert len(nl) > 0, "We need some contents to be replaced. Consider one of the delete methods."
+
+		if buffer:
+			if isinstance(l, MultiLineStartLine):
 				ml = buffer.GetMultiLine(l)
 				if ml is not None:
 					pos = self.contents.file_buffer.RemoveLineList(ml)
@@ -4,8 +4,11 @@
 # Spellchecker: words MULT klipper
 
 import fnmatch
-from typing import final
+import difflib
+from contextlib import contextmanager
+from typing import final, Iterable, Iterator
 
+from .libtools import CrcKey, CRC_CACHE_STATS
 from .line import Line, Lines, AnyBuffer, LineFactory, EmptyLine, IncludeLine, CommentLine, SectionLine, ValueLine, \
 	MultiLineStartLine, ContinuationEmptyLine, ContinuationLine, ContinuationCommentLine, PersistenceLine
 
@@ -15,6 +18,8 @@ class FileBuffer(AnyBuffer):
 	" An instance of this class holds all files of a files "
 	def __init__(self, data : list[str]|None = None) -> None:
 		super().__init__()
+		# Index of the first line having an outdated line number, after the buffer was edited
+		self.renumber_from : int|None = None
 		if data is not None:
 			self.EnterList(data)
 	def GetTitle(self) -> str:
@@ -25,70 +30,94 @@ class FileBuffer(AnyBuffer):
 	def Unlink(self, l : Line) -> None:
 		assert False, "This is the root container and is not tracked"
 		pass
-	def EnterList(self, data : list[str]) -> None:
+	def EnterLines(self, data : Iterable[str]) -> Iterator[Line]:
+		" Parses and appends lines, yielding each new object as soon as it is stored "
 		factory = LineFactory()
 		prev_line : Line|None = None
+		lines = self.lines
 		for line in data:
 			line = line.rstrip()
 			obj = factory.New(line, prev_line)
 			if obj is not None:
-				self.lines.append(obj)
-				if not isinstance(obj, EmptyLine):
+				obj.file_buffer = self
+				lines.append(obj)
+				if type(obj) is not EmptyLine:
 					prev_line = obj
+				yield obj
+	def EnterList(self, data : Iterable[str]) -> None:
+		for _ in self.EnterLines(data):
+			pass
 	def Load(self, fname : str) -> None:
 		" Loads a Klipper-compatible file "
 		with open(fname, 'rt', encoding="utf-8") as fr:
-			self.EnterList(fr.readlines())
+			self.EnterList(fr)
 	def Save(self, fname : str) -> None:
 		" Store all contents to a Klipper-compatible file "
+		if self.renumber_from is not None:
+			self.UpdateLineNumbers()
 		with open(fname, 'wt', encoding="utf-8") as fh:
 			for line in self.lines:
 				print(line.raw_content, file=fh)
 	def UpdateLineNumbers(self):
-		" Should be called to re-sequence the line numbers after contents edition "
-		for i, l in enumerate(self.lines):
-			l.line_no = i+1
-	def _remove_line_(self, idx : int) -> None:
-		" Unregister a line and removes one line of the file buffer "
-		l = self.lines[idx]
+		" Re-sequences the line numbers after contents edition. Reading `Line.line_no` calls this when required "
+		start = self.renumber_from or 0
+		self.renumber_from = None
+		for i, l in enumerate(self.lines[start:], start+1):
+			l._line_no = i
+	def _renumber_from_(self, idx : int) -> None:
+		" Marks line numbers starting at the given index as outdated "
+		if (self.renumber_from is None) or (idx < self.renumber_from):
+			self.renumber_from = idx
+	def _release_(self, l : Line) -> None:
+		" Unregister a line that is leaving the file buffer "
 		if l.buffer is not None:
 			l.buffer.Unlink(l)
-		self.lines.remove(l)
+		l.file_buffer = None
+	def _remove_line_(self, idx : int) -> None:
+		" Unregister a line and removes one line of the file buffer "
+		self._release_(self.lines[idx])
+		del self.lines[idx]
+		self._renumber_from_(idx)
 	def RemoveLine(self, idx : int):
 		self._remove_line_(idx)
-		self.UpdateLineNumbers()
 	def RemoveLines(self, i_from : int, i_to : int):
 		" Removes the range of lines indexed between i_from and i_to, inclusive "
-		while i_from <= i_to:
-			self._remove_line_(i_from)
-			i_from += 1
-		self.UpdateLineNumbers()
+		for l in self.lines[i_from:i_to+1]:
+			self._release_(l)
+		del self.lines[i_from:i_to+1]
+		self._renumber_from_(i_from)
 	def RemoveLineList(self, lines : list[Line]) -> int:
-		" Removes all lines on a given line list "
-		i = None
-		sorted_lines = sorted(lines, key=lambda line: line.line_no, reverse=True)
-		for l in sorted_lines:
-			idx = l.line_no - 1
-			if i is None:
-				i = idx
-			elif i > idx:
-				i = idx
-			self._remove_line_(idx)
-		self.UpdateLineNumbers()
-		return i is not None and i or 0
-	def _insert_line_(self, idx : int, l : Line, reg : AnyBuffer) -> None:
-		l.line_no = idx+1
-		self.lines.insert(idx, l)
-		reg.Link(l)
+		" Removes all lines on a given line list, returning the lowest index that was removed "
+		if not lines:
+			return 0
+		lines = lines[:]	# caller may pass the list of the buffer being unlinked
+		first = min(l.line_no for l in lines) - 1
+		last = max(l.line_no for l in lines) - 1
+		doomed = set(id(l) for l in lines)
+		for l in lines:
+			self._release_(l)
+		if last - first + 1 == len(doomed):
+			# Contiguous block: a single splice
+			del self.lines[first:last+1]
+		else:
+			self.lines[first:last+1] = [l for l in self.lines[first:last+1] if id(l) not in doomed]
+		self._renumber_from_(first)
+		return first
+	def ReplaceLine(self, idx : int, l : Line) -> None:
+		" Replaces an unregistered line by another, keeping the same position "
+		assert self.lines[idx].buffer is None, "Cannot replace a line that is owned by a buffer"
+		self.lines[idx].file_buffer = None
+		l.file_buffer = self
+		self.lines[idx] = l
 	def InsertLine(self, idx : int, l : Line, reg : AnyBuffer) -> None:
-		self._insert_line_(idx, l, reg)
-		self.UpdateLineNumbers()
-		reg.Sort()
+		self.InsertLineList(idx, [l], reg)
 	def InsertLineList(self, idx : int, lines : list[Line], reg : AnyBuffer) -> None:
+		" Inserts a block of lines at once, registering them on the given buffer "
+		self.lines[idx:idx] = lines
+		self._renumber_from_(idx)
 		for l in lines:
-			self._insert_line_(idx, l, reg)
-			idx += 1
-		self.UpdateLineNumbers()
+			l.file_buffer = self
+			reg.Link(l)
 		reg.Sort()
 	def GetInsertIdxAtTop(self) -> int:
 		pos = None
@@ -119,6 +148,8 @@ class FileBuffer(AnyBuffer):
 		Scans all lines to locate SectionLine instances that matches the search pattern. Wildcard matches are used here. 
 		Note that this method is able to locate sections that are commented out.
 		"""
+		if qry == '*':
+			return [l for l in self.lines if isinstance(l, SectionLine)]
 		res = []
 		for l in self.lines:
 			if isinstance(l, SectionLine):
@@ -127,6 +158,64 @@ class FileBuffer(AnyBuffer):
 		return res
 
 
+@final
+class KeyIndex_(object):
+	" Lookup tables for the keys of a section. Built on demand by `SectionBuffer` "
+	def __init__(self, sec : SectionBuffer) -> None:
+		# Position of each line inside the section
+		self.pos : dict[Line, int] = {}
+		# key -> [first active line, first inactive line]
+		self.any : dict[str, list] = {}
+		self.values : dict[str, list] = {}
+		self.multi_lines : dict[str, list] = {}
+		# First value line of a key, regardless of state
+		self.first_value : dict[str, ValueLine] = {}
+		# Line range of a multi-line value, including heading comments: (top, head, end)
+		self.ranges : dict[MultiLineStartLine, tuple[int, int, int]] = {}
+		# CRC of multi-line values, computed on demand
+		self.crc : dict[MultiLineStartLine, CrcKey] = {}
+		lines = sec.lines
+		n = len(lines)
+		i = 0
+		while i < n:
+			l = lines[i]
+			self.pos[l] = i
+			if isinstance(l, ValueLine):
+				self._add_(self.any, l)
+				self._add_(self.values, l)
+				self.first_value.setdefault(l.key, l)
+			elif isinstance(l, MultiLineStartLine):
+				self._add_(self.any, l)
+				self._add_(self.multi_lines, l)
+				top = sec.GetPrologue(i)
+				head = i
+				i += 1
+				while i < n:
+					l2 = lines[i]
+					if not isinstance(l2, (ContinuationLine, ContinuationCommentLine, ContinuationEmptyLine)):
+						break
+					self.pos[l2] = i
+					i += 1
+				self.ranges[l] = (top, head, i)
+				continue
+			i += 1
+	@staticmethod
+	def _add_(table : dict[str, list], l : ValueLine|MultiLineStartLine) -> None:
+		entry = table.get(l.key)
+		if entry is None:
+			entry = table[l.key] = [None, None]
+		slot = l.inactive and 1 or 0
+		if entry[slot] is None:
+			entry[slot] = l
+	@staticmethod
+	def Get(table : dict[str, list], key : str):
+		" An active entry has priority over inactive ones "
+		entry = table.get(key)
+		if entry is None:
+			return None
+		return entry[0] or entry[1]
+
+
 @final
 class SectionBuffer(AnyBuffer):
 	" This holds all lines belonging to a section"
@@ -134,9 +223,13 @@ class SectionBuffer(AnyBuffer):
 		super().__init__()
 		self.header : SectionLine | None = None
 		self.file_buffer = file_buffer
+		self._key_index_ : KeyIndex_ | None = None
+		self._crc_ : CrcKey | None = None
 	def Link(self, l : Line) -> None:
 		assert isinstance(l, (EmptyLine, CommentLine, SectionLine, ValueLine, MultiLineStartLine, ContinuationEmptyLine, ContinuationLine, ContinuationCommentLine))
 		super().Link(l)
+		self._key_index_ = None
+		self._crc_ = None
 		# Got a section header line
 		if isinstance(l, SectionLine):
 			# Never assigned? Give up if tracking an inactive section...
@@ -144,8 +237,31 @@ class SectionBuffer(AnyBuffer):
 				self.header = l
 	def Unlink(self, l : Line) -> None:
 		super().Unlink(l)
+		self._key_index_ = None
+		self._crc_ = None
 		if l is self.header:
 			self.header = None
+	def Sort(self):
+		super().Sort()
+		self._key_index_ = None
+		self._crc_ = None
+	def LineChanged(self, l : Line) -> None:
+		# Activation and key renames changes the lookup priorities
+		self._key_index_ = None
+		self._crc_ = None
+	def GetCRC(self) -> CrcKey:
+		" CRC of the section essence; cached until a line is linked, unlinked or modified "
+		if self._crc_ is None:
+			CRC_CACHE_STATS.misses += 1
+			self._crc_ = self.GetLineEssence().GetCRC(0)
+		else:
+			CRC_CACHE_STATS.hits += 1
+		return self._crc_
+	def GetKeyIndex(self) -> KeyIndex_:
+		" Returns the key lookup tables, building them if lines have changed "
+		if self._key_index_ is None:
+			self._key_index_ = KeyIndex_(self)
+		return self._key_index_
 	def GetTitle(self) -> str:
 		if self.header is None:
 			return "Unknown section"
@@ -153,52 +269,30 @@ class SectionBuffer(AnyBuffer):
 			return "S: " + self.header.section_name
 	def FindAnyKey(self, key : str) -> ValueLine|MultiLineStartLine|None:
 		" This method is usually good to locate a key and see if it is multiline. "
-		inactive = None
-		for l in self.lines:
-			if isinstance(l, ValueLine):
-				if l.key == key:
-					if l.inactive:
-						if inactive is None:
-							inactive = l
-					else:
-						return l
-			elif isinstance(l, MultiLineStartLine):
-				if l.key == key:
-					if l.inactive:
-						if inactive is None:
-							inactive = l
-					else:
-						return l
-		return inactive
+		return KeyIndex_.Get(self.GetKeyIndex().any, key)
 	def FindValue(self, key : str) -> ValueLine | None:
 		" Find key/value value, spot on. An active entry has priority over inactive ones. "
-		inactive = None
-		for l in self.lines:
-			if isinstance(l, ValueLine):
-				if l.key == key:
-					if l.inactive:
-						if inactive is None:
-							inactive = l
-					else:
-						return l
-		# fallback to inactive line option
-		return inactive
+		return KeyIndex_.Get(self.GetKeyIndex().values, key)
 	def FindValueRange(self, key : str) -> Lines:
 		" Find key/value value, including prologue comments and blank lines "
+		index = self.GetKeyIndex()
+		l = index.first_value.get(key)
+		if l is None:
+			return Lines()
+		i = index.pos[l]
+		# Blank lines and comments preceding the value are part of it
 		top = None
-		for i, l in enumerate(self.lines):
-			if (top is None) and isinstance(l, (EmptyLine, CommentLine) ):
-				top = i
-			if isinstance(l, ValueLine):
-				if l.key == key:
-					if top is None:
-						return self.lines[i:i+1]
-					else:
-						return self.lines[top:i+1]
-				top = None
-			elif isinstance(l, (SectionLine, MultiLineStartLine, ContinuationLine, ContinuationCommentLine)):
-				top = None
-		return Lines()
+		j = i - 1
+		while j >= 0:
+			l = self.lines[j]
+			if isinstance(l, (EmptyLine, CommentLine)):
+				top = j
+			elif not isinstance(l, ContinuationEmptyLine):
+				break
+			j -= 1
+		if top is None:
+			return self.lines[i:i+1]
+		return self.lines[top:i+1]
 	def UpdateValue(self, key : str, value) -> bool:
 		" Update simple values "
 		v = self.FindValue(key)
@@ -220,40 +314,45 @@ class SectionBuffer(AnyBuffer):
 		self.file_buffer.InsertLineList(loc.idx_n, lines, self)
 	def FindMultiLineKey(self, key : str) -> MultiLineStartLine | None:
 		" Find key value of a multiline entry, spot on. An active entry has priority over inactive ones. "
-		inactive = None
-		for l in self.lines:
-			if isinstance(l, MultiLineStartLine):
-				if l.key == key:
-					if l.inactive:
-						if inactive is None:
-							inactive = l
-					else:
-						return l
-		# fallback to inactive line option
-		return inactive
-	def FindMultiLine(self, key : str|MultiLineStartLine) -> tuple[MultiLineStartLine, Lines] | None:
-		" Returns all lines of a multiline value including heading comments "
+		return KeyIndex_.Get(self.GetKeyIndex().multi_lines, key)
+	def _get_ml_range_(self, key : str|MultiLineStartLine) -> tuple[MultiLineStartLine, int, int, int] | None:
+		" Locates the line range of a multi-line value "
 		if isinstance(key, str):
 			head = self.FindMultiLineKey(key)
 		else:
 			head = key
 		if head is not None:
-			top = self.GetPrologue(self.lines.index(head))
-			i = top + 1
-			while i < len(self.lines):
-				if not isinstance(self.lines[i], (ContinuationLine, ContinuationCommentLine, ContinuationEmptyLine)):
-					break
-				i += 1
-			return (head, self.lines[top:i])
+			rng = self.GetKeyIndex().ranges.get(head)
+			if rng is None:
+				raise ValueError(f"{repr(head)} is not in list")
+			top, pos, end = rng
+			return (head, top, pos, end)
+		return None
+	def FindMultiLine(self, key : str|MultiLineStartLine) -> tuple[MultiLineStartLine, Lines] | None:
+		" Returns all lines of a multiline value including heading comments "
+		rng = self._get_ml_range_(key)
+		if rng is not None:
+			head, top, pos, end = rng
+			return (head, self.lines[top:end])
 		return None
 	def GetMultiLine(self, key : str|MultiLineStartLine, skip_head = True) -> Lines|None:
 		" Similar to FindMultiLine(), but with different result style"
-		ml = self.FindMultiLine(key)
-		if ml is not None:
-			head, lines = ml
-			i = skip_head and lines.index(head) or 0
-			assert i >= 0, "FindMultiLine() implementation fault"
-			return lines[i:]
+		rng = self._get_ml_range_(key)
+		if rng is not None:
+			head, top, pos, end = rng
+			return self.lines[(skip_head and pos or top):end]
+	def GetMultiLineCRC(self, l : MultiLineStartLine) -> CrcKey:
+		" CRC of the contents of a multi-line value, without the key; zero if empty "
+		cache = self.GetKeyIndex().crc
+		crc = cache.get(l)
+		if crc is None:
+			CRC_CACHE_STATS.misses += 1
+			ml = self.GetMultiLine(l)
+			crc = ml.GetLinesEssence().GetCRC(0) if ml else CrcKey(0)
+			cache[l] = crc
+		else:
+			CRC_CACHE_STATS.hits += 1
+		return crc
 	def DeleteMultiLine(self, key : str|MultiLineStartLine) -> int|None:
 		" Removes the entire contents of a multi-line value. This includes head comments and keys "
 		ml = self.FindMultiLine(key)
@@ -288,10 +387,10 @@ class SectionBuffer(AnyBuffer):
 							obj2 = buffer.lines[top_ml]
 							if isinstance(obj2, CommentLine):
 								nl = ContinuationCommentLine(obj2.line_no, obj2.raw_content, obj2.uncommented)
-								buffer.lines[top_ml] = nl
+								buffer.ReplaceLine(top_ml, nl)
 							elif isinstance(obj2, EmptyLine):
 								nl = ContinuationEmptyLine(obj2.line_no, obj2.raw_content, obj2.uncommented)
-								buffer.lines[top_ml] = nl
+								buffer.ReplaceLine(top_ml, nl)
 							top_ml += 1
 						break
 				i = i2 + 1
@@ -351,23 +450,116 @@ class PersistenceBuffer(AnyBuffer):
 		return "Persistence"
 
 
+@final
+class StreamLoader_(object):
+	" Groups lines into buffers as they are parsed, following the same rules of `Contents._collect0_` "
+	def __init__(self, contents : Contents) -> None:
+		self.contents = contents
+		self.lines = contents.file_buffer.lines
+		# First line not yet owned by a buffer
+		self.start = 0
+		# Header of the section being collected
+		self.section : SectionLine | None = None
+		# Lines of the section up to here are certain; trailing comments may belong to the next section
+		self.confirmed = 0
+		# Multi-line value being collected
+		self.ml_top : int | None = None
+		self.persistence = False
+	def Feed(self, obj : Line) -> None:
+		" Classifies the line that was just appended to the file buffer "
+		i = len(self.lines) - 1
+		if self.persistence:
+			if not isinstance(obj, PersistenceLine):
+				raise ValueError(f"Line {i + 1}: Unexpected line type found in Persistence block: '{repr(obj)}'")
+			return
+		if self.section is not None:
+			if self.ml_top is not None:
+				if isinstance(obj, (CommentLine, EmptyLine)):
+					return
+				if isinstance(obj, (ContinuationLine, ContinuationCommentLine, ContinuationEmptyLine)):
+					self._fix_continuation_(i)
+					self.confirmed = i + 1
+					return
+				# End of the multi-line value; pending comments falls back to the section
+				self.ml_top = None
+			if isinstance(obj, (CommentLine, EmptyLine)):
+				return
+			elif isinstance(obj, (ValueLine, ContinuationCommentLine)):
+				self.confirmed = i + 1
+				return
+			elif isinstance(obj, MultiLineStartLine):
+				self.confirmed = i + 1
+				self.ml_top = i
+				return
+			self._close_section_()
+		if isinstance(obj, (EmptyLine, CommentLine)):
+			pass
+		elif isinstance(obj, IncludeLine):
+			self.contents._store_include_(self.lines[self.start:i + 1])
+			self.start = i + 1
+		elif isinstance(obj, SectionLine):
+			self.section = obj
+			self.confirmed = i + 1
+		elif isinstance(obj, PersistenceLine):
+			self.persistence = True
+		else:
+			raise ValueError(f"Line {i + 1}: Unexpected line type found in file: '{repr(obj)}'")
+	def _fix_continuation_(self, i : int) -> None:
+		" Comments and blank lines inside a multi-line value are continuation lines "
+		fb = self.contents.file_buffer
+		for j in range(self.confirmed, i):
+			obj = self.lines[j]
+			if isinstance(obj, CommentLine):
+				fb.ReplaceLine(j, ContinuationCommentLine(obj.line_no, obj.raw_content, obj.uncommented))
+			elif isinstance(obj, EmptyLine):
+				fb.ReplaceLine(j, ContinuationEmptyLine(obj.line_no, obj.raw_content, obj.uncommented))
+	def _close_section_(self) -> None:
+		assert self.section is not None
+		self.contents._store_section_(self.section, self.lines[self.start:self.confirmed])
+		self.start = self.confirmed
+		self.section = None
+		self.ml_top = None
+	def Finish(self) -> None:
+		" Closes the last block, after the last line was fed "
+		if self.section is not None:
+			self._close_section_()
+		elif self.persistence:
+			self.contents.persistence.LinkList(self.lines[self.start:])
+
+
 @final
 class Contents(object):
 	def __init__(self, data : list[str]|None  = None) -> None:
 		self.file_buffer = FileBuffer()
 		self.includes : list[IncludeBuffer] = []
 		self.sections : list[SectionBuffer] = []
+		# Maps a section name to its buffer, so lookups don't need to scan `self.sections`
+		self.section_index : dict[str, SectionBuffer] = {}
 		self.persistence = PersistenceBuffer()
+		# Nesting level of `Transaction()` and sorting of `self.sections` postponed to its end
+		self.transaction_depth = 0
+		self.sort_pending = False
 		if data is not None:
 			self.EnterList(data)
 
-	def _collect_include_(self, start : int, i : int) -> int:
+	def _store_include_(self, lines : Lines) -> None:
 		include = IncludeBuffer()
-		i += 1
-		include.LinkList(self.file_buffer.lines[start: i])
+		include.LinkList(lines)
 		self.includes.append(include)
+
+	def _collect_include_(self, start : int, i : int) -> int:
+		i += 1
+		self._store_include_(self.file_buffer.lines[start: i])
 		return i
 	
+	def _store_section_(self, head : SectionLine, lines : Lines) -> None:
+		# Klipper allows split of sections
+		sec = self.FindSection(head.section_name) or SectionBuffer(self.file_buffer)
+		sec.LinkList(lines)
+		self.sections.append(sec)
+		if sec.header is not None:
+			self.section_index.setdefault(sec.header.section_name, sec)
+	
 	def _collect_section_(self, start : int, i : int, head : SectionLine) -> int:
 		top = i
 		i = SectionBuffer.FixContents(self.file_buffer, i + 1, len(self.file_buffer.lines))
@@ -378,10 +570,7 @@ class Contents(object):
 			if not isinstance(obj, (EmptyLine, CommentLine)):
 				i += 1
 				break
-		# Klipper allows split of sections
-		sec = self.FindSection(head.section_name) or SectionBuffer(self.file_buffer)
-		sec.LinkList(self.file_buffer.lines[start:i])
-		self.sections.append(sec)
+		self._store_section_(head, self.file_buffer.lines[start:i])
 		return i
 
 	def _collect_persistence_(self, start : int, i : int) -> int:
@@ -412,24 +601,84 @@ class Contents(object):
 				raise ValueError(f"Line {i + 1}: Unexpected line type found in file: '{repr(obj)}'")
 
 	def Load(self, fname : str) -> None:
-		" Loads a Klipper-compatible file and groups line in logical structure "
+		" Loads a Klipper-compatible file and groups line in logical structure, in a single pass "
 		assert len(self.file_buffer.lines) == 0, "Object already has contents"
-		self.file_buffer.Load(fname)
-		self._collect0_()
+		with open(fname, 'rt', encoding="utf-8") as fr:
+			self._stream_(fr)
+
+	def _stream_(self, data : Iterable[str]) -> None:
+		loader = StreamLoader_(self)
+		for obj in self.file_buffer.EnterLines(data):
+			loader.Feed(obj)
+		loader.Finish()
 
 	def EnterList(self, data : list[str]) -> None:
+		" Enters lines and groups them in logical structure, walking the parsed list a second time "
 		self.file_buffer.EnterList(data)
 		self._collect0_()
 
-	def FindSection(self, label : str) -> SectionBuffer | None:
-		" Returns a section that matches the given label "
+	def UpdateSectionIndex(self) -> None:
+		" Should be called to rebuild the section lookup table after sections were added, removed or renamed "
+		self.section_index = {}
 		for sec in self.sections:
 			if sec.header is None:
 				loc = sec.GetSingleLocation()
-				raise RuntimeError("Section in line range {str(loc)} was not correctly parsed")
-			if sec.header.section_name == label:
-				return sec
-		return None
+				raise RuntimeError(f"Section in line range {str(loc)} was not correctly parsed")
+			# First occurrence wins, as a split section is listed once for each part
+			self.section_index.setdefault(sec.header.section_name, sec)
+
+	def _sort_sections_(self) -> None:
+		" Keeps `self.sections` in file order; inside a transaction this happens once, at its end "
+		if self.transaction_depth:
+			self.sort_pending = True
+		else:
+			self.sort_pending = False
+			self.sections.sort(key=lambda k : k.lines[0].line_no)
+
+	@contextmanager
+	def Transaction(self) -> Iterator[Contents]:
+		"""
+		Groups a sequence of edits. Sections are sorted once, when the block ends, and lines are renumbered
+		once, on the next read of a line number.
+		If an exception escapes the block, contents are restored from a copy of the text taken at its
+		start, without reading the file again. A nested transaction is part of the outer one.
+		"""
+		if self.transaction_depth:
+			self.transaction_depth += 1
+			try:
+				yield self
+			finally:
+				self.transaction_depth -= 1
+			return
+		snapshot = self.Snapshot()
+		self.transaction_depth = 1
+		try:
+			yield self
+		except BaseException:
+			self.transaction_depth = 0
+			self._restore_(snapshot)
+			raise
+		self.transaction_depth = 0
+		if self.sort_pending:
+			self._sort_sections_()
+
+	def Snapshot(self) -> ContentsSnapshot:
+		" Takes a read only copy of the current state; see `ContentsSnapshot` "
+		return ContentsSnapshot(self)
+
+	def _restore_(self, snapshot : ContentsSnapshot) -> None:
+		" Replaces all contents by the state of a snapshot "
+		fresh = snapshot.Materialize()
+		self.file_buffer = fresh.file_buffer
+		self.includes = fresh.includes
+		self.sections = fresh.sections
+		self.section_index = fresh.section_index
+		self.persistence = fresh.persistence
+		self.sort_pending = False
+
+	def FindSection(self, label : str) -> SectionBuffer | None:
+		" Returns a section that matches the given label "
+		return self.section_index.get(label)
 
 	def GetTopIdx(self) -> int:
 		" Topmost insert position to add sections "
@@ -465,7 +714,8 @@ class Contents(object):
 			buffer = SectionBuffer(self.file_buffer)
 			self.sections.append(buffer)
 		self.file_buffer.InsertLineList(idx, lines, buffer)
-		self.sections.sort(key=lambda k : k.lines[0].line_no)
+		self._sort_sections_()
+		self.UpdateSectionIndex()
 
 	def AddSectionAt(self, idx : int, lines : Lines) -> None:
 		top = self.GetTopIdx()
@@ -507,8 +757,28 @@ class Contents(object):
 		idx = self.file_buffer.RemoveLineList(buffer.lines)
 		self.file_buffer.InsertLineList(idx, lines, buffer)
 		assert buffer.header is not None, "New buffer does not contain a valid section header"
-		self.sections.sort(key=lambda k : k.lines[0].line_no)
+		self._sort_sections_()
+		self.UpdateSectionIndex()
 		return True
+
+	def RenameSection(self, old_name : str, new_name : str) -> int | None:
+		" Renames a section, returning the number of section lines that were renamed "
+		buffer = self.FindSection(old_name)
+		if buffer:
+			n = buffer.RenSection(new_name)
+			self.UpdateSectionIndex()
+			return n
+		return None
+
+	def RemoveSection(self, buffer : SectionBuffer) -> int:
+		" Removes all lines of a section, returning the 0-based index of the first line removed "
+		ml = buffer.lines[:]	# shallow copy
+		pos = self.file_buffer.RemoveLineList(ml)
+		# A split section has one entry for each part
+		while buffer in self.sections:
+			self.sections.remove(buffer)
+		self.UpdateSectionIndex()
+		return pos
 	
 	def OverWritePersistence(self, lines : Lines):
 		assert all(isinstance(item, (PersistenceLine, EmptyLine)) for item in lines), "Buffer contents does not match a persistence data"
@@ -518,3 +788,58 @@ class Contents(object):
 			idx = self.GetBottomIdx()
 		self.file_buffer.InsertLineList(idx, lines, self.persistence)
 	
+
+
+@final
+class ContentsSnapshot(object):
+	"""
+	Read only state of a `Contents`, kept as the text of its lines.
+
+	Strings are immutable and an edit replaces the text of the lines it touches, so a snapshot
+	references the very same string objects of the lines that were not edited. Snapshots of the
+	same contents share all unchanged text and each one costs a single tuple.
+	"""
+	def __init__(self, contents : Contents) -> None:
+		self.text : tuple[str, ...] = tuple([l.raw_content for l in contents.file_buffer.lines])
+		# The persistence block is always at the end of the file
+		self.persistence_at = len(self.text) - len(contents.persistence.lines)
+	def __len__(self) -> int:
+		return len(self.text)
+	def __eq__(self, o) -> bool:
+		if not isinstance(o, ContentsSnapshot):
+			return False
+		return self.text == o.text
+	def Materialize(self) -> Contents:
+		" Builds a new `Contents` object from the snapshot "
+		res = Contents()
+		res._stream_(self.text)
+		return res
+	def GetPersistence(self) -> Lines:
+		" Parses just the lines of the persistence block "
+		if self.persistence_at == len(self.text):
+			return Lines()
+		return Contents(list(self.text[self.persistence_at:])).persistence.lines
+	def ChangedLines(self, o : ContentsSnapshot) -> list[tuple[int, int, int, int]]:
+		" Line ranges that differ between this and another snapshot, as `(i1, i2, j1, j2)` slices "
+		" of `self.text` and `o.text`; shared text is compared by identity before equality "
+		a, b = self.text, o.text
+		# Unchanged head and tail are skipped quickly, as they share the same objects
+		top = 0
+		n = min(len(a), len(b))
+		while (top < n) and ((a[top] is b[top]) or (a[top] == b[top])):
+			top += 1
+		bottom = 0
+		while (bottom < n - top) and ((a[-1-bottom] is b[-1-bottom]) or (a[-1-bottom] == b[-1-bottom])):
+			bottom += 1
+		if (top == len(a)) and (top == len(b)):
+			return []
+		sm = difflib.SequenceMatcher(None, a[top:len(a)-bottom], b[top:len(b)-bottom], autojunk=False)
+		return [(i1+top, i2+top, j1+top, j2+top) for tag, i1, i2, j1, j2 in sm.get_opcodes() if tag != 'equal']
+	def UnifiedDiff(self, o : ContentsSnapshot, fname : str, label : str = '', n : int = 3) -> list[str]:
+		" Lines of an unified diff from this snapshot to another one; `label` goes where the date usually is "
+		return list(difflib.unified_diff(self.text, o.text, fname, fname, label, label, n=n, lineterm=''))
+	def Save(self, fname : str) -> None:
+		" Store the snapshot to a Klipper-compatible file "
+		with open(fname, 'wt', encoding="utf-8") as fh:
+			for line in self.text:
+				print(line, file=fh)
@@ -0,0 +1,153 @@
+#
+# -*- coding: UTF-8 -*-
+#
+# Spellchecker: words
+
+"""
+Structural comparison of two `Contents` objects.
+
+Sections are matched by name and keys by name inside each section. Only active sections and keys
+take part, as these are the ones Klipper sees. Sections having the same text are skipped first,
+which is cheap even on large files; the remaining ones are compared by the cached CRC of their
+essence, so changes on comments and formatting only are skipped without looking at their keys.
+"""
+
+from .libtools import CrcKey, StringCRC
+from .line import ValueLine, MultiLineStartLine
+from .contents import Contents, SectionBuffer
+
+
+# Kinds of change
+ADDED = '+'
+REMOVED = '-'
+CHANGED = '*'
+
+
+class KeyChange(object):
+	" A key that differs between two versions of a section "
+	def __init__(self, kind : str, key : str, old : str|None, new : str|None) -> None:
+		self.kind = kind
+		self.key = key
+		# Value of the key; for multi-line values, the lines below the key
+		self.old = old
+		self.new = new
+	def __repr__(self) -> str:
+		return f"KeyChange({repr(self.kind)}, {repr(self.key)}, {repr(self.old)}, {repr(self.new)})"
+	def __str__(self) -> str:
+		return f"{self.kind}{self.key}"
+
+
+class SectionChange(object):
+	" A section that differs between two contents, with the keys that changed "
+	def __init__(self, kind : str, section : str, keys : list[KeyChange]) -> None:
+		self.kind = kind
+		self.section = section
+		self.keys = keys
+	def __repr__(self) -> str:
+		return f"SectionChange({repr(self.kind)}, {repr(self.section)}, {repr(self.keys)})"
+	def __str__(self) -> str:
+		return f"{self.kind}[{self.section}] " + ' '.join([str(k) for k in self.keys])
+	def Find(self, key : str) -> KeyChange | None:
+		for k in self.keys:
+			if k.key == key:
+				return k
+		return None
+
+
+class ContentsDiff(object):
+	" Sections that differ between two contents, in the order of the new one; removed sections are last "
+	def __init__(self, sections : list[SectionChange]) -> None:
+		self.sections = sections
+	def IsEmpty(self) -> bool:
+		return len(self.sections) == 0
+	def __iter__(self):
+		return iter(self.sections)
+	def __len__(self) -> int:
+		return len(self.sections)
+	def __str__(self) -> str:
+		return '\n'.join([str(s) for s in self.sections])
+	def Find(self, section : str) -> SectionChange | None:
+		for s in self.sections:
+			if s.section == section:
+				return s
+		return None
+
+
+def _active_sections_(contents : Contents) -> dict[str, SectionBuffer]:
+	return {name : buffer for name, buffer in contents.section_index.items() \
+		if (buffer.header is not None) and (buffer.header.inactive == False)}
+
+def _active_keys_(buffer : SectionBuffer) -> dict[str, ValueLine|MultiLineStartLine]:
+	return {key : entry[0] for key, entry in buffer.GetKeyIndex().any.items() if entry[0] is not None}
+
+def _key_crc_(buffer : SectionBuffer, l : ValueLine|MultiLineStartLine) -> CrcKey:
+	if isinstance(l, MultiLineStartLine):
+		return buffer.GetMultiLineCRC(l)
+	# Just the value, as the CRC of the line also covers the separator
+	return StringCRC(l.value, 0)
+
+def _key_value_(buffer : SectionBuffer, l : ValueLine|MultiLineStartLine) -> str:
+	if isinstance(l, MultiLineStartLine):
+		ml = buffer.GetMultiLine(l)
+		return '\n'.join([c.raw_content for c in (ml or [])])
+	return l.value
+
+def _all_keys_(kind : str, buffer : SectionBuffer) -> list[KeyChange]:
+	" Keys of a section that was added or removed "
+	res = []
+	for key, l in _active_keys_(buffer).items():
+		v = _key_value_(buffer, l)
+		if kind == ADDED:
+			res.append(KeyChange(ADDED, key, None, v))
+		else:
+			res.append(KeyChange(REMOVED, key, v, None))
+	return res
+
+def _same_text_(old : SectionBuffer, new : SectionBuffer) -> bool:
+	" Sections not touched by edits; avoids computing the essence of their lines "
+	if len(old.lines) != len(new.lines):
+		return False
+	for a, b in zip(old.lines, new.lines):
+		if a.raw_content != b.raw_content:
+			return False
+	return True
+
+def _diff_section_(old : SectionBuffer, new : SectionBuffer) -> list[KeyChange]:
+	" Keys that were added, removed or changed in a section "
+	if _same_text_(old, new) or (old.GetCRC() == new.GetCRC()):
+		return []
+	ka = _active_keys_(old)
+	kb = _active_keys_(new)
+	res = []
+	for key, l in kb.items():
+		o = ka.get(key)
+		if o is None:
+			res.append(KeyChange(ADDED, key, None, _key_value_(new, l)))
+		elif (type(o) is not type(l)) or (_key_crc_(old, o) != _key_crc_(new, l)):
+			res.append(KeyChange(CHANGED, key, _key_value_(old, o), _key_value_(new, l)))
+	for key, o in ka.items():
+		if key not in kb:
+			res.append(KeyChange(REMOVED, key, _key_value_(old, o), None))
+	return res
+
+
+def DiffContents(old : Contents, new : Contents) -> ContentsDiff:
+	"""
+	Compares two contents, reporting the sections and keys that were added, removed or changed.
+	Sections differing only on comments, blank lines or order of keys are not reported.
+	"""
+	sa = _active_sections_(old)
+	sb = _active_sections_(new)
+	res = []
+	for name, buffer in sb.items():
+		o = sa.get(name)
+		if o is None:
+			res.append(SectionChange(ADDED, name, _all_keys_(ADDED, buffer)))
+		else:
+			keys = _diff_section_(o, buffer)
+			if keys:
+				res.append(SectionChange(CHANGED, name, keys))
+	for name, o in sa.items():
+		if name not in sb:
+			res.append(SectionChange(REMOVED, name, _all_keys_(REMOVED, o)))
+	return ContentsDiff(res)
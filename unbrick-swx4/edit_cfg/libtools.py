@@ -7,37 +7,89 @@ import zlib
 import bz2
 import re
 import base64
+import struct
+from collections import Counter
+from functools import lru_cache
+from typing import Iterable
 from unidecode import unidecode
 
 
 DEBUG_IS_LIKE_GCODE = 0
 
 
-def EncodeB64(payload : str) -> str:
+def EncodeB64(payload : str|bytes) -> str:
+	if isinstance(payload, str):
+		payload = payload.encode('utf-8')
 	# BZ2 compressor...
-	pk = bz2.compress(payload.encode('utf-8'))
+	pk = bz2.compress(payload)
 	# ...then BASE64 encoder
 	enc = base64.b64encode(pk)
 	# Finally, back to internal string representation
 	return enc.decode('utf-8')
 
-def DecodeB64(b64 : str) -> str:
+def DecodeB64Bytes(b64 : str) -> bytes:
 	# Decode BASE64
 	ba = base64.b64decode(b64.encode('utf-8'))
 	# Decompress BZ2
-	return bz2.decompress(ba).decode('utf-8')
+	return bz2.decompress(ba)
+
+def DecodeB64(b64 : str) -> str:
+	return DecodeB64Bytes(b64).decode('utf-8')
 
 
-PRINT = re.compile(r'M117\s+(.*)')
-GCODE = re.compile(r'([GM][\d]+)\s*(.*)')
-GCODE2 = re.compile(r'(params\.\w+)\s*(.*)')
-GCODE3 = re.compile(r'(\|\s*default\([\d\.]+\))\s*(.*)')
-GCODE4 = re.compile(r'(\|\s*(?:int|float))\s*(.*)')
-IDENTIFIER = re.compile(r'([a-zA-Z_]\w*)\s*(.*)')
+class RecordCodec(object):
+	" Packs records made of integer fields followed by strings into a binary block, transported as BZ2+BASE64. "
+	" The block has a header with a tag and the record count, then fixed size records with the integer fields "
+	" and string lengths, then the text of all strings in UTF-8. "
+	HEADER = struct.Struct('<4sI')
+	def __init__(self, magic : bytes, fields : str, texts : int) -> None:
+		assert len(magic) == 4, "Tag of records must have 4 bytes"
+		self.magic = magic
+		self.fields = len(fields)
+		self.record = struct.Struct('<' + fields + 'I' * texts)
+	def Encode(self, records : Iterable[tuple]) -> str:
+		n = self.fields
+		heads = []
+		texts = []
+		for rec in records:
+			strings = rec[n:]
+			heads.append(self.record.pack(*rec[:n], *[len(s) for s in strings]))
+			texts.extend(strings)
+		payload = self.HEADER.pack(self.magic, len(heads)) + b''.join(heads) + ''.join(texts).encode('utf-8')
+		return EncodeB64(payload)
+	def Decode(self, b64 : str) -> list[tuple]:
+		data = DecodeB64Bytes(b64)
+		magic, cnt = self.HEADER.unpack_from(data)
+		if magic != self.magic:
+			raise ValueError("Invalid use of this class. B64 is valid but cannot be reinterpreted.")
+		start = self.HEADER.size
+		end = start + cnt * self.record.size
+		text = data[end:].decode('utf-8')
+		n = self.fields
+		pos = 0
+		res = []
+		for rec in self.record.iter_unpack(data[start:end]):
+			strings = []
+			for l in rec[n:]:
+				strings.append(text[pos:pos + l])
+				pos += l
+			res.append(rec[:n] + tuple(strings))
+		return res
+
+
+# Tokens of the `IsLikeGCode()` heuristic; alternatives are tried in priority order, in a single match
+TOKEN = re.compile(r"""
+	(?P<space>\s+)
+	|(?P<tag>\{%|%\})
+	|(?P<print>M117\s)
+	|(?P<gcode>[GM][\d]+)\s*
+	|(?P<param>params\.\w+|\|\s*default\([\d\.]+\)|\|\s*(?:int|float))\s*
+	|(?P<ident>[a-zA-Z_]\w*)\s*
+	|(?P<scalar>\d+(?:\.\d+)?[a-zA-Z]{1,4})\b
+	|(?P<number>\d+(?:\.\d+)?)\s*
+	|(?P<char>.)
+	""", re.VERBOSE | re.DOTALL)
 WORD_LIKE = re.compile(r'^(:?[A-Z]+|[a-zA-Z][a-z]*)$')
-ID_VALUE = re.compile(r'([a-zA-Z_][\w\.]+)\s*(.*)')
-SCALAR = re.compile(r'(\d+(?:\.\d+)?[a-zA-Z]{1,4})\b')
-NUMBER = re.compile(r'(\d+(?:\.\d+)?)\s*(.*)')
 QUOTE1 = re.compile(r'(.*?)(".*?")(.*)')
 QUOTE2 = re.compile(r"(.*?)('.*?')(.*)")
 
@@ -150,112 +202,116 @@ def _eval_i18n_(txt : str) -> tuple[str, str]:
 		else:
 			out = txt
 			break
-	s = ''
-	for ch in out:
-		if ord(ch) > 127:
-			s += 'x'
+	if out.isascii():
+		return ('', out)
+	s = 'x' * sum(1 for ch in out if ord(ch) > 127)
 	return (s, unidecode(out))
 
 
-def _count_triplets_(txt :str, any_of_1 : str, center : str, any_of_2 : str) -> int:
-	cnt = 0
-	i = 1
-	while (i + 2) < len(txt):
-		if txt[i-1] in any_of_1 \
-			and txt[i] == center \
-			and txt[i+1] in any_of_2:
-			cnt += 1
-		i += 1
-	return cnt
+def _triplet_weights_(rules : list[tuple[int, str, str, str]]) -> dict[tuple[str, str, str], int]:
+	" Expands the triplet rules into a table of weights for every matching combination "
+	res : dict[tuple[str, str, str], int] = {}
+	for weight, any_of_1, center, any_of_2 in rules:
+		for c1 in any_of_1:
+			for c2 in any_of_2:
+				key = (c1, center, c2)
+				res[key] = res.get(key, 0) + weight
+	return res
 
-def IsLikeGCode(txt : str) -> bool:
-	if DEBUG_IS_LIKE_GCODE:
-		orig = txt
-	s, txt = _eval_i18n_(txt)
-	# English chars only
-	while len(txt) > 0:
-		if txt[0].isspace():
-			txt = txt.lstrip()
-		elif txt.startswith(('{%', '%}')):
-			s += 'gg'
-			txt = txt[2:]
-		elif (m := PRINT.match(txt)):
-			s = s.replace('x', '')	# cancel i18n occurrences
-			s += 'gg'
-			txt = txt[2:]
-		elif (m := GCODE.match(txt)):
-			s += 'g'
-			if (len(s) == 0) and (m[1].upper() in KNOWN_GCODE):
-				s += 'g'
-			txt = m[2]
-		elif (m := GCODE2.match(txt)) \
-			or (m := GCODE3.match(txt)) \
-			or (m := GCODE4.match(txt)):
-			s += 'g'
-			txt = m[2]
-		elif (m := IDENTIFIER.match(txt)):
-			if WORD_LIKE.match(m[1]) \
-				and (m[1] not in RESERVED):
-				s += len(m[1]) == 1 and 'w' or 'W'
-			elif (len(s) == 0) and (m[1].upper() in KNOWN_GCODE):
-				s += 'gg'
+# Weights of the sequences of token classes that are typical for programming
+TRIPLET_WEIGHTS = _triplet_weights_([
+	(6, "i", '=',  "i"),
+	(5, "i", '=',  "inw"),
+	(5, "inwW", '=',  "i"),
+	(4, "i", '=',  "W"),
+	(5, "w", '=',  "in"),
+	(4, "w", '=',  "w"),
+	(3, "W", '=',  "Winw"),	# spellchecker:disable-line
+	(3, "w", '=',  "W"),
+	(5, "i", '.',  "Ww"),
+	(5, "Ww", '.',  "i"),
+	(4, "W", '.',  "w"),
+	(4, "w", '.',  "W"),
+	(3, "W", '.',  "W"),
+])
+
+def _count_triplets_(s : str) -> int:
+	" Sums the weight of all triplets in a single scan; the last char is never the tail of a triplet "
+	t = s[:-1]
+	get = TRIPLET_WEIGHTS.get
+	return sum([get(k, 0) for k in zip(t, t[1:], t[2:])])
+
+def _tokenize_(s : str, txt : str) -> str:
+	" Converts the text into a string of token classes "
+	cls = list(s)
+	pos = 0
+	while True:
+		# Any char is a token, so matches are contiguous
+		for m in TOKEN.finditer(txt, pos):
+			kind = m.lastgroup
+			if kind == 'space':
+				pass
+			elif kind == 'tag':
+				cls += 'gg'
+			elif kind == 'print':
+				cls = [c for c in cls if c != 'x']	# cancel i18n occurrences
+				cls += 'gg'
+				# Only "M1" is consumed: scan again from there
+				pos = m.start() + 2
+				break
+			elif (kind == 'gcode') or (kind == 'param'):
+				cls.append('g')
+			elif kind == 'ident':
+				word = m['ident']
+				if WORD_LIKE.match(word) \
+					and (word not in RESERVED):
+					cls.append(len(word) == 1 and 'w' or 'W')
+				elif (len(cls) == 0) and (word.upper() in KNOWN_GCODE):
+					cls += 'gg'
+				else:
+					cls.append('i')
+			elif kind == 'scalar':
+				cls.append('w')
+			elif kind == 'number':
+				cls.append('n')
 			else:
-				s += 'i'
-			txt = m[2]
-		elif (m := ID_VALUE.match(txt)):
-			s += 'i'
-			txt = m[2]
-		elif (m := SCALAR.match(txt)):
-			s += 'w'
-			start, end = m.span()
-			txt = txt[end:]
-		elif (m := NUMBER.match(txt)):
-			s += 'n'
-			txt = m[2]
-		elif txt[0] in ',.=-':
-			s += txt[0]
-			txt = txt[1:]
-		elif txt[0] in '{}<>/[]*':
-			s += 'o'
-			txt = txt[1:]
-		elif ord(txt[0]) > 127:
-			if not s.endswith('x'):
-				s += 'x'
-			txt = txt[1:]
+				ch = m['char']
+				if ch in ',.=-':
+					cls.append(ch)
+				elif ch in '{}<>/[]*':
+					cls.append('o')
+				elif ord(ch) > 127:
+					if not (cls and cls[-1] == 'x'):
+						cls.append('x')
+				else:
+					if DEBUG_IS_LIKE_GCODE:
+						print (ch)
+					cls.append(ch)
 		else:
-			if DEBUG_IS_LIKE_GCODE:
-				print (txt[0])
-			s += txt[0]
-			txt = txt[1:]
+			return ''.join(cls)
+
+@lru_cache(maxsize=4096)
+def IsLikeGCode(txt : str) -> bool:
+	s, tokens = _eval_i18n_(txt)
+	s = _tokenize_(s, tokens)
+	cnt = Counter(s)
 	pgm = 0
 	nat = 0
-	pgm += 5*s.count('g')
-	pgm += 3*s.count('i')
-	pgm += 2*s.count('o')
-	pgm += s.count('n')
+	pgm += 5*cnt['g']
+	pgm += 3*cnt['i']
+	pgm += 2*cnt['o']
+	pgm += cnt['n']
 	pgm += 3*s.count('-n')
-	pgm += s.count('w')
-	pgm += 6*_count_triplets_(s, "i", '=',  "i")
-	pgm += 5*_count_triplets_(s, "i", '=',  "inw")
-	pgm += 5*_count_triplets_(s, "inwW", '=',  "i")
-	pgm += 4*_count_triplets_(s, "i", '=',  "W")
-	pgm += 5*_count_triplets_(s, "w", '=',  "in")
-	pgm += 4*_count_triplets_(s, "w", '=',  "w")
-	pgm += 3*_count_triplets_(s, "W", '=',  "Winw")	# spellchecker:disable-line
-	pgm += 3*_count_triplets_(s, "w", '=',  "W")
-	pgm += 5*_count_triplets_(s, "i", '.',  "Ww")
-	pgm += 5*_count_triplets_(s, "Ww", '.',  "i")
-	pgm += 4*_count_triplets_(s, "W", '.',  "w")
-	pgm += 4*_count_triplets_(s, "w", '.',  "W")
-	pgm += 3*_count_triplets_(s, "W", '.',  "W")
-	nat += s.count('W')
-	nat += s.count('w')
-	nat += s.count('x')
-	nat += ((n := s.count('W')) > 3) and (2*n) or 0
-	nat += ((n := s.count('n')) <= 3) and n or 0
+	pgm += cnt['w']
+	pgm += _count_triplets_(s)
+	nat += cnt['W']
+	nat += cnt['w']
+	nat += cnt['x']
+	nat += ((n := cnt['W']) > 3) and (2*n) or 0
+	nat += ((n := cnt['n']) <= 3) and n or 0
 	nat += s.endswith(('...', '.', ',', '!', '?'))
 	if DEBUG_IS_LIKE_GCODE:
-		print (f'{s:20}: {pgm}:{nat}: {orig.strip()}')
+		print (f'{s:20}: {pgm}:{nat}: {txt.strip()}')
 	return pgm >= nat
 
 
@@ -272,8 +328,33 @@ def GetHeadSpacesOfCommentedLine(txt : str) -> str:
 	return res
 
 
+# Fast path of `_string_essence_()` for ASCII strings: all space alike chars of `str.isspace()`
+ESSENCE_SPACES = re.compile(r'[ \t\n\r\x0b\x0c\x1c-\x1f]+')
+# A value followed by an identifier needs a separator; digits after identifier chars are part of the identifier
+ESSENCE_VALUE_ID = re.compile(r'(?<![A-Za-z0-9_])[0-9][0-9.]*(?=[A-Za-z_])')
+
 def _string_essence_(s : str) -> bytes:
 	"""Reduces a string having identifiers and values to its essence. This normalizes strings with minor changes."""
+	if s.isascii():
+		s = ESSENCE_VALUE_ID.sub(r'\g<0> ', s)
+		return ESSENCE_SPACES.sub(' ', s).rstrip().encode()
+	return _string_essence_i18n_(s)
+
+# Same as `ESSENCE_SPACES`, but keeping line breaks
+ESSENCE_BLANKS = re.compile(r'[ \t\r\x0b\x0c\x1c-\x1f]+')
+
+def _string_essence_list_(lines : list[str]) -> list[bytes]:
+	" Computes `_string_essence_()` of each single-line string, normalizing all of them at once "
+	joined = '\n'.join(lines)
+	if (not joined.isascii()) or (joined.count('\n') != len(lines) - 1):
+		return [_string_essence_(l) for l in lines]
+	# Line breaks never join tokens
+	joined = ESSENCE_VALUE_ID.sub(r'\g<0> ', joined)
+	joined = ESSENCE_BLANKS.sub(' ', joined)
+	return [l.rstrip().encode() for l in joined.split('\n')]
+
+def _string_essence_i18n_(s : str) -> bytes:
+	""" Char by char implementation of `_string_essence_()`, for the complete unicode character classification """
 	res = ""
 	is_token = False
 	try:
@@ -370,6 +451,22 @@ class CrcKey(int):
 		return f"CrcKey(0x{self:08X})"
 
 
+class CacheStats(object):
+	" Hit and miss counters of a cache, for instrumentation "
+	def __init__(self, name : str) -> None:
+		self.name = name
+		self.hits = 0
+		self.misses = 0
+	def Reset(self) -> None:
+		self.hits = 0
+		self.misses = 0
+	def __str__(self) -> str:
+		return f"{self.name}: {self.hits} hits, {self.misses} misses"
+
+# Counters of the CRC values cached by lines, sections and multi-line keys
+CRC_CACHE_STATS = CacheStats("CRC cache")
+
+
 def StringCRC(s : str, seed : int|CrcKey) -> CrcKey:
 	"""Computes CRC of a string normalizing it with the `_string_essence_` method"""
 	return CrcKey(zlib.crc32(_string_essence_(s), seed))
@@ -5,10 +5,12 @@
 
 import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import final, Iterator, overload
 
 from .loc import Loc
 from .libtools import *
+from .libtools import _string_essence_, _string_essence_list_
 
 
 class Lines(list):
@@ -42,30 +44,71 @@ class Lines(list):
 	def GetCrucialLines(self) -> list[Line]:
 		return [l for l in self if (isinstance(l, ToggleableLine) and (l.inactive == False)) or isinstance(l, PersistenceLine)]
 	def GetLinesEssence(self) -> StringEssence:
-		return StringEssence('\n'.join([l.uncommented for l in self.GetCrucialLines()]))
+		" Same as the essence of the joined lines, but assembled from the essence cached on each line "
+		crucial = self.GetCrucialLines()
+		if not crucial:
+			return StringEssence(b'')
+		# Fills missing cache entries in a single batch
+		missing = [l for l in crucial if l._essence_ is None]
+		if missing:
+			for l, e in zip(missing, _string_essence_list_([l.uncommented for l in missing])):
+				l._essence_ = e
+		# Line breaks merge with surrounding spaces and never join tokens
+		res = b' '.join([e for l in crucial if (e := l.GetEssence().lstrip(b' '))])
+		first = crucial[0].uncommented
+		if res and (first[:1].isspace() or ((not first) and (len(crucial) > 1))):
+			res = b' ' + res
+		return StringEssence(res)
 
 
 class LinesB64(str):
+	# Records: line type, inactive flag, raw contents and uncommented contents
+	CODEC = RecordCodec(b'LIN1', 'BB', 2)
 	def __new__(cls, value : str|Lines):
 		if not isinstance(value, str):
-			value = EncodeB64(repr(value))
+			value = cls.CODEC.Encode([l.GetRecord() for l in value])
 		return super().__new__(cls, value)
 	def __init__(self, value : str|Lines):
 		pass
 	def __repr__(self):
 		return f"LinesB64({super().__repr__()})"
 	def Extract(self) -> Lines:
-		data = eval(DecodeB64(self))
-		assert isinstance(data, list), "Invalid use of this class. B64 is valid but cannot be reinterpreted."
-		assert all(isinstance(item, Line) for item in data),  "Invalid use of this class. B64 is valid but cannot be reinterpreted."
-		return data 		# type:ignore
+		" Creates new `Line` objects on every call; decoding happens only once for each string "
+		res = Lines()
+		for tag, inactive, raw, unc in _decode_lines_(self):
+			cls = LINE_TYPES[tag]
+			if issubclass(cls, ToggleableLine):
+				res.append(cls(0, raw, unc, inactive != 0))
+			else:
+				res.append(cls(0, raw, unc))	# type: ignore
+		return res
+
+@lru_cache(maxsize=256)
+def _decode_lines_(b64 : str) -> tuple[tuple[int, int, str, str], ...]:
+	" Decoded records of a `LinesB64`; constants in `encoded_data.py` are applied many times "
+	res = tuple(LinesB64.CODEC.Decode(b64))
+	if any(rec[0] >= len(LINE_TYPES) for rec in res):
+		raise ValueError("Invalid use of this class. B64 is valid but cannot be reinterpreted.")
+	return res
 
 
 class AnyBuffer(ABC):
 	" An object that groups lines in a logical form "
 	def __init__(self) -> None:
 		super().__init__()
-		self.lines = Lines()
+		self._lines_ = Lines()
+		# Unlinked lines still stored in `_lines_`, purged on next access
+		self._unlinked_ = 0
+	@property
+	def lines(self) -> Lines:
+		" Lines owned by this collection "
+		if self._unlinked_:
+			self._compact_()
+		return self._lines_
+	def _compact_(self) -> None:
+		" Drops the lines that were unlinked, in a single pass "
+		self._lines_[:] = [l for l in self._lines_ if l.buffer is self]
+		self._unlinked_ = 0
 	@abstractmethod
 	def GetTitle(self) -> str:
 		return "Invalid Signature"
@@ -73,17 +116,23 @@ class AnyBuffer(ABC):
 	def Link(self, l : Line) -> None:
 		" Links a line to this collection "
 		assert l.buffer is None, "Cannot add a line that is already owned"
+		# A line being linked again cannot have a stale copy in the list
+		if self._unlinked_:
+			self._compact_()
 		# Takes ownership
 		l.buffer = self
-		self.lines.append(l)
+		self._lines_.append(l)
 	@abstractmethod
 	def Unlink(self, l : Line) -> None:
-		" Unlinks a line from this collection"
+		" Unlinks a line from this collection. This is O(1), as the list is compacted on demand "
 		assert l.buffer is self, "Line does not belong to this collection"
-		self.lines.remove(l)
 		l.buffer = None
+		self._unlinked_ += 1
 	def Sort(self):
 		self.lines.sort(key = lambda line : line.line_no)
+	def LineChanged(self, l : Line) -> None:
+		" Notification sent by a line owned by this collection after its contents were modified "
+		pass
 	def GetLocation(self) -> list[Loc]:
 		" Returns the line locations that buffer owns "
 		res = []
@@ -139,9 +188,23 @@ class Line(ABC):	# ABC = Abstract Base Class
 	COMMENT_EXTRACT = re.compile(r'^([^#;]*)[#;]?.*$')
 	def __init__(self, line_no : int, raw_content: str, uncommented : str):
 		self.buffer : AnyBuffer|None = None
-		self.line_no = line_no
+		# The `FileBuffer` storing this line; it renumbers lines on demand
+		self.file_buffer : AnyBuffer|None = None
+		self._line_no = line_no
 		self.raw_content = raw_content
 		self.uncommented = uncommented
+		# Normalized contents and CRC, computed on demand
+		self._essence_ : bytes | None = None
+		self._crc_ : CrcKey | None = None
+	@property
+	def line_no(self) -> int:
+		fb = self.file_buffer
+		if (fb is not None) and (fb.renumber_from is not None):	# type: ignore
+			fb.UpdateLineNumbers()						# type: ignore
+		return self._line_no
+	@line_no.setter
+	def line_no(self, line_no : int) -> None:
+		self._line_no = line_no
 	@abstractmethod
 	def _parse_(self) -> None:
 		pass
@@ -167,6 +230,29 @@ class Line(ABC):	# ABC = Abstract Base Class
 			tail = ''
 		self.uncommented = uncomment
 		self.raw_content = uncomment + tail
+		self._touch_()
+	def GetEssence(self) -> bytes:
+		" Essence of the uncommented contents; cached until the line changes "
+		if self._essence_ is None:
+			self._essence_ = _string_essence_(self.uncommented)
+		return self._essence_
+	def GetRecord(self) -> tuple[int, int, str, str]:
+		" Data needed to recreate the line: type, inactive flag, raw and uncommented contents "
+		return (LINE_TYPES.index(type(self)), 0, self.raw_content, self.uncommented)
+	def GetCRC(self) -> CrcKey:
+		" Same as `StringCRC(self.uncommented, 0)`; cached until the line changes "
+		if self._crc_ is None:
+			CRC_CACHE_STATS.misses += 1
+			self._crc_ = CrcKey(self.GetEssence())
+		else:
+			CRC_CACHE_STATS.hits += 1
+		return self._crc_
+	def _touch_(self) -> None:
+		" Drops cached values and notifies the owner that line contents has changed "
+		self._essence_ = None
+		self._crc_ = None
+		if self.buffer is not None:
+			self.buffer.LineChanged(self)
 
 @final
 class EmptyLine(Line):
@@ -229,6 +315,7 @@ class ToggleableLine(Line):
 			self.uncommented = new_pre + self.uncommented[l:]
 		if len(self.raw_content) >= l:
 			self.raw_content = new_pre + self.raw_content[l:]
+		self._touch_()
 	def GetWouldBeRaw(self) -> str:
 		if self.inactive:
 			pre = self.prefix.replace(';', '')
@@ -243,6 +330,8 @@ class ToggleableLine(Line):
 			if len(self.uncommented) >= l:
 				return pre + self.uncommented[l:]
 		return self.uncommented
+	def GetRecord(self) -> tuple[int, int, str, str]:
+		return (LINE_TYPES.index(type(self)), int(self.inactive), self.GetWouldBeRaw(), self.GetWouldBeUnc())
 
 @final
 class SectionLine(ToggleableLine):
@@ -370,28 +459,42 @@ class ContinuationCommentLine(Line):
 		raise RuntimeError("Only replacement allowed for this element")
 
 
+# Line types that can be followed by a continuation line
+CONTINUATION_TYPES = (ContinuationCommentLine, ContinuationLine, MultiLineStartLine)
+
+# Line types by the tag used on `LinesB64` records; append new types at the end
+LINE_TYPES = (EmptyLine, CommentLine, PersistenceLine, SectionLine, IncludeLine, ValueLine, MultiLineStartLine, \
+	ContinuationEmptyLine, ContinuationLine, ContinuationCommentLine)
+
+
 class LineFactory(object):
 	COMMENT_TEXT = re.compile(r'^[#;]+(.*)$')
+	# Classifies the text of a commented line in a single match; alternatives are tried in priority order
+	COMMENTED_KIND = re.compile(r'^(?:(?P<ml>[a-zA-Z0-9_]+\s*[:=]\s*$)|(?P<value>[a-zA-Z0-9_]+\s*[:=])|(?P<section>\[[a-zA-Z0-9_\-\ ]+\]\s*$))')
+	KEY_START = re.compile(r"^[a-zA-Z0-9_]+[\s]*[:=]")
 	def __init__(self) -> None:
 		self.line_no = 0
 		self.unlock_persistence = False
 	def _new_(self, raw_content: str, pre_line : Line|None) -> Line | None:
 		self.line_no += 1
-		is_continuation = isinstance(pre_line, (ContinuationCommentLine, ContinuationLine, MultiLineStartLine))
+		# All line classes are final, so a type lookup replaces the slower `isinstance()`
+		is_continuation = type(pre_line) in CONTINUATION_TYPES
 		raw_content = raw_content.rstrip()
-		uncommented = Line.UncommentLine(raw_content)
-		stripped = raw_content.strip()
-		if not stripped:
+		if not raw_content:
 			if self.unlock_persistence:
 				return None
-			return EmptyLine(self.line_no, raw_content, uncommented)
-		elif raw_content.startswith("#*#"):
-			if self.unlock_persistence or ("---- SAVE_CONFIG ----" in raw_content):
-				self.unlock_persistence = True
-				return PersistenceLine(self.line_no, raw_content, uncommented)
+			return EmptyLine(self.line_no, raw_content, raw_content)
+		ch = raw_content[0]
+		if ch == '#':
+			if raw_content.startswith("#*#"):
+				if self.unlock_persistence or ("---- SAVE_CONFIG ----" in raw_content):
+					self.unlock_persistence = True
+					return PersistenceLine(self.line_no, raw_content, Line.UncommentLine(raw_content))
 		if self.unlock_persistence:
 			raise ValueError(f"Unexpected line after persistence: {raw_content}")
-		if raw_content.startswith(("#", ";")):
+		if ch in '#;':
+			# Lines starting with a comment marker are always uncommented as an empty string
+			uncommented = ''
 			# Takes the contents of the comment
 			m = self.COMMENT_TEXT.match(raw_content)
 			if m:
@@ -400,21 +503,14 @@ class LineFactory(object):
 				raw2 = raw3.lstrip()
 				# inactive line can also have comments
 				unc2 = Line.UncommentLine(raw2)
-				# Include line found
-				if uncommented.lower().startswith("[include"):
-					return IncludeLine(self.line_no, raw_content, uncommented, True)
-				# Multi-line pattern found?
-				m = MultiLineStartLine.PATTERN.match(unc2)
-				if m:
-					return MultiLineStartLine(self.line_no, raw2, unc2, True)
-				# Value-line pattern found?
-				m = ValueLine.PATTERN.match(unc2)
-				if m:
-					return ValueLine(self.line_no, raw2, unc2, True)
-				# Section head found?
-				m = SectionLine.PATTERN.match(unc2)
+				m = self.COMMENTED_KIND.match(unc2)
 				if m:
-					return SectionLine(self.line_no, raw2, unc2, True)
+					if m.lastgroup == 'ml':
+						return MultiLineStartLine(self.line_no, raw2, unc2, True)
+					elif m.lastgroup == 'value':
+						return ValueLine(self.line_no, raw2, unc2, True)
+					else:
+						return SectionLine(self.line_no, raw2, unc2, True)
 				if is_continuation and raw3.startswith((' ', '\t')):
 					unc3 = Line.UncommentLine(raw3)
 					return ContinuationLine(self.line_no, raw3, unc3, True)
@@ -423,29 +519,34 @@ class LineFactory(object):
 				if m:
 					return ContinuationCommentLine(self.line_no, raw_content, uncommented)
 			return CommentLine(self.line_no, raw_content, uncommented)
-		if is_continuation and raw_content[0].isspace():
-			if stripped.startswith(("#", ";")):
-				m = self.COMMENT_TEXT.match(stripped)
-				if m:
-					raw2 = m[1].strip()
-					unc2 = Line.UncommentLine(raw2)
-					if IsLikeGCode(unc2):
-						spc = GetHeadSpacesOfCommentedLine(raw_content)
-						return ContinuationLine(self.line_no, spc + raw2, spc + unc2, True)
-				return ContinuationCommentLine(self.line_no, raw_content, uncommented)
-			return ContinuationLine(self.line_no, raw_content, uncommented)
-		if uncommented.startswith("[") and uncommented.endswith("]"):
-			if uncommented.lower().startswith("[include"):
-				return IncludeLine(self.line_no, raw_content, uncommented)
-			else:
-				return SectionLine(self.line_no, raw_content, uncommented, False)
-		elif re.match(r"^[a-zA-Z0-9_]+[\s]*[:=]", uncommented):
+		uncommented = Line.UncommentLine(raw_content)
+		if ch.isspace():
+			if not uncommented:
+				stripped = raw_content.lstrip()
+				# A line with blanks only was already stripped
+				if is_continuation:
+					m = self.COMMENT_TEXT.match(stripped)
+					if m:
+						raw2 = m[1].strip()
+						unc2 = Line.UncommentLine(raw2)
+						if IsLikeGCode(unc2):
+							spc = GetHeadSpacesOfCommentedLine(raw_content)
+							return ContinuationLine(self.line_no, spc + raw2, spc + unc2, True)
+					return ContinuationCommentLine(self.line_no, raw_content, uncommented)
+			elif is_continuation:
+				return ContinuationLine(self.line_no, raw_content, uncommented)
+		elif ch == '[':
+			if uncommented.endswith("]"):
+				if uncommented.lower().startswith("[include"):
+					return IncludeLine(self.line_no, raw_content, uncommented)
+				else:
+					return SectionLine(self.line_no, raw_content, uncommented, False)
+		elif self.KEY_START.match(uncommented):
 			if uncommented.endswith("=") or uncommented.endswith(":"):
 				return MultiLineStartLine(self.line_no, raw_content, uncommented)
 			else:
 				return ValueLine(self.line_no, raw_content, uncommented)
-		else:
-			raise ValueError(f"Unrecognized line: {raw_content}")
+		raise ValueError(f"Unrecognized line: {raw_content}")
 	def New(self, raw_content: str, pre_line : Line|None) -> Line | None:
 		obj = self._new_(raw_content, pre_line)
 		return obj
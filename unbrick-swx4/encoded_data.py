@@ -10,9 +10,9 @@ CONFIG_FILE = '/home/mks/klipper_config/printer.cfg'
 # upg:		Y
 # grumat:	upg
 												# BASE64 of the persistence area
-RESET_CFG_PRO = LinesB64('QlpoOTFBWSZTWW+aJH4AAsX/gFAAEABI93/nP+3djr/v/3BAAm67gYOQSUyJoEmkfqeqPUB6hpvUm1AND1G2lGm1NsqCU9SE1PVJtQNoBNAGmI9AATQAAbVKAADQAaANNAAGgAACSU0mjSN6iek0xM1MBADAQMmAC0sLBCRrgJLUkFW/shw28ciDdz95IlGfDuIzn9evry0cmKBIRVhliBR//azjYwnDADFpIRKkIlEJEEkjZJHnRRDcdHS8Oh3OrZrOnIqng1PazX1tBk8QKaIFMBCfghPhAmAlgYkYUgTqNOwEe8FPd8tGYM+iSI12CJSDQy/FI06xSZommCIJoKoioIiiwbYeHxiCiqLAoqCkbk2LIrCKwiXYrIYQqkEoVSxx6lIyMlLuK3SxnmUpVZkaWygQc9KZ5LUTFrlits1L3xWcZZsJitrYuuowwqiqirCFlnKty8xmxQyrZlmlWFW+MnwTeUXapnqhZKuVBKcRC9mDGH7+7nXjvfHd7+zdu3V2YJCPsabZ40vodkhEtDMzGL7HSOPPDDR7tMfzysTSzjGmRvjlXtjGMY2wRCh/8+R8vT6M5duhIQykPmQKyAoRostpQkbUhGXAj4XL2SEZwKR6HgFOPFIRcv7dy83MX7e+YHVTqLjSBac6EiVtKEi0TGeryELBaJhYJEhDISGZohyc6vVrx0YCIsIkPAeh6CcUoyQ73iJtYmPIQSGgGHOU6MJrwSHpCJOZi1XW3pCKqHixrgchaXaJ3km9RXMIQc5GDwEWYZf8XckU4UJBvmiR+A==')
+RESET_CFG_PRO = LinesB64('QlpoOTFBWSZTWWw3yQsAAh7/gFgt/0BIF3/nv+2dir/v/3BAAk6jrjqbQlFMTUaYTJqaAAaPSAAA0yDT1BkMg1PQTU0mUAANAAABoAAAAA1U/9VUYAAAAAAAAAAAAAkSRJ6mj1GRpkNAAAAaaNMgNAAEl+SOV8azSzDIYKobcJA6yPewmgYs8RUFFVTtO4AiFhDSENJDaVtgYyQGQ0pTACtCYIqCohpCcOqIiVIgMr9ly+f9mFgyM/Rw5r8uQa9+Dyjw4cGpLgnFR6Zbke7FIYAziSEW0RoXp0TYS5dk7kpHVe0S7+mLibcUe0RYqw6UhEIDZYKrtCwbgK8DZr+VegKGJZTQY7CTEV3DvsWCsSiJNwNtggEhCBAwUJJ08QkCAEDBAgEgSsxOTsbaY20xlRqaAoYTMRDCZqfC+2q0oEEio1tBDixEIViUQFXnIEA2qtqB1Io8Bwz1LEUZKTqoRRnekE1mRkSSCSSCSZEByUm0CElVRRNnKFFYyJJikzZCuypRFobjxOhHPaIJt0l5QYLe+MTWr210+9/HXXXjpikszSPs2GRsdNkRB1Kkh+Zx5d6xb15BOUv5mhxzt+0vMzM1wyBmv0uY4tfLndhVGkGcUsiiK10VrN6EE7CnOwhGQsULnhOmKeWigudXq8DfsXSglAjG2nloSAz6F0aoNNEtqriSlKzYs0UwVC+isWylFKCgycUtUiKlkmpJnAxVlFQEWsgxcGubIqDLIqF/SeELUzBXABKixAFN8Qv8XckU4UJBsN8kLA==')
 												# BASE64 of the persistence area
-RESET_CFG_PLUS = LinesB64('QlpoOTFBWSZTWRWqGXgAAsl/gEAAEABI93/nP+3djr/v/3BAAm6mDKZBJTJJtJqeiTemoaBBtPUaIwAeSAmxBKepNTQaigAxAAAA0AABkOYBMBMjACMTEwmEwQ0xNMBEqIR6g9JoZDT1AADIaAAACkMJhASOKAktwES0fNzeGnU3wzwPonIxn+W+DB15M7qydF5RMFqy4DV6acpPeDSwA2VEsUSwBIghIzxRNwCuM1rwzO7c0eI5NXDRnoaHszWUtSZAUvApoKJaUSgFInDJFCQnGonEOLAcEkkIQZEDf8b9S3yuhQxwA1JiiY0OkWtPVfQEQWyVUFEYVEXqaLzDnqREbMSXguCCMQgYv1p3VrM4JdK3U1Tm06TRZzJN+6FjUzayvIiOeVolzqQ0tVsUYyqyXJk1zkLJMyYKRVBBVFdNU1z200gR1NDKnWb4ta2V76CqI32wZbXxNyS2JE8Y04JQTkmmiIX8tYt9O5zsv0X3dHndddRTakI8ceKe+T1OyQiapmZi9+d0jTxwtq5scfPZucklrmmomNEeTHxqrVW9gb1/Lch6u12eXL4b4ggmMi3KJsJDV8bpAkeSQjVYR2nLKnSEa4FBGd4BRfpSEVr3r/GSos8fqcDPLpymHIbIFRmBInxYUJGITGvLvEYBRt0Wywz1EgKSS2UtNOHVw1XaC4WJol7aLqVoVF7MLmvWJlaxbrLQKSghTS5dQZVYKVqImc1iy17FiQijA8WP1AxbBXVP+dswP+6ZBCDmNg2osw1f2LuSKcKEgK1Qy8A=')
+RESET_CFG_PLUS = LinesB64('QlpoOTFBWSZTWei+yLIAAin/gFgt/+RIF3/nv+2dir/v/3BAAk6urlcc2GkxJqaPQp6nlAADQ0GgYTQNNNDT1BkbKDU9CaI1NIaADQAAAAAAAAASnqlTTNqamgAyAAAA00AAAAACSTSieRPIjE8oeoAAADQBoAAAIuaJ8bnskjkCQHWgkgBthDnIIzRk0s1jjYU3Lpa04AIheQwJDCSqBgJkgKGSigFSJgRkjCGuCtwgiK0AQSjNkPHnpPKaMH8HBVdmPKIMPm/Fiw76W6wpPS4znuwnTAG4kIhloq5qyH8S/xu193hyxqOH9yJ8s5PtKWHTKmxEEFe6DRViAUdIjo1DVVUYYTMgM/yxZEpSzBIMDAF1ulkYGDEHeF1oRVUFEYVEXBrLYL9SIibEirBVBBBhAgCt8NKNUiVhDPxjaiYxMyxqRgpmEFlkCYVCRaLoCCDKKwQyZAJqy2mFqLKQ4RBVJAFJKUikqIqggqitE0nWr0UQIzKC7qM5PRVWLvMEkggvXQRrejghKTEmajymkGCpFgQLensoDs/NxVBMx0T/FrJRRR3aleKGSJ0NZHo2BTMxQhkM+4y90vS7fvoHEVTW1mjAtNe8qoqvYQZAv6lI59vNU26wlB1BghDATFbXsUzg5UE9ipQ4K5GATYJS8pZNF4mudeEBpybNBYuFoCYrzSkwoH9jUEWCDRKSyzRHTvReokmgVznRbLVROidBKW7BTOIr0EZyLQGHdSmBK2yDCuVuyKgyCJi9qfHwBbW7SYBKixAFN4Euf4u5IpwoSHRfZFkA')
 
 # def:		upg
 # upg:		Y
@@ -35,10 +35,10 @@ Z_MAX_PLUS = '405'								# Plain value
 # grumat:	Y
 HOME_OVR_PRO_CRC = CrcKey(0x1EAC1C68)			# CRC object of a value
 												# BASE64 of a multiline value
-HOME_OVR_PRO = LinesB64('QlpoOTFBWSZTWT56r1cABKMfgFLne3I/79x+v+feXlAEHgAAAABzAJpgEyGAAJgmAAAHMAmmATIYAAmCYAAAcwCaYBMhgACYJgAABzAJpgEyGAAJgmAAABUUiGimMmoyNTZQ0NGmmmmQxA8jKeDYbDtfxH7xYsWLFsYWMRYsM0QfMqQcTTTGMY3mcQdaugcSjMphPwFO5HAkns9i/rbcLgwwuGKxhW9JOw4nwN5oNpGacDnNjvIMEHTzzfU5TmN7IzK2uVUj51H25M9WeNWjM0mqNSKVmyykmypnZt2twg4Fe8xJB1nAxJBo2L57aq2qqrbaUpSqpSlKqqqrbbFi2lLFiqtqrbFiqtttt86QWJMlEcTvPIknWeM2lO0+B6Ifg5UpuXLLFMmGK9EkGH3lpaetJmjzHUet50aiME6k3DynIRqSODqPW6jQ8h0GD3PcNT2jRIP0ep7n6vUNH8DYk3LEG4SZP5HQ/cYGQ+I5mx3JBp27xrerkGg4PkwPkNaK2jRsHm8g2DMcr+UUlRSVFSPKen824qklUtKpaSSUknrKYKRYLFiyLVqhVSVKiirVttqVQp+nQOx8R8na9p4inoU4h2RBme1JMn0STm70g+L3joKd5Gp1vo1G1JO4qa3lffJ9VVaotpZJPmLJBwiHNVqSd55GeonQZskk3GbiawbUk4DYc7cJ6SSbXMTxHOZJJ4ydbWajY2m7kSTkSTQdx6RDCSajwPMMEg1pJrPEeDic55Yg6ZOpJhBrM0gzI8aSZJCZFCpBUg8RGjYTMzSDI7Eg5DkSTidJ/ZkZnSYO0pvcwqScCS+hypJuSTUdRkbDzRBR0jsKa3jPqMDWo8ESdNCD2VqGriYSDekG41GhSCmaQaNT27zlIyDQwcTBuIPefA7vBcz6H2KIqif+LuSKcKEgfPVerg==')
+HOME_OVR_PRO = LinesB64('QlpoOTFBWSZTWVnPgS4ABBt/gGXvgQ/243t6P+/cer/n3l5QA54AAAAHGRpkxNBkyYTTIGQ0BoDTJoYATQGOMjTJiaDJkwmmQMhoDQGmTQwAmgMcZGmTE0GTJhNMgZDQGgNMmhgBNAY4yNMmJoMmTCaZAyGgNAaZNDACaAwVFJARoxNDKo9NTE0wm1MaAjJ6j1GaG1TGmk/RMTL4s42a+be6PG3b8uyN06N8Zo2TMdNYc80YcMr11m6Ow4vfa+PS58ZI6tkbY2ycNDq6txtm/dHTJubnBm7JJBxlnZWBRIotsWLFiyWS2qttpSyy2liiyVVVwCYYYGKTDBInGxciQn1vae2q23D7J68MTBcnkUZysylT31Vc1yY0NGaSaUUKpRn9nVhmrHof20STOsWRnwYW21Ko2CGHmj3npVX4xkioqLIq222//Nx16cYxjmPqeMbSjIphPIKfsjxEk6+2u0uJauMGGJVdKSfQbzuOk1DWRmOtJWhg9RB1EGo+8+Y0mk9RrSTieA1FPSec4yfYpZrKxX+Laow+stLTJH1JPK5HI8HgRnIzk5jwJTrNhGdI3ORxPK4ms7TtMHmeYf0fcP+PceZ9rtGl+I2pOZx3mxSFKKzvOOTn8YyGYaDuG58exuGZ0DPDmdzA7hnRWsaWkcBoGQ1j8EUlRRUVDifebR/F5x3PQ8RpKeFT2QyPEkmHeknyviG0p3kfycnpZzUknoKmh4XfE7bKVbVqpJ6R3nUwTgZMySajM3GgGlJP6jSbnATvJJrdBOc3GSScCf69rSaDU5joSToSTUPIVJOk9ZyGdJM5zHqdRvPWn8EnJBoMiOCSYSTOUOYjU0kzGDYc6SbjsPUZHWe2YPIU2ukVJNxJtSTWkmY5GRoJ1j2CmdvORgclGBvNBkNjnNZGAzGDoMHhJJuHyn0nr8q+WHsFkSdJ+4u5IpwoSCznwJcA')
 HOME_OVR_PLUS_CRC = CrcKey(0x649232BC)			# CRC object of a value
 												# BASE64 of a multiline value
-HOME_OVR_PLUS = LinesB64('QlpoOTFBWSZTWX/KBLsABKMfgFLne3I/79x+v+feXlAEHgAAAABzAJpgEyGAAJgmAAAHMAmmATIYAAmCYAAAcwCaYBMhgACYJgAABzAJpgEyGAAJgmAAABUUiAgGoyanhQwQ2mgEzUDNNJ+Go1H1fKPjFixYsWxhYxFiwzRB3lSDca9eMYxGUQdSuUbijcUwnoFPsjjJJ29q+y24XBhhcMVjCuJJOs3HzOI1jYRmnGchqeBBgg5uScVTgOE4mRmVscCpHfUfrkz0Z40a2ZrmiNCKVmyykmqpnZs2Nog4yvgYkg6jjMSQa2pem2qtqqq22lKUqqUpSqqqq22xYtpSxYqraq2xYqrbbbelILEmSiNx4HjSTqPEbCn1Pmec83ocKU3lyyxTJhivNJBh6C0tOxJmjsdJ0nU0EZk6E3zeHO0iuAjUkcjoOx0G05TmMHve8aHtGtIPW9T3vY9Q1vkNSTasQbRJk/keR8RgZD6Dhan2SDX9eIaXq3xrHG7mB3DSitg1tQ5/GNQzHA+aKSopKipHkP27G0qklUtKpaSSUknrKYKRYLFiyLVqhVSVKiirVttqVQp28o630Hc+r3G8U8qm4OuIMz3JJk+6ScPgkHc+I5SngRodT7tBsST7FTS8jzydFVaotpZJO8WSDjiHDVqSeB42egnKZskk2mbcaQbEk4xqORtE9JJNjhJvHIZJJ4idTSaDU2G3fSTfSTWO89IhhJNB+DnGCQaUk0m8fhuOQ8kQc0n5JMINJmkGZHiSTJITIoVIKkG8RraiZmaQZHWkG+b6SbjmP8MjM5jB9inE4RUk4yS+VwJJtSTQfkZGo54go5h1lNLxHQYGlR+ESc1CDtrQNG4wkHEkG00GspBTNINbQ9vEcBGQazBuMG0g+B9Dv/pcz7n6KIqif+LuSKcKEg/5QJdg')
+HOME_OVR_PLUS = LinesB64('QlpoOTFBWSZTWc7iKvcABBt/gGXvgQ/243t6P+/cer/n3l5QA54AAAAHGRpkxNBkyYTTIGQ0BoDTJoYATQGOMjTJiaDJkwmmQMhoDQGmTQwAmgMcZGmTE0GTJhNMgZDQGgNMmhgBNAY4yNMmJoMmTCaZAyGgNAaZNDACaAwVFJATTTE0Tykn6QINB6hgEejTUHqPNUHqeo/RTEy/bnHTr6ODb87fwy7Y3zbwjNHTMx1VhsmjDjleys23tOT5mvl1NmMkdfTG6N0nHQ6+vebpw3x1Sb29xZu2SQcpZ21gUSKLbFixYslktqrbaUsstpYoslVVcQmGGBikwwSJysXIkJ/F8b5FW24eae/DEwXJ+CjOVmUqfMqrmuTGhozSTSihVKM/xasM1Y9jy6JJnWLIz4MLbalUdIhh6Y/Q9qq9UZIqKiyKtttv/jedmnGMYj7XzjcUbSmE/AU/6j9hJOzxV4i4lq4wYYlV1JJ9ZwO86jUNZGY7ElaGD3EHWQaj+x9JpNJ7jWknI/IaintPWcpPMpZrKxX8La8xk8xaWmSPuSehzPGd3czkZybDuTYYO1oFbSNKRweM5noczYcjkYPS9I/O/qP5PzPS/o5DS9Q3JOh28DpUhSis71jxtn0DIZhoO8b37+lvGZtGeHQ72B3jOitY0tI4jQMhrHqRSVFFRUOR/c3D4HrHe9jymkp5FPiDI8qSYeCSfS/cNxTwI+Fze1nNSSewqaHkeETxWUq2rVST2jwOtgnEyZkk1GZvNANKSfqGk3uIngSTW2k2G8ySTiT8fj0mg1Og2pJtSTUPOVJOo95zGdJM50HudZwPenjSc0GgyI4pJhJM5Q6CNTSTMYOk2JJvO095kdh8hg85Tc6hUk3km5JNaSZjmZGgnYO4pncDmYHNRgcDQZDpbDWRgMxg2mDyEk3j6D7D7fQvoh3FkSdR/8XckU4UJDO4ir3A')
 
 # def:		upg
 # upg:		Y
@@ -51,126 +51,126 @@ MESH_MAX_PLUS = '290,290'						# Plain value
 # grumat:	Y
 G29_PRO_CRC = CrcKey(0xF8CEE4BF)				# CRC object of a value
 												# BASE64 of a multiline value
-G29_PRO = LinesB64('QlpoOTFBWSZTWQw3laoAAHUfgEDkclA/5hx+rqWeADAAtmwlKAmNBMAIwAACRSnlMQaGhoBkADAVUkPUaHpDQ0DJo0ABFASBiYtFcDLmbhGMMYLwChO22223kQ0JKGpeTIlCE0k2BWrVFKE6xhX1CpSpfTeuNcES1Y4HEignQtIsqx6gj5kXRFEAfWB8TO0QuyDILBIfEODokE8E6F1HyhEYj8KidFaTQ0fxo3olcK4RfzxZ0SQ0dMBdyRThQkAw3lao')
+G29_PRO = LinesB64('QlpoOTFBWSZTWU2eQFMAAFt/AEVijABAAHJQP+cccI6AoACRDUmgBkABkZNNG0CqIUxGRpDEDRmp6gTRdfSt61sF0Ivm+RSZmUwxmI4cuPXOK2rsFoRxeDzUSutNVHXu7vY3owaMFX492bN6Hy1LGrR2Po7GCNTZGLR0xMqtzIo3DPAeBAECDWkIi7kinChIJs8gKYA=')
 G29_PLUS_CRC = CrcKey(0x7E1AC1F9)				# CRC object of a value
 												# BASE64 of a multiline value
-G29_PLUS = LinesB64('QlpoOTFBWSZTWQEQaJAAAHUfgEDkctA/5hx+rqWeADAA1iGNNBoAZNAZGmhiaMEiVPSYjIA0aAAA0BVJTT1CPCTamEPTTSbSME0kgKC+QJiyaoKq24lKJwXYFFLbbbbeFEkerW0pJlaJVJaWtc3si1oei9QZ0ljatWv4+nI2QmYL1xwJoaEYE1K92hPrUcpqVZ7UKkc+CGGJiXIs8w7PC1HlHhkpT2JMR8FTQixJoaPo0a0TXCuEft16tEyGjf/F3JFOFCQARBokAA==')
+G29_PLUS = LinesB64('QlpoOTFBWSZTWUz8SQUAAFt/AEVijABAAHLQP+cccI6AoACQMZNMgZNDIMjTAjAqiIEaRiaZGjI9T1PUPUmi6+lb1lmC6EXzfIpMzKYYzEb+fHvvitlbRxWxCXq5JXWTyUd+rJ9KPFg2M1TYl+uzg4Op8tCw0Zsj7MjBGhbGLN6Ym6ra3FG1GhofzVqyy1f4u5IpwoSCZ+JIKA==')
 
 # def:		Y
 WIPE_PRO_CRC_DEF = CrcKey(0x5119CB28)			# CRC object of a value
 												# BASE64 of a multiline value
-WIPE_PRO_DEF = LinesB64('QlpoOTFBWSZTWYc3XucAAnEfgEDmf3Irr8x+rqWeADABYMMEKiqeptTGjU8miYI09TINMEYRSoaAyABoAAAMgKlKE8kzRPUyDE0BpmiMQ0+AonAaQ0mIHheNIsKYswRoRYFwQPUEGoyqYnGvC0riDPyEX+CLnihhqGGpmZqqqqqtQLIu43kcBsHYMMON5ZNKpot0AUGINqLImzbty5kMyGeFdcNDShdJuCBijKaXwk0Fq8TtWqEyEqSFEeiwvl9KK0mM71ZWazxQaT3L0iH8hNh7FDAXHMk6uVGsu3FguMJUYC3aVGEykThsEnzaXGiJLOhJzfruiTpC0FS4WPYrAC/UW1ZBc4rALALQQCzAslKLSIP6B11ZgWQFgF3fxdyRThQkIc3XucA=')
+WIPE_PRO_DEF = LinesB64('QlpoOTFBWSZTWac1ugMAAet/AEPnAIpAAn9yK6/McI6AsAErKMJKKfpRvU1AAAAaAD1BJqpAAAAAAAAFSRTTUDJoNBkBoGECEZtKp2iPKckhkNcm9oYCQJrdT1pCUIPAirJIiAgIRCKqpIF0kzMkmPBQlqyBL06bKl1tLSq6FlKtLS1XopJKUTYUYvCblYQNdIsqWpg1E1E3XWkUwtMkLbIUNCW1tVwihFJHVc3lAJIzno3JMnmZ1yaGhJnJikKR8MxculMUnKfjExPc2Jzm4skj2Qm827SxgcDNlazecsOBlMDIbzAynMQVYew/FChZZQ/i7kinChIU5rdAYA==')
 WIPE_PLUS_CRC_DEF = CrcKey(0x53513B27)			# CRC object of a value
 												# BASE64 of a multiline value
-WIPE_PLUS_DEF = LinesB64('QlpoOTFBWSZTWd4Su94AAnEfgEDmf/Irr8x+rqWeADABYMbBEkpk0R6Q00NNAGgADQJKiZDTI0GTCGEZAYmAKlUT09U/UE00MmjTIGI9AmgZS4UTAohgIbzi1CiUpULy9FvBbEB6AgXFlSo1xUsitQLXiL7CLbPBgyQYMkYxjJJJJJJJJvgsRdpzGUhwjWI7Sw0NuMzKl85YASBUDSi6KBLtOqzaIWi5JkzgJqNgqQ0BsDWGNrROxkdRKCOgnowpoKqKLEuhiO9UqajwQaD3LsiH6hNh7FwsLTmSXvq41FvyYhaVKFhk+ChUxkTfUAlXvD2EiEnsgS/mBAhLJCWAy6arhJMAL+IubAF1isBYC/pAXEFu3Iu4Qf6D1WxBbgWAvb/i7kinChIbwld7wA==')
+WIPE_PLUS_DEF = LinesB64('QlpoOTFBWSZTWQwEnWYAAet/AEPnAIpAAn/yK6/McI6AsAErKMJRSeU9T9TUDRhAANBo0eoIlJTTJgEYDRGBMAQFSSCmhoaaGgaDQDaICzRc+DOmZ8XoYFEUSEWgOAeCOw4mnRBEVWUpJFWEAgEBgMkkkFC+LnirjxWS1XhLqU0lLo1MFWIspVpaWppXkllE9Si94ZKwga6RZUtTBcy7Uuo2xqg1Vnv8QpFS7FKSkqrpLQCV3obRU5TYXeRnZInO0OUnAIsT4bHIlMzFivSwZz8ZjMe5qTQZFkkeyE3G3aWMDeaMWs3HHDeYmBebjAxM5E4g+B+JEi22R/F3JFOFCQDASdZg')
 # upg:		Y
 # grumat:	upg
 WIPE_PRO_CRC_UPG = CrcKey(0xB77EDF4D)			# CRC object of a value
 												# BASE64 of a multiline value
-WIPE_PRO_UPG = LinesB64('QlpoOTFBWSZTWXcuviEAAWcfgEDmf/Irr8x+rqfeIDABezYEJU9RQekAZMgMQ0ZAaNACU9VRoAAAADQAAAFSiSeRNGTQGmgGgPUDQaepiiJcxmNVQoUmWlKMQWJKugqZlxRCcQSMSWpkCwTGJs4AORBE9BQSSFEVVVVVVVVWrACAXyUShEo3SFJMeMLakEA1MhGAgI4o3A5zQc95mSuNK0rRZZqcpvKoVZjM1KO9OcuVWNDOtdipasGcqlRlORjLjqOaSNRrNiwhtE8TWUNwvMF0kt2UdZf6G+LzIWmI0eZaYzOie3gknjoLzSG9hB9P1xoYB+K5V2yQog+wycDJBpkKQUg/FIM0G1dtDaJhROyzPBuQYKwKMZ/F3JFOFCQdy6+IQA==')
+WIPE_PRO_UPG = LinesB64('QlpoOTFBWSZTWdC9Z7YAAQt/AEPnEIpAAn/yK6/McI6AsAEIwGppqaHqnpMmJpkYjRkyYmTIJNSpijQGmQA/UQYmj0jQCqU9KntKMT1PUAADR6gzKHqGFrBojXXuEBMaxZg34GmHAGKcR9GqUACJSEAslAEQQYxVVkmVIpOkngwndnolNxAyJNFDMhQgh21FlEiawoMDTMRvCWYUMpLzFWx5CF0lk5mU0ll58L8JSyyZKU8b9qTUlBebG1Y3or6lyjBawXPlJVQYEokaz9XFx8HujkN5JDERkbtxJaZl9XeZGuDMqWnAZFpU2IRqMz+aNGOOj/F3JFOFCQ0L1ntg')
 WIPE_PLUS_CRC_UPG = CrcKey(0x8B891807)			# CRC object of a value
 												# BASE64 of a multiline value
-WIPE_PLUS_UPG = LinesB64('QlpoOTFBWSZTWftfItsAAWofgEDmf/Irr8x+rqfeIDABebYASp6lP1QyNAxBoAGjJpoABqn+qoNGmjIYmIYmjJhAMmgKkkCmpk2nqCPU9CaMmh6hp6mNPVMmTjZREuai9ZRgVKqqXhcks6yxZeZFkXUZ1FVC14P0iYUVRS+AhAAAAAAAAA2wkhJLooUm1nY4CwkiSdCDrSyJIB6DEOBh4EsMrMDM8sUvt1OmqxstVqXXdTapSFNZtbDNm8EspypZmxdy9YUoe4+DEwO02SRtO83riHATxO8owNxoykmO+nzN35PeNxqMS8z/BicRrRP34pJ98zcbA5NIP89XShoHotxst8hSDzDVzNUGyQqCoPRUHLBwZcA4CaUnddrgwg0Wg8Nb/i7kinChIfa+RbY=')
+WIPE_PLUS_UPG = LinesB64('QlpoOTFBWSZTWVq5Np0AAQ5/AEPnEIpAAn/yK6/McI6AsAELWwJTSQm1PSNAANAAAAZqUmgNAAaPUAAAMFUKT0oaA0A0AD1BmUPSA7kIxlRat1KU1AQpqlRM07E0aYyZgEmigdJNsGMaGgABt2hJAlfTpE3hElMmlSiVOp0XJi5STnhMTMUiJfBRTy2piEnrGoAcDsKdeQKVJCU7SkKuOCJoUiHRcU9jQSdwhCy6jeIQwVhvIbQrKzwM4jlRqXN59NChKRpP5YsfJ1o5DaUQwEYmzYUWMjVe8DE4YMi8saDEsXnEhGkyP9mzYYZtwu5IpwoSC1cm06A=')
 
 # def:		N
 # upg:		Y
 # grumat:	upg
 LINE_ONLY_PRO_CRC_UPG = CrcKey(0x9601896A)		# CRC object of a section
 												# BASE64 of an entire section
-LINE_ONLY_PRO_UPG = LinesB64('QlpoOTFBWSZTWYlHHbcAAq8fgEDnf/orr8x+r+ff8EACXGVAAcwAAAAAAAAAAJNVNTUepiAGBMgDQGmmmmgAcwAAAAAAAAAAFSSAjRPSmU2jU9TT1H6pmoGmaepGaMKZDBAopJM2xC5FlNCbla3WtalMZEwQyLlKSnsLTFUzWUpgf67/BPq9U5PliuxW5L55qcwc4fG7WnfaxVV9qHD87VcFRlpVC0kLKWyBLCBLarFEFQK4CqioqKqoqwGAqrhJIwIuLhfE9KpVFUkdjqUp7LmNifBTBgUuJXaKwOdqFSjBKUMsAKSSxjWeZIgruPGrWrQlRQzdon7MmxsPiP3I9aGpspqtepJcdMsrqLNrBmbS9tXFwltyFdL1HDTS1ubef2fyZAe4+B2Sd18E60R3H+FGJyPMZiY9/QbORvHzNhkXmHp+RkZl6JO3tCb3bwOR3ND3vu4wnB73iklD6rnI8VzZyMvmnQ6/F5TwuSqgbYTxWpT9MF2uFM9FmT1uLa9G6TwQU8lySTS5Zy3JxU/CE6N69fOwcAe2JFOlSSWSTnaTgZLwZvyST79c3sZYaZukX4sV7Vpg9EJnzXS3Br5IiqOjq2tmKSc90m6pI3NJ54NRkkm7+sW5rNWgrQb2L/xdyRThQkIlHHbc')
+LINE_ONLY_PRO_UPG = LinesB64('QlpoOTFBWSZTWeLfSywAAgj/gEvqoG9iw3/6K6/Meq/n3/BAAenJACCkep6g0PyoaDRoAAAADQAAASapJqaA0AaAA0AAAAAAAOGmmRiMJpgIYBNMIwTEyGmRoaAKpNQEaEaRiABoaB6g00epoyeo0yNHoR6IxmBFUU0BGFkQABnEUhQEWAoQMrrKsUpMEDlCcsCvoAFpIZACQiiqCOOyjGA22QC3BiMJ2ZsVfN1mpVVi+yBpM17lBY3ohJG8sQShKisjzKb9VKTKVaDeJUURR8CVlKUi5Kiiw53RrR0NEczPaqtTzK5/CXmGTTLNoLDJEVJCrepQaUgsBKHCULhjCJSwV0CdwlZWCVErllkjdB3kiLg+NLE0ReQxPmI4Xbx4lMZqGkhf4EGY2aKVVqO7REVku8VJxrHZxGBawVFQicyCm275tYZJnYzGT7HETegbR9yRHnQhqOTkJLDlMuc1GSD8FhjKzSWFpkQiM3L1spynrdo33+b/tQ50tBrVNB0+5Gd0cKKU6XVGsqSnLhRdjStadzWwYQdLPhUlgjg8SWCUxl6ohRuthfGQtW3OLdjbWRiudgVWrFbcx2LskxOVl2bma9dHXUtqWsUYl4pnWP+LuSKcKEhxb6WWAA==')
 LINE_ONLY_PRO_CRC_GRU = CrcKey(0xC2007C15)		# CRC object of a section
 												# BASE64 of an entire section
-LINE_ONLY_PRO_GRU = LinesB64('QlpoOTFBWSZTWedMunwAArIfgEDnf/orr8x+r+ff8EACXGVAAcwAAAAAAAAAAJNVNTUepiAGBMgDQGmmmmgAcwAAAAAAAAAAFSSAjRPSmU2jU9TT1H6pmoGmaepGaMKZDBAopJM2xC4llNCbla32tal7GRLkMi5Skp7C0xVM1lKYH+u/wT6vVOT5YrsVuS+eanMHOHxu1p32sVVfahw/O1XBUZaVQtJCylsgSwgS2qxRBUCuAqoqKiqqKsBgKq4SSMCLi4XxPSqVRVJHY6lKey5jZPgoYMClCV2isDnahUowSlDLACkksY1nmSIUu48atatCVFDN2mSiP2Zti8+I/cj1oamymq16klx0yyuos2sGZtL21cXCW3IV0vUcNNLW5t5/Z/Jkge4+B2Sd18E60R3H+FGJyPMZiY9/QbORvHzNhkXmHp+RkZl6JO3tCb3bwOR3ND3vu4wnB73iklD6rnI8VzZyMvmnQ6/F5TwuSqgbYTxWpT9MF2uFM9FmT1uLa9G6TwQU8lySTS5Zy3JxU/CE6N69fOwcAe2JFOlSSWSTnaTgZLwZvyST79c3sZYaZukX4sV7Vpg9EJnzXS3Br5IiqOjq2tmKSc90m6pI3NJ54NRkkm7+sW5rNWgrQb2L/xdyRThQkOdMunw=')
+LINE_ONLY_PRO_GRU = LinesB64('QlpoOTFBWSZTWdY1iF4AAgv/gEvqMG9iw3/6K6/Meq/n3/BAAe7QACCkaeoNG2qAaAaABoABoAyGjIIeqoaAAAaAAAAAAAAAOGmmRiMJpgIYBNMIwTEyGmRoaAKkkaIaFHqTYoGgeoeoHpGTR6mmGo9TI9R5NSGIy1BFVdJgaiCIABK8pUyjGgBMgWRcvRGZ8cE0BTRAtIDfSOMUiVUpRSuKpapUK5KkEhUFEFRdkxQDmVhqAAKHYREoi16jRAUcpFicq6FiWUxJ9SubGqtZiwQ5SylJTyFl6qpmspS57XX2J1ueexwyYZLexjO5TXwTlZ7zGpJSqpIw8drKtaKqFLPIs+l4VKWxXsnrULrlMEvM6klZHSkpTy/nV1qTURrfqZqI8z4NmxVzpHQRq+RDed+lYYqfFSTEs+MwW2LvDrNDJowMBLb0K4niPBpttbvbzb6DzltRDwHrLCfWiOk9XqLFzqN3A6TbD+C5sMToLmRtRJv6u5uOo+975zP+c3jR7VnOdjBznb+KcHX5kqu17p2GCy27SmexZk6OPsaNIdrhpgs0Ty/Ms0WWm73SKcjvNU2mTLN5+ScS815veGGS7Fx7Ls9tpbc3d/Nv1M53YMsGTXNbUK4Lv/F3JFOFCQ1jWIXg')
 LINE_ONLY_PLUS_CRC_UPG = CrcKey(0xA1FABFED)		# CRC object of a section
 												# BASE64 of an entire section
-LINE_ONLY_PLUS_UPG = LinesB64('QlpoOTFBWSZTWUvwCuEAAq8fgEDnf/orr8x+r+ff8EACXMVAAcwAAAAAAAAAAJNUKammgHqADIAANGgABzAAAAAAAAAAAVJIBT0U/SjTSeTU09R+qHohpmnpIybEmQwQKKSTNohciympNytrrWtSmMiYIZFylJT2FpiqZrKWYHzfXwT6NuZjyuK3FMxafwmmAXgGWuknxSgK/LAyN99DJWkLJDC4iBMJAmJViiCoFYCqioqKqoqwGAqrukkYETi4XxOhUqiqSOx1KU9lzGxPgpgwKXJcXYC4DjtSoqWYJapbJAC0koxwGUkSl3HjVrVqSooZu0T9WTRkaHxHtI6UNjmXLNlySxRovYmhezXFwltUK9LoNunqtbzbz+j+DID9z4HZJ3XwTrRHcf2UYnI+4zEx+vOacjeO80Mi8w6PkZGZeiTt7Qm928DkdzU977OMJwe94pJQ+i5yPFc05GXenO6/F5TwuSqgc0J4rUp+eC7bCmeqzJ0uLmefdJ4IKeS5JJrcs79ycVPTCc+9evnYOAP2iRT1KSSySehrOBkvBm/FJPt1zexlhrm9QvxYr2zXB54TPzXS3Bt5IiqOfq5mmKSei6TdUkbms++DYZJJu/nFubTZqK1G9i/8XckU4UJBL8ArhA==')
+LINE_ONLY_PLUS_UPG = LinesB64('QlpoOTFBWSZTWUr6lQ0AAgj/gEvqoG9iw3/6K6/Meq/n3/BAAenJBqEoknpqZqaPKg9QGjEGgMgAMgyGJk0EmqSNQAAaBoDQAAAAAAA4aaZGIwmmAhgE0wjBMTIaZGhoAqhQhpTxJ6nqGgeoGh6geoDRpoaeo9TI9RoKiJqMRG2IRIscqgQhXbFZouEipWdxNu26ZyGwkNkW+gAYKQyQEhFFUEchlGMBtMgFqDEYTszoq+brNSqrF9kDSZr3KChiRCSOBcgpCkrSPCnVZM1SlqDgKSlEvWUumZjCpKlxzN3Ojc1xys+BZgVyrZ/CXmITTLq/CwyRFSQq3qUGlILAShwlCxcMcRKrJXQJ3CWSyCVErK4skaw7ySUvZ7ZuVKMRC9h94jhdey9N8Y0y2DiIX9tBmKsdGxNgUSvWulhMZcvWFgisqCdDSZ9Omq3sxk+RxlYkDQfQoR4kIbDk5Ci42mbObDJB9S4xlpxFxgMiERm2/5lNp5nWNT9tXoQ5lNZzrGs/npRnbuERV0H8mcJBgyh6jpxhKeNOcePQNBF8gweJ22lOgpUZf7EJb7eYoyGBgwuPfjqLovwtAswLlpTO0dWYjKCiDivVHJpkJZCUmSYqgLEaf4u5IpwoSCV9SoaA')
 LINE_ONLY_PLUS_CRC_GRU = CrcKey(0x720F5A2F)		# CRC object of a section
 												# BASE64 of an entire section
-LINE_ONLY_PLUS_GRU = LinesB64('QlpoOTFBWSZTWQOkh/AAArIfgEDnf/orr8x+r+ff8EACXMVAAcwAAAAAAAAAAJNUKammgHqADIAANGgABzAAAAAAAAAAAVJECT0U/SjTSeU9TT1H6oeoGmnpkjJsSZjFAopJNG5C5LKak3q2wta1MGUiXQzLqUlPaWmSpospZifF8/FPk25mPK4rcUzFp/CaYBeAZa6SfFKAr8sDI330MlaQskMLiIEwkCYlWKIKgVgKqKioqqirAYCqu6SRgROTjhE6FSqKpI7HUpT23ZWT3qGLEpclxdgLgOO1KipZglqlskALSSjHAZSSil+XKrWrUlRQ0dpmoj8mjc0MT+x+pHShscy6zZdJYo3MGRuMGi5cS2qFet0G3T1Wt6OB/J+5mgfoe87JO7CCdaI7j+ijI7z6jQTL585u7zgPA3GZgY9HwMzQwRJ29oTg7eJ3nc1Pc+jlCcXueSSUPku7zyXbu8z8E53X5POeN0qoHNCeS1KfhivtjTTVZm6XJzPTvk8UFPNdJJrdZ4b05KeuE5+DBhOwcQfnEinsUklkk9TWcTNgDR9ySfTrnBlLDXR7BhkyYNmuL0wmnovLcW3miKo5+rmbskk9V5N9SRvaz64thmkm/+Mm9tNmorUcGT/xdyRThQkAOkh/AA==')
+LINE_ONLY_PLUS_GRU = LinesB64('QlpoOTFBWSZTWaPNTSIAAgv/gEvqMG9iw3/6K6/Meq/n3/BAAe7QBqEoknimJo8qD0CaADQyGgBkAGRk0IeqoaAAAaAAAAAAAAAOGmmRiMJpgIYBNMIwTEyGmRoaAKkkEmjTSaaaaBoGhoGRpoaaGI0yNGjSoiajERtiESLHqoELFdsVli8SKlZ/BxO3KZiFlIWhdKAz0jsikSqlKKVr1LVKhWxUgkKgogqLsmKAcysNQABQ7CIlEWvUaICI5SKJtMELEspeTyq276q1l65DaLKUlN4swqqmRZSzA53R0p0NyczVxXYrcy+dSmXVTaZMxfUkpVUkXbtrKtaKqFLN5Zf5HYUpdgxsnGoYMClyYsZVSSsTkSUp7t+sFqTQIysnxNBRHvdu/RVozFVOQcBGXvoZy1zrXKuCxTKvdfIaJgyri4S2mhWs2TV2dm1tTOZvocJbQIaxxlhPMiOQ4uIsYHKZ9U5DND7GBol5wGBiZkSZ+XqaZynqdo238be6jnWbh0rm4f32EiZusRV0H8mcJBgyidR8wwcd1OcnJ0DQRnkGGkm/4VmkstNP/SKbDUaEzGLHI4dia7CZcjWFzhpUKZmj6zEZQUQeV6o9NMg6QcSpKVQFiNP8XckU4UJCjzU0iA==')
 
 # def:		Y
 # upg:		Y
 # grumat:	upg
 LINE_PRO_CRC_DEF = CrcKey(0xC0A17064)			# CRC object of a value
 												# BASE64 of a multiline value
-LINE_PRO_DEF = LinesB64('QlpoOTFBWSZTWSKwPnMAARqfgEDnfvgLhgh+r+ff0DABmZMpCSo9Cap/qTFNNMmEGT1ADQ3pAkSmoAAAGgAAAAVRE1E9JiDINAYmhoGmhphsiH6orJVC9iRU4zIuuTctEKCgsKLmzM3xubKm1bcrgUey44Jj7k35VO6kRRw7okTCRF9tttttpptvCIaRoK8sA0XhkDAyAyhApydMcylJQ4jKkQBwAowTMpmU6F5qcSUMDUXnmURzakYWl6C6prGBpGJjMRKGNHSvIRnQaEJ3bbWCX1sBG2BDxMEjqPAoIqMRjEoX4ljn9n5GQcmGr+Rkh0iRXEkNfGom5WWGgcvsdcQVCCQ+lrRWPhryQzxDnockQzQMLqVQqhUyojJH6I05BoHIkk8zSNMkZi2BgkTru4eTKHYXndQQVNTMWyEZ2EXKY4c4qQh8olpgFxa4KWdaz/F3JFOFCQIrA+cw')
+LINE_PRO_DEF = LinesB64('QlpoOTFBWSZTWcDM7tcAAO3/gEHtQHDAA/74F6UAcK/n39AwAVMMQlInqm0JkANAGgBoAANAlNUmTEYgNBpoAAAAABVTKEaNT0gAAAAPU00AGieoQp+F6OKKOOAgnvyzWZX6zMxIiuIZkhIEMmYNr3ROJJJLunEywzUWB34IlQOkgzgThgHStWkQKxKpk533TD6VHqs+lWJL2VmlDvWXsyIRRega6yeykpmYJTKnA7iFY0CJQiIREbK0x58GRCi1gWHoSpvX+alrBoFlRnGNxC5mLi6VF6m2y0pWgU5CB0s9FBEfGXy9mCYaZD4epj7CedZ8bqPaqUA8NGjalNhBENHE9ymOiT6Vtwqo8k5GZ2IklhC+SjgjHylZoCuWxSkkDi0PQD5LEo5kc2N5FsEhK2Fmy0xmmqmKpiXGRa0psbSx/i7kinChIYGZ3a4=')
 LINE_PLUS_CRC_DEF = CrcKey(0x35BF6E45)			# CRC object of a value
 												# BASE64 of a multiline value
-LINE_PLUS_DEF = LinesB64('QlpoOTFBWSZTWb5Q60QAARyfgEDnengLhgh+r+ff0DABmZMoElTanpNU/1JtSaYmQaHqANBskGakkAAHqAAAAACpQiaBNGTRoBo0ANNAwvSPxVahZGRlSxmM665S5fIqKi8VXN2lwm9usei/etiVeq4/lI+qOGhXqrJUgvptSTajCAAADGAYk0NrQrNE0NYEQAksqQqUJzU2Ik5KggiMjahJcElnhSlFKUpTBkKDaxqIxNp4mUqmnamDaymBfcZhoMbyGZjRnTWyETUhsRTf7u4JfO4Eb7S3vKpHQdxkIsMRjEyK4l0H7q5GYcmayXwSSISJknJjVewpBIuNZBW6F9gvxdEfK++Wnu3cUa5GqpxyOWDBsWRZFgqOMkfgjbmGsgcmoobRqEzQX2mlIpLDwxZW9RU3ZCCxstBfMRqYRgqEBzdTERm5eaQwLzmSc3jn+LuSKcKEhfKHWiA=')
+LINE_PLUS_DEF = LinesB64('QlpoOTFBWSZTWVrJth0AAO//gEHtQFBAA3p4F6UAcK/n39AwAVNTASkEyAQNGgaAANAGmglPUqbSjT0yENMEaAA0YmhpgqpqNJpomJpkAaaZDT0TE00aM0vX3kv0ssGysry5ujJzld0RBYmESIUUEhiA9KKv0yruZYdGWuAq/hMaFRnIkLg0FRNNQIExQpWeT8lbxUm5VxU3FDemf6HkUtuVRgtEDGU8S8yTMoSTJGIxAlQNojwREIREUrpAr2WrEJLq0+S4UJdutKtrXysqxVGAYixtHQsK4SwJZF6UpigE6CBXJW0ERwrGU6g0Cyo+nvQWRHrf9UvcfGNPwMFixc8iiGMWPOWKQfGlhd5jWoxORKbFIk19DKUjwlHEGD8F4wjSBIXlAyEcUxtHqlq1sRt8mKVxE8aPC1iOYOJAiIS0XAUEB/F3JFOFCQWsm2HQ')
 LINE_PRO_CRC_UPG = CrcKey(0x92CA8881)			# CRC object of a value
 												# BASE64 of a multiline value
-LINE_PRO_UPG = LinesB64('QlpoOTFBWSZTWQn5fbcAABwfgEDkQBAJBggOrqXesCAAlUJSmgA2oAAeUCU1NEepNNAGJk08pNmK+oSlMZxouSSgTQ0yjGpxr3p5gMKkw7JU4x2ekwwqOjEEcUo5CUgCnww6X1kTUZECJFhF5wXDnQw5t4rYe8oOSLOcih1Mj8XckU4UJAJ+X23A')
+LINE_PRO_UPG = LinesB64('QlpoOTFBWSZTWdnd9wcAABVPgElkoBAAJQAArqXQsCAAVCVQPSbU9TEaA2glE01APUAD1FKK5YVRGVBxS1UNZXBghiHiSoScnpsSelixSmQw58QHGGHEEEGHNDYUUuLuSKcKEhs7vuDg')
 LINE_PLUS_CRC_UPG = CrcKey(0x92CA8881)			# CRC object of a value
 												# BASE64 of a multiline value
-LINE_PLUS_UPG = LinesB64('QlpoOTFBWSZTWQn5fbcAABwfgEDkQBAJBggOrqXesCAAlUJSmgA2oAAeUCU1NEepNNAGJk08pNmK+oSlMZxouSSgTQ0yjGpxr3p5gMKkw7JU4x2ekwwqOjEEcUo5CUgCnww6X1kTUZECJFhF5wXDnQw5t4rYe8oOSLOcih1Mj8XckU4UJAJ+X23A')
+LINE_PLUS_UPG = LinesB64('QlpoOTFBWSZTWdnd9wcAABVPgElkoBAAJQAArqXQsCAAVCVQPSbU9TEaA2glE01APUAD1FKK5YVRGVBxS1UNZXBghiHiSoScnpsSelixSmQw58QHGGHEEEGHNDYUUuLuSKcKEhs7vuDg')
 
 # def:		upg
 # upg:		Y
 # grumat:	upg
 POINT0_PRO_CRC = CrcKey(0x15979530)				# CRC object of a value
 												# BASE64 of a multiline value
-POINT0_PRO = LinesB64('QlpoOTFBWSZTWSig+0YAAH8fgEDkdzAJhgh+LqWeADAAoBEpR6p+qfqjNBG1DTTR6YoYwmJoMEYhkYTDGExNBgjEMjCZcqqUPIKAWNpA2LujIFQDsAUtJJJGMl1gGNibXCJIHqBMDBJSUwOQ2ORcxMToNgqFjgcUTQDJZ/QetagdvcXp6AW1XIzNwGoGZS5b9QgvgC/mvFCLFzIuS10A0A1g67N61WL9f4u5IpwoSBRQfaMA')
+POINT0_PRO = LinesB64('QlpoOTFBWSZTWepzDK0AAGJ/AEdsCABAAHcwAacAcA6AoACQMYACYAAmCRFBqNNNMjTR6Q0cKbHSlLbnE2TegL201exENtsFg0sEs2KBZGJIWkjCAzbYqyPOXoMcONBz61FcalCpUqLmFoXn0yF7A3xgW9gH44ODbbg/i7kinChIdTmGVoA=')
 POINT0_PLUS_CRC = CrcKey(0x1F05E6CB)			# CRC object of a value
 												# BASE64 of a multiline value
-POINT0_PLUS = LinesB64('QlpoOTFBWSZTWaIII2EAAH8fgEDkfzAJhgh+LqWeADAAoBEpSfpoQmTQ9EGg9TxQwaaNNMJiZMBA0wwaaNNMJiZMBA0zEqqULgoBYxIG5eMZAqAdwCl8kkkYyYrAOtieDyiSBwAnI3pKSnidBsdDAyOpcZD6FwXnM8kTUDNZ+wfitQO/qLliBbZczQ4AbAaFMC34hBf4DC9eaEWLoRc1rqBqBtB23cVqsX2/xdyRThQkKIII2EA=')
+POINT0_PLUS = LinesB64('QlpoOTFBWSZTWe6KFeEAAGJ/AEdsCABAAH8wAacAcA6AoACQMYTEyYCYAASIlM1Gg00NMENHCmjrWvCxxNJtQFraatYiG22CuaVyWDFArzoSHAvGEBg2xayOkvwMcOMBzniKwxKmhqcTUWZYFT6dhaAbdYFtQD8bm5llufxdyRThQkO6KFeE')
 
 # def:		upg
 # upg:		Y
 # grumat:	upg
 POINT1_PRO_CRC = CrcKey(0xB4193AA8)				# CRC object of a value
 												# BASE64 of a multiline value
-POINT1_PRO = LinesB64('QlpoOTFBWSZTWXroEPUAAIAfgEDkdzAJhgh+LqWeADAApkIlKPU00aaAAAGgxhMTQYIxDIwmBUpQ000BoNAA00LSqpQyBQCwoQIt0ZAxgHYApZJJJGMlqwDhYTOVb4kgXAS8vSUlKmsbG1jWLnFcmRUVti2I+i+Snuidaqh34JLs4r/SXsGkfhgxWK/UKJPgszSWwpGL9Ivta4AYAfoP7FoWqxef8XckU4UJB66BD1A=')
+POINT1_PRO = LinesB64('QlpoOTFBWSZTWemCpfUAAGN/AEdsBABAAHcwAacAcA6AoACRFAmBMJgBMBIiRlGmhoaGIaOFNHa1rr3E0mqAq2mqsRDbbBYNLBLJigXQxJC4YwYZNsWsj6mVH2GOHEjn3mK8zLyxoamoqFwVPpzFoBtjAtqAfjc3K14Dou5IpwoSHTBUvqA=')
 POINT1_PLUS_CRC = CrcKey(0xE5388F82)			# CRC object of a value
 												# BASE64 of a multiline value
-POINT1_PLUS = LinesB64('QlpoOTFBWSZTWYS9t2YAAIAfgEDkf7AJhgh+LqWeADAApkIlJNNGgAAABkMMjTTTIwmRgmgMBUqQ009QADQANAtK1ShhCgFhaQKlzxkCsA7gFMUkkkYyWrAONhMDpiSBlAmgyJKSmc2DYbFFrg2rU3MJRRqa4j6LpKvVSdK6x23pLcgs/SXPjKPw+L1FnmFST2KYpNMKoxfxF+LXcBcBfBvqzLWsXn/F3JFOFCQhL23ZgA==')
+POINT1_PLUS = LinesB64('QlpoOTFBWSZTWQdRefMAAGN/AEdsBABAAH+wAacAcA6AoACRGNGTJgBMCYASIlM1Gg0aGjCGjhTR1rXdY4mk2oC1tNWsRDbbBXNK5LBigV5yJDcXjCAwbYtJHSXgMcOOw5yxFYYlTM0PZoLIsDibz6XizA16QLWgH42Nic9cbF3JFOFCQB1F58w=')
 
 # def:		upg
 # upg:		Y
 # grumat:	upg
 POINT2_PRO_CRC = CrcKey(0x8AF75754)				# CRC object of a value
 												# BASE64 of a multiline value
-POINT2_PRO = LinesB64('QlpoOTFBWSZTWfbLx3oAAH8fgEDkdzAJhgh+LqWeADAAoBEqJ6p+p6k9T1MhtQNMaYoYwmJoMEYhkYTDGExNBgjEMjCZuVKDAPIsQL1wjIFADoAXVkkkjGSywDgZbyUcYkgYATExSXS6pyGpyLyxkZHMdxQKnqcUTUDNZ3g/lKAdPgXnwArsuZoYAbAaF1ivZCC+ALb14oRYuhFzWmoGoG0Ha/0Wixfv/F3JFOFCQ9svHeg=')
+POINT2_PRO = LinesB64('QlpoOTFBWSZTWQ10wlQAAGJ/AEdsCABAAHcwAacAcA6AoACRGMABMAATBIkRlGmmmhpptIaOFKbrWt17iU5UQFG01RiIbbYLBpYJZsUCYpGQwgM22LItMec33GOHFw5e9BXmheVLFiwplwUPpsLYDfGBbzA/HBwa68HRdyRThQkA10wlQA==')
 POINT2_PLUS_CRC = CrcKey(0x78B708C4)			# CRC object of a value
 												# BASE64 of a multiline value
-POINT2_PLUS = LinesB64('QlpoOTFBWSZTWRN68xwAAIAfgEDkdzAJhgh+LqWeADAApkIlJNNNGmjQAAGgxhMTQYIxDIwmBUqQyZAaDIANNC0rVKGUKAWFpAqW6MgVgHYApmkkkjGTOsA4WEyN8SQLgJeaElJS8wGwwXtC9UuSxUUq21bEfRhJR7oTrTSO/FJdpGf9Jgxah+GLJYz+oUJPgsrkthRGL9Ivta8QMQP0H9VpWtYvT+LuSKcKEgJvXmOA')
+POINT2_PLUS = LinesB64('QlpoOTFBWSZTWSAySZQAAGN/AEdsBABAAHcwAacAcA6AoACRFAmBMJgBMBIkQ0nqMmRoPSGjhSm6Upde4lOWCAwbTWDEQ22wVWlVLRigWZ0JBcZjCA0bYrSHOT1GOHGo5ethXmxYxLGJYVS8Lih9MhewN8oFvMD8cHBWvAdF3JFOFCQIDJJlAA==')
 
 # def:		upg
 # upg:		Y
 # grumat:	upg
 POINT3_PRO_CRC = CrcKey(0x7482C28D)				# CRC object of a value
 												# BASE64 of a multiline value
-POINT3_PRO = LinesB64('QlpoOTFBWSZTWfBG+lIAAIEfgEDkdTAJhgh+LqWeADAApkIlKPSaNNAAADIYZGBNMCZDE0YBUpQ000BoZABpoVKqlCgUAsKECLdGQMoB3AKWSSSRjJasAznG0lCrfEkC4CXl6SkpU2ErWspYvXrkqK25bEfRhJT3ROtVQ73JL9Ir/SYMWsfhiyWK/UKJPgs0SWwosX8Rfi1wAwAxg45L1qsXp/F3JFOFCQ8Eb6Ug')
+POINT3_PRO = LinesB64('QlpoOTFBWSZTWUAkypwAAGR/AEdsAgBAAHUwAacAcA6AoACRFACYCYamEwJEiYo0aeoaD0ho4Upu1rZUcSnKqAq2mqsRDbbBZtLNK7FAmchhMYwYXbYtDExwXm+oxw4kOXrUVDUoFjBgwLIKn00F7A25wLaYH43NxAHBdF3JFOFCQQCTKnA=')
 POINT3_PLUS_CRC = CrcKey(0x774DCC99)			# CRC object of a value
 												# BASE64 of a multiline value
-POINT3_PLUS = LinesB64('QlpoOTFBWSZTWenl510AAIEfgEDkd7AJhgh+LqWeADAAo0IlJPU0ymE2ibRNMJjQYNNGmmExMmAgaYJKgAaAAAAFxVUoZwoBaXECxdUZAqAdACmiSSSMZL1gGNpMzsiSBpAms+klJTWYDaYGJeYm44DeZwqXFx9m1EyA8LP+DzrUDp+CVzAIPkujwYB8B4NxEHCBoS7AihSoQRYvoi+FrkBkB7g+7NS1WLz+C7kinChIdPLzroA=')
+POINT3_PLUS = LinesB64('QlpoOTFBWSZTWXV8BZ0AAGR/AEdsAgBAAHewAacAcA6AoACRFQwAAIYACRIgTI9R6hoPRA4UpvHHG69xKcsEBg2msGIhttgs2lmlVigVDiSC4oMICrbFaQ5ydRjhxUcvWorzUsZFjyWFoXhcaGR8KC9gbUgW0wPp+NgnPYOC7kinChIOr4CzoA==')
 
 # def:		upg
 # upg:		Y
 # grumat:	upg
 POINT4_PLUS_CRC = CrcKey(0x2A810901)			# CRC object of a section
 												# BASE64 of an entire section
-POINT4_SEC_PLUS = LinesB64('QlpoOTFBWSZTWc61NhAAAJKfgEDkdzALhgh+rqffIDAA+21QkpqmnlPU08poeoZAAeoAaeqoaZGJhMjACMBAVJSnhTIDEPUABmk0/VNTCRLmJdIyalG9gyeeUnXUqpdV6HwhOBzQAAAwwQMwyQqeyOjRjIEvCZEZJDmc1xQUChEvMB5eLgSIBExlxoS3uSXsW0F2+kvY0M8w3M8WLyU0dkL/6TQ8D4BMR9QehnH4rnKGaqREZJWoJYFCrweESpKks53IsvHKTNrVg6bQsNdJ3t1jJPelkLbEusyf8XckU4UJDOtTYQA=')
+POINT4_SEC_PLUS = LinesB64('QlpoOTFBWSZTWabJg8IAAGt/gE98BAJAAHcwAacAeq6j1QAwALLBKkAAAAAAAAkVMUybUBoBkAAACqqDQaGQNNMgDIPU0epTCKlNznOV51QjKmUkgrbTVTSKG23W5tIMKWdixwAsMhEIlgw9EA0NsW+I5QekY6GnOJKW1CFyoZLi8aLxGQ8MA0LGxCIlAxgTEYyDdZtfkqlffED0kIEXPNBiUp1yKd9ItLIwosCV/F3JFOFCQpsmDwg=')
 
 # def:		upg
 # upg:		Y
 # grumat:	upg
 POINT5_PLUS_CRC = CrcKey(0x4EC34805)			# CRC object of a section
 												# BASE64 of an entire section
-POINT5_SEC_PLUS = LinesB64('QlpoOTFBWSZTWXZffsMAAJOfgEDkd7ALhgh+rqffIDAA+21Qkkpp5TE8oG1DQ0APUANPVUNMjEyaZGATCYTQFSUp4UyDTQGjQDE9TJ+qaGEiXMS6Rk0KODBk25SaqlVLqvQ+UJwOKAAAGGCBmGSFT0RybuMgS7JkRkUM5nZyYoEysvNxMvFEwIBYWDGg0pcGSnEWzF3CkvY0NmwPV54sW1TNqhf/SZh4HwCQj6g9DmPxTMXGWiRWOSVqCO0uKPHjEqSpLOdyLLxyk8mlWDptCw00ngaqnJPelkLakukiX8XckU4UJB2X37DA')
+POINT5_SEC_PLUS = LinesB64('QlpoOTFBWSZTWYfS/lkAAGx/gE98AgJAAHewAacAeq6j1QAwALMGABo0NGEZNBo00BgkVMUybUBoaAAAABVUENMjIDIaAANB6lMIqU3Oc5XHVCMqZSSCttNVNIobbdbm0gvpZmLDACwxEQiWDD0QC1ti3xHKDtGOhyWI5d9qLAtYXBxbnFFS6JilQjeGZFWOeWRFzvCzrqfk7Wje1x5Xi4g4UXL6tU+IKn0gyJkqCRO/i7kinChIQ+l/LIA=')
 
 # def:		upg
 # upg:		Y
 # grumat:	upg
 POINT6_PLUS_CRC = CrcKey(0x9E2417AD)			# CRC object of a section
 												# BASE64 of an entire section
-POINT6_SEC_PLUS = LinesB64('QlpoOTFBWSZTWULGFZEAAJOfgEDkdzALhgh+rqffIDAA+21Qkpqmn6k0yeoH6oaAAeoAaeqoaZGJhMjACMBAVJSnhJoDQHqaAYajT9U52EiXMS6Rk1KODBk25SddSql1XofKE4HNAAADDBAzDJCp7I6NGMgS8JkRmZEmk0yBVkF5tILi8WMYcJHAsM5oS3ySn6LaC7hSXsaGeYdTPFi2qaO2F/9JoHgesJiPqD0NI/FMpBdRIsGSVqDJsIKOPKJUlSWanIsvHKTza1YOm0LDXSeJpqZJ3SxFtSXSZP+LuSKcKEghYwrIgA==')
+POINT6_SEC_PLUS = LinesB64('QlpoOTFBWSZTWXTZdRIAAGx/gE98AgJAAHcwAacAeq6j1QAwALMGNNBoAZNAZGmhiaMEipimTagBoMgAAAVVAmTRpkANDJoBoNKYRUpuc5yvOqEZUykkFbaaqaRQ2263NpBhS0MWOAGYyEQiZRh6IBY2xb4jsg9Ix0OKZDHyrQSq1i1SyrUFCJKQuid4aEGsXVRILpBs60PyduQva88pC8wWZL2JqUvjBS+mCpMjYIk7+LuSKcKEg6bLqJA=')
 
 # def:		N
 # upg:		N
 # grumat:	N
 EXCLUDE_OBJECT_CRC = CrcKey(0x76FC08F6)			# CRC object of a section
 												# BASE64 of an entire section
-EXCLUDE_OBJECT = LinesB64('QlpoOTFBWSZTWdFcKOcAAA+fgEDkQAADBAgKvjfOYCAAVCVQDTQ0DBpqZBKmSHqZADQB6lRBBS4U0IojCDMX2PysmPS2Zh2ORg5MfoUj2RHIJQTpRS+tdLrYDzf8XckU4UJDRXCjnA==')
+EXCLUDE_OBJECT = LinesB64('QlpoOTFBWSZTWWZ00gUAAAlvgFggQAAgAAAlAAqeFIZAIABUUaMgaNMjQSqfqTI9TJoHiiVRBqi1qaM1+FVzwckoSOQejkECJGPi7kinChIMzppAoA==')
 
 # def:		upg
 # upg:		Y
@@ -222,53 +222,53 @@ PROBE180_RETRIES = '5'							# Plain value
 # grumat:	Y
 SCREWS_PRO_CRC = CrcKey(0xDD0B2564)				# CRC object of a section
 												# BASE64 of an entire section
-SCREWS_PRO = LinesB64('QlpoOTFBWSZTWQ4BrzQAAJ+fgEDmfbALBgmKr/feoDABEwDGmg0AMmgMjTQxNGCU9VJ+pAGmgAAAAAqigQg9Jp6npqZMhkGm0ykkRFRAhAh79LQFFCyUmvFStatczYWVZshBwiC0kDUKqqqqqqAkGAg3rYh590ymZ0jIkkuJNyS8qLxYsWqXy1ixxlDPrVBuVIb2Ho2r5eC1a1tjJ4uT3Q5QbBUVkJ5lMQpQxGcHwj77FBDaajEudSsodIhPFoLUNCYHTK4VRCgnUa7Ds0mJCTsYOKDmuQvYFmpKU4K3kd+dMGb1Ibf8XckU4UJAOAa80A==')
+SCREWS_PRO = LinesB64('QlpoOTFBWSZTWbS54ocAAHN/gEopzcBABn2wCCcAiq/3noAwAPYBgAGjTQBk0BoMgNAap+pE0/VH6QmhphGCGgyaGQFVNRTxQek9TRp5Ro0eo9Q0Ae1NR7Uoa3WqsRjA61H0CPIAAFIIJBClhBBJaUmuCS4diUps1BQobBiwdpDHAaEEG0hLyhFJuLhYrblLe9xYyqxZZL/XrOZa42p0ODnb0xQUknwTG1KZBJsKzMufxUUMFZU5BaOBYUk1ZmSQTNa/NqQhihCL4m0YGC90lq4howJP8XckU4UJC0ueKHA=')
 SCREWS_PLUS_CRC = CrcKey(0xBF4D99A2)			# CRC object of a section
 												# BASE64 of an entire section
-SCREWS_PLUS = LinesB64('QlpoOTFBWSZTWfi9wBwAAQCfgEDmf7ALBgmKr/feoDABYYGEp6pNEAaAAAAADAA0aGjCMmg0aaAwKkpT9QmajTBMgBkaGmEmEQViCRCACQe/QpIJSFJlJrwzaVVVWudE2aqqrOoAOEAWEAbwqqqqqqqqqqtYpBIAvAGsvwBbLIR9DLcUVFaCCgDUSIxkUBE5DUK5Vyrl5YpLnU1O9hYGttZ0mR7UHT+tJPJYPN463g2Uys7QzNDO0NLmzNz3DdJNSSxpTCC75LQdQcUnSSfCb+Sfia0sC8vTiln8mBLnCCtrEncGJUScOepJaC4vS7IZsVqpVVTkxmUFJyNj4STe0h3thhxypUpsYFkzl/S0k6MoCuF3JFOFCQ+L3AHA')
+SCREWS_PLUS = LinesB64('QlpoOTFBWSZTWeFp77cAALx/gEoh7eBABn+wCCcAiq/3noAwATY0BKlGRhA9AQyaGGkyYBGDREmzVPU/VDTQDEaBkGg0MCopJqmyh6TT1M1NqMmjQA0aZ6mo58BCCqpqxWBmFrSaSBz0DwmBAQBYjIyMjIzFem4qqq27akm6ocye5RRNHiYMMHQ3k7XU7eknE7HWUrJGQqcqYfOrRhsMGbIrWVqTJh8HYzZvi/L9JOApqcUo7fOochgScxJ0Ejh/HCs/CEbQeELgH7NEnUmif1NyZA5DWnimp4JmmHveZM3nSbUnkbE1mpgrRyHoBU0M3rcODYrlVVVVVVXhdHFvN7oYTcbXMlOL1A/4u5IpwoSHC099uA==')
 SCREWS180_PRO_CRC = CrcKey(0x5D997DD1)			# CRC object of a section
 												# BASE64 of an entire section
-SCREWS180_PRO = LinesB64('QlpoOTFBWSZTWQ3z6PMAAJ+fgEDmfzALBgmKr/feoDABEwDGmg0AMmgMjTQxNGCU9UTUANAAAAAAqihNCM0nqep6amTIZBpjKVEEYAQSEIEPfpZBKS1FDXXRVWuc5qqzoEHCILCQN8VVVVVVUBIakN7XELfOZTM6DEkSXEm5JQvSlUXlapYpfLYK3GUMutUG5UhvYejavlqWLGxaxa3J7ocoLRUZiE8ymIUodhlB8I++5QQ2mk7FzqZih0iE8WcsQzpgdMbhVEKCdJsrO7QdiEncwcUHNchewK9KUpwZnkeOVMGT1Ibf8XckU4UJAN8+jzA=')
+SCREWS180_PRO = LinesB64('QlpoOTFBWSZTWXvEVBgAAHN/gEopzcBABn8wCCcAiq/3noAwAPYBgAGjTQBk0BoMgNAap+pE0/VH6QmhphGCGgyaGQFVNJMkME0bFHqNGjQ0Ae1Ee1KGt1qrEYwOtR9AjyAABSCCQQpYQQSWlJrgk1HYQQkoxTJptg3L2BDdeciBBgQl5QiZ4GQ1GVkbVTg9xY317m/eu9bTMzuZodLi0uCgmVEnwUGCVCCTYWGJqfxWTXrCtzjOOJlKiiwxJIKGtdi0IQhCEWxRyXFy1rMzSQ5LiT/F3JFOFCQe8RUGAA==')
 SCREWS180_PLUS_CRC = CrcKey(0xF1B6B503)			# CRC object of a section
 												# BASE64 of an entire section
-SCREWS180_PLUS = LinesB64('QlpoOTFBWSZTWYHNesIAAQCfgEDmf/ALBgmKr/feoDABekAGqf+qqj0AnpoAQwEwJgGBkGQAGI0GQyAwKklPSmptqT0wjaiYjJowYJcRqUKSUCkcN6qWLWVS7B49d6wACun5pUgBTZkkm6iSWkkiqAAAAAFcJRPiSSqSTTL9A2vwORuxqlVSqrMkzDwWSxpxVkpZVldqXFKLosztzBoYMn9bEmL+UHPfeSeC4eL9ZO93U0tbY1NjW2Nrk1PV5h6yTsSXNqdALf4vBmDgk5yT0T24p8JuS4MTFOCXb0wSz6gr0Z06wzqiT65diS8FjFLaDVnvVKqqcXSaQUnEyeaSf9tDtZHR0ypUpkwXTWY87yTm0g3fYu5IpwoSEDmvWEA=')
+SCREWS180_PLUS = LinesB64('QlpoOTFBWSZTWfPFKbYAALx/gEoh7eBABn/wCCcAiq/3noAwATY0BKlDIyZG0CMTCaD0CBiYGiJM2qep+ohoAYmjTTQ0GhoCopRqaBoT1G1MmmmCAMhj1T1InPD3qqmrFYGYWtJpIInIHBMCAgCxGRkZGRmK47iqqrbrqSbKhzJ1KKJm9TBhg520ng+Lw6BuO11lK0JNAqV86vKmDscJXcVoNKmlGGp2snEydz8v0kbFM+BSiOuIOBuEnESOCR0yHS0/iEawfELAHiZpOtM0/ibE0A1G+nqml6JkmHU3kycKTWk/xwJvmlgrNqOIFTMyex0+1wK5FVVVVVV6Lm3Nptc7CbDW5kpucoP+LuSKcKEh54pTbA==')
 
 # def:		N
 # upg:		N
 # grumat:	Y
 												# BASE64 of an entire section
-HOST_TEMP = LinesB64('QlpoOTFBWSZTWSr3Ae8AAEQfgEjkeFALDBkKq2/e4DAA0qgqlEaDIYgGhoAepoJFJP0kYmQ00AADQMNDJkDIxBiZNDTEAqwaPHCQevRTMo55swNaOFp7blKALBTGFEhjbbbuYMJZB3C0FBqNl94VEcWG+397mqEWWJLfTIZWC5ed4nhJ9/e2eVKOpvVxSfMEEBZNEVxjYUzKT4KdlOKWBNlVyDGWAFCOV0sdZoiek5poa02pUVQ2wqT4YG5ao4GZWSgMh0GV60bYGVLYiqCS/i7kinChIFXuA94=')
+HOST_TEMP = LinesB64('QlpoOTFBWSZTWcPVdqAAAC1/gGsqAAZICHhQAC0QCqtr3uAwALUCVSMDQAAGgANAJSACh6mmagDQA0aaGGhkNMmgGIaaaNDRmdy5xmxc2NW0AkKJKWqU2sCikC0PXPDAtcM7QHCcnLvxUW1whCXJQlAnBRsIDk8KllujpXAqUeGKBxBiDHtxgPeSIuuSGhAoKCt0wijpBkKQoZigTQtQmLysKVdUIjgYfhRYZINKkkINFn8XckU4UJDD1Xag')
 												# BASE64 of an entire section
-MCU_TEMP = LinesB64('QlpoOTFBWSZTWbAITgQAAE+fgEjkfBALBg0Kq2fe4DAA20DGTTIGTQyDI0wIwaak0AGmgAAABFIqfk1Jmmo9T1B6jag08k9SgvEIHOEkdT9rMl0tYIb87zYiCUqCclqFA4oEEkkkmYoCgUsGZEYGrC22V9ASiQP4skm2+1Q0oaQGWRyMrjMg4G5gdx4J9BJOxdAGtl+E4nALgwxUoNqpT+pSh1WeqHieWsQwVmWwU1l2Qmtdp8hx4DmQNhsmKRvunM5hf5rMZGhBvinpQmBYMkvqSf8XckU4UJCwCE4E')
+MCU_TEMP = LinesB64('QlpoOTFBWSZTWZq0lxYAADR/gGqqgAZKAHwQAScMCqtj3uAwALWBKo0NAQwmmDUzQAJphopp6gymAgxNMAAJhJKelMTIHqAAABo9T1IEafeWxtTERFIRALBgzM1mtilEIjIhMBbqGhtKgRikdKJycUyUtKr3DkjFWuruhWnCA+EAbnR4G0vgi6ocJJGwToeUIUkS4yAxRZhSJDCvVCwVimMi0VKK0NO0dRsiKAqCQx+Q5NEUMrYDn8XckU4UJCatJcWA')
 
 # def:		V1
 # upg:		V1
 # grumat:	V2
 BEEPER_CRC_UPG = CrcKey(0x0A30D791)				# CRC object of a section
 												# BASE64 of an entire section
-BEEPER_UPG = LinesB64('QlpoOTFBWSZTWXhTz6YAAJUfgEjlcBA/Bl2Kv+f/sDABUZihkSZTaTwU9QmT0BGRiNNH6kGKNIjTJo00yAA0GhoaBKKMg0TRkxHqGgaNABogCR67qUG14YxIlhzgzJg4hrELl0jcKbZ4qIRXNCS/Yz3UGgEImk2S1zVlyZ7RgFxIRqDjgKQUqjLyEUkkkklMAgUDVldPfEJANBIQnDw5R5MI49G8iLlSVbjaNMGIlCVDpkMBpIKiioEhbWRmdxeOGFlrjFl4kAdEGZFR6nYVKhZoR8xBsjwYfqJsLyRQFQMQhDh2yYflzjLLRnk2hYORzDdgtbSqHA+CQub2W9L+0HJnFgsXEmQYMxq88A1oYgRAo0tYSOT2AOfHV6d9Xcvy0yS5jHXgZ0sNwQnsKRhEUNgYoYlINnEiIxX10qS2Qo9CgrSSEuqIiBA8vuG8qNhjCaJQt4pJ4UrO/OFE8TWp/xdyRThQkHhTz6Y=')
+BEEPER_UPG = LinesB64('QlpoOTFBWSZTWYm2y5gAAGB/gGpoKIBIZ3AQPidcir/n/7AwATqZgaEII2iaPRGhoAAAaAaBqNJtFHkhmkDQAAAAB6gSmpE9RmkA0EGABoAmmmmDdYvyVJU9pZoh0ZHG5ww0BJITQgOSaZMRMhpzIvPY7wKpQuKHJagoK5mPR9HkDqr7zWPelsw161qTJlPE1sp2607yEPMgZSkOKE4zloaB2No8m16otZQPNvzxN1MeJkJnkvOqTnAsERe+JDzGgdKmvo/RN9CSBzU1VyoxKR4eiIpCRIJGdVTLbXb+RGBxFtpNWg3lCPqcGEOxqYlmtxpgIgnmBKFCciDUgEKJMrCNjrtG90DWRfRedATY6xuyoIpBS+TloswKxKAxg2vpRNcMQz0EGicQKD7gGj9BMKSQYCbFaOOUnsxyWAhJahMSYChlL+LuSKcKEhE22XMA')
 M300_CRC_UPG = CrcKey(0x129997EB)				# CRC object of a section
 												# BASE64 of an entire section
-M300_UPG = LinesB64('QlpoOTFBWSZTWZA4lX0AAdSfgErl7jM/51+ur+//vkACzrGDbaBhJSaU8k8ie0mp6J+lAaMIYQGJ+qGjaQJNUSmj1NB6hoA0AAAGgADQ5gAJkwAJhMEwhgCMABUkgTQJtJT9KeoMhp7U0IxHqY9SYmg0hJ9JMZEwuAkVBf8gtCsNUvo3fmMpgkIhonPsK6oLlRNz4Laj+vMltHiLHCMTN8UtrnHX4geHhxfLyoGwJ64+OEk48TabhW8oERjbaaCawOs08optEm4QlJLXeFzvLGYGBgw0UqhWygWgBUkL5ES0pIKxUvHEMKyMUEVVVVVVVV4CAhEY+xeuDIhoEQzK7VHNIuuOBsyxqqLrlrlVKqMBiUKeOekyL+LqWkfqnclFj2JW5MnuLo6VmqD3JtPUmtO5O5PYZaqJ2FfJ0MieB4JjPM1WUTlb0e/ZOhVEqOpPglonY7y9Lh7Ss0rXiyMUvnFKhw4Hl5mtFCfi51imC8QFOtybAFi0gfgr0W9JbANZH3/oaT2V3dVMULsZLDVErkhirQ/vCpCXyyS5EZYUso008+i/50lbTFqs+uLsHKmxGnfHWMawaji1Di7HTa5oxiP6gUQ4qxpIwgpUgHEillJrNZXN93LkWJoPTVu9t2Ri7ZPI57tSbEwpUhryuUq4qSL2diXxfJLSTg0rsjGd8YEYFpJ2Hb8cZNErJo27Sm5MG+prv3Rh5ZnnSpMHI8FEzRvRay8tRtp/y5MGy4tHGweTZ1smMk36vtWlqJtjJezSdGUk2TP6b9Y9vX+e3dvxdT6MPeXJPwTrdHj9dUpUwYNj5wq1qoon+LuSKcKEhIHEq+g=')
+M300_UPG = LinesB64('QlpoOTFBWSZTWeJZnFwAAVP/gGviEYbL6e4zPudfqq/v/75AAlZwACOMmTRiGmhgJoYmjTJiBkYTRpphBkxFEaPUNtU9T1A8hMgAAAAGjQADQGJKmRiYmmCMCMAAJgAEDQZNMBVFMhNNDSMknij1NlBo9NJtJ6htTTTR6jah+oajZSimYmKcxAAypZK0qudLDEFZEAERkFEsIgiRcREFwBRQCqgmSEEjITJJSGkpyCiMF1Bg55Ac4uYgB6mCJ5zEEgaD4EMT4opB4RORIhfv4zEBpoD7WByD7D2X9lPj1vS1XLFEeTzeaZsaHuXnd+aLNbpLDKGZ70YRvYcZ5z1W+7hb5Tcz7a4brsXCimvM28LJCqnfvZM/EV5NvK5eREeVEWnk0o2KUo/LgJq3K6S2GpEniZyyE2GgwuWpKUUpMzEyeObh0EiXJHQZjK3iWWRD1owRJrofyidSMztKI9qNB+qMEcyOZH8GiOHjM/vdpmRfKOw6exH9Zo7YEw1I3IshG19BVFB7SckWri1GlFo06T5d3jbyMxyP8RhHwinOO5E9Q6nP9fceV54w3kumGnwRVstsVvPRSx3+ijFYa9eS2vwlE2Zy532LLWyWKGvrhkLptXnqp/zFjbl8cqRHhkixxN/xEXGS2LrmHF6U8rj275rHP9LRV8jmxwRgispjC6iU0Kr6EZNc7YVipU2HB67YjUibmOJLFFWiYwrjC/ZKYijfOpehpQpYqWSYysRVmzaldHAtwhc63hjeNXzXX5rXgr1nQJlA4RiEv2CSRUUdr06mKZAHoLuSKcKEhxLM4uA=')
 M600_CRC_UPG = CrcKey(0x3C69AA2A)				# CRC object of a section
 												# BASE64 of an entire section
-M600_UPG = LinesB64('QlpoOTFBWSZTWezuoV8AA4efgErnf/I/r99+r+fePlADXgAAABzTEwEaYEYRgAAACYRgc0xMBGmBGEYAAAAmEYHNMTARpgRhGAAAAJhGBzTEwEaYEYRgAAACYRgFRSJoQT0SeKeobUYaTaj1NpM0TJoaek8p9PeO0YMFwYKYm0RK637PW+vENIJxmHK8DNJP8edil7FSfRrcLUbWGzK2sLMVbk7h9gNzcUpXmeMVRYzhtaC8l74Rywk5g/jh3R4uTI6FOPrxpSOmwls2XLRWrXr2Z8Fb4kYfMiWSycFgqopYW5ybWQxC222222220pVW22222220UVVVVVVttttvRBKklVJsPK44TUPQqemrTh8umMYUibw6WvRr0uWTLdoujN1jW63S3psdjN1GbIZOp0Op4mjpa28zYOBtVzOeGtyn7q856DqMqXsN98HtKe5vFJ7z2HCORxJkygm5N92tpsRqOAzfBgzTgPeald0nx2JD1E/lPkVwGHxNjid43pEbP9qN5StRxmI2vmnOmg8xrTNkchKbjZ0ZtauQ2GjRtKk+xmTmMmpWRXOKle5MMCpWEwTEwT29iRH6PZvn3FHE+rpST/oT5QnL8074J84fU7m9BqPCHI8qqttttiD5bVLJSqVYL3Mq8mAxCag1Q84NsJsTmfm7nFtDaH5RE4w2TVIJmGScSSbkfi+0ZQnjQmY8QbhDKCWCcrwTvMkJ0wTwaOGE/Ab8JrXyJNgZwm1JNIc+kqzDgh4NUKThqSfflrgmuTfqI8g0EeYaoJsSaoevfHML6mBGMO1Xap2qj2DJlMM3phmzZGLZe/YZxiJMFMFkv/i7kinChIdndQr4')
+M600_UPG = LinesB64('QlpoOTFBWSZTWazuu2YAAm//gG/3mEbLY3/yP6/feq/n3h5AAsR1UACGSonkQw8p6ppsgRgAQYATRowACNMCTVImoNBMmAmTEwmBoBMjEwIYJowDjI0yYmgyZMJpkDIaA0Bpk0MAJoDBUkiNTCZNKep6GoZoCGCeo9QZqepm1EbIE9T1PEbJ847ZHYS/VBLs1T2NGRHgDaJ4sAaaRIAkd7kJxHXXhdisggKIC2nyz3LgKAWRCYuIGNKIJBYhABcAQgYCTHoUFggggxVEYkmTiwqAhkiIwionsfTOUm5o6DcsAsK7KgK2yql7QoAGqyXkhLaqyLFAFHy/n7BJEaURUPW5Gt05hpKamc52pNb/mNnXmwswuVKDKItR5gXAAvzAERGI8BhAIhUXwyMYr8t3qhHfhHYMUOxY2pN5qOEtwJWfZihOATINIsldY2qLVdgaJjUGqormJxjjcn8M0yuRicReuFz0NneaHEwbn191lbLBY0s6nydqGDsnsU3zuniLlGszOV2Sj+2UonuNZsjdbSXNKZmN/jIWGwZy9yrF6Zz3GJTGPvJ8E5imUx3OUweDS2EZFFLGiLGDmTdTfYCmCXrjUSjQWYlNoxl7I2DQvJtl7EpcU3BSU8iWWFJSyWJaWJv/DUym4UPudDphOGE/VOGHOf6wC864bXVVUpUqVUHEUFQlg/aHSDCExpx7fQ/pkDIGgMJYLJ1w3mmEsMwZ5DbdadR1vqZoTJCXsA3YS+G4xRVWZYZIfYL4Xw7zviLWcCnApJwPILlpZe5oa054WlVZSIIAWFC0FFj7i7kinChIVnddswA=')
 M600_CRC_GRU = CrcKey(0x98365BDC)				# CRC object of a section
 												# BASE64 of an entire section
-M600_GRU = LinesB64('QlpoOTFBWSZTWdT3R2oAAZyfgELlWxI7Bkp+r6feLkAB/Gh1IMBoyGgwgGgGmgABKn6qgDTRoDI0ANA0NGgRVRpo9QGg0AAAA09EColEQ1NNNDCehAyaZBoZO13O5mZ5RdLbdGkvEhMdj4vk5BsiR+VbW8r0y3GTLL/E5EOJuq/BxqpTUcLzROVJPad/HEdVgtmXVJG17oSpYBcYC5CGksliCggqqqIiIiq222223oSLJFcqTQb+nfmZYTgHU2ND6Cq3OMcxzm8fUajsVI7R5d+kkebRI5/3RrKPAZ6+4Y3KV2GMKVhiMYOvqcIKSVatWrKUJzVbKDuqRFiLDsNIp1AiH4uLKFQGNOhPslhLJH6ZXXiYk1JqN5OFJwJOayaAwGgRmG0SopYGQYDgVMKET4SC4lSUcAgVxSsKTlQ1BIqUil4XS4kmxdiaJNsSbBrOdZjcNRxehJOnTgSODdYje2onyGxI1HhzEn+D0Hi8WPw7RWtsu02Hmhhhg/4u5IpwoSGp7o7U')
+M600_GRU = LinesB64('QlpoOTFBWSZTWTA4nXkAATl/gEvvFDNDYXsSMidKeq+n3g5AAauAENSR6Jpp+UBNDIxNNAAANGmJoGnqpAABoAaABoDEAABzTEwAJgAmAAEwABMCpFTJNJ6E2o0aaDRkyGRp6T0gGTaaiTtKk8TLTLiiiUtpAbcfD5GqshF0LmwCvEDIwwSAA1AZJqomGYYQFQTiABCABCHRmSdqTYGQKJRFKKKOO5MhJ6aGrsqp91y1y+8XT6tLrcg7WLpKbl1Vrl1K7096GY23QzqUUYDM8ETnRN8yCjdT5M6Sx0PW6GI6WLrxOsUpwtwaDyHnH2GA6moauLjGLVY7BqGDMopxFrKKWWi1j0fjgaHc1pNaTlTkHcdraTA2DeTwTlT4lpSTITINZNpJlTp3/8zJmTdTKtLTaTYNbeSZEzjQ2JsNtJlSWxTgSYpiNGWKq2YYDhGA9SJ1BsHM5lud+RpNMY1VVVWoqQwZQYc/i7kinChIGBxOvIA=')
 T600_CRC_UPG = CrcKey(0x48D0D9D7)				# CRC object of a section
 												# BASE64 of an entire section
-T600_UPG = LinesB64('QlpoOTFBWSZTWbuLrJkAAU4fgED3f/Ivr98ev+ffOkAB/NAAOaYmABMAEwAAmAAJg09VJkAANDQAAGQAAAOaYmABMAEwAAmAAJgVRJM0p6amhkyTDU00DT1GgeoGjE9T1LUDvXNBZEMqeJvUhrdC0soT+3tUiGRlRijuzsmnSsYY5rE2UVm22is2V4CI2xBhImQZxOM8kAAAIQAAAAVEmGQhkpWNT+PBV4r3RNSaS80Dp18SaWrXqdZK1RraXtet2Gd2KupYuLmDsNDA9ZJe7TYoSVNMQtNh7nwVOFc+JQqcBQudyJSWmJ3PH6YIedG1HCcC9ui+IXaHhRG19TQYwjaYnKaBLpOUwRqMGUsZxVGXNaoleVLmRYXKQUZC8iw7tiIelsvOJKGIznk64dLcZ90Q7zyPYow+5ldUCo+UJ3PJRksWJOfFxkuheqzNT1MWR/i/aZ24sO1BLImIhV/XIlpholxrTS541EWIJSTEJiGDcUIl7Ih/ipc5pmd6kWMp816nXBzuqGpyN6OOURryuhXlXuZkiGPDKFWaMVsQxgwbM5rMsaGZsb3etf8XckU4UJC7i6yZ')
+T600_UPG = LinesB64('QlpoOTFBWSZTWSq1UFIAAM1/gG/hegBAE3/yL6/fGr/n3xowAZMADmAIwTEAwCYJoyGhgEwRiYaIp6J6aRkAaAAAAAAAAAqpqARok8NJA9T1AB6jamanqGRkB5Mk9RpigHXVLVQbTbfXAb5tIcWxkOGxxxRAgGGTxgE8Zm8YJJARnwEkQCjKCYX6BEWEhKEEdOw0bazDZgkdxOFZS0LGleUEG1rTtB5252vy3ssvZEQ9t7QmmoUL5S1874EIaWNrdDUZ89zUvOVOsKqrFq7yEYDoIL7vGxMQVlBsNjC+iszOkoKy8TFT6pQgpMBqWHzS60rSitddY02JdTpMZgEQdRgMhjEPEZC+lcX1pOyCtKdahWVFKhOUoUFZKhi6/MrMKEnhG07Xcfo3HoTOYqb25CEHMvELmpwWtmPatUv8fIxOBgSnVN7EhyJy5kTFTgl3FJSyocU7lOdWzMTiqZXIoY1ClaZpZ8Kx6nFedT/i7kinChIFVqoKQA==')
 
 # def:		V1
 # upg:		V2
 # grumat:	V3
 PAUSE_CRC_DEF = CrcKey(0x02F92B18)				# CRC object of a value
 												# BASE64 of a multiline value
-PAUSE_DEF = LinesB64('QlpoOTFBWSZTWb/Z7qMAAgYfgFLvf3Y/r99+r+ffXkACnGgAAcwCYCZGAEYmJhMJghpiaYEVP/VUyGRoGENAAGTQZDQ0AAHMAmAmRgBGJiYTCYIaYmmAVJIEBNEYIZTZT1Hkj1MTTZTeqZDaT02qZPj3eOfwutdffgkMF7BgsvkNhuN9S5D1o7Vn1S5MWKmlvJznOsXPO0t95IpGeenT143zV6bXR66thjcwvtjVmVsrpmIfZ3LOIjeJaLI4iqJKSciqFgdAAAAAAAAAAKqqrlkKLqkmxzv+Po3mhtWeD7Nra3nsqfhay1TU6iPRddbCqtdd2PcMGBicz3HwdrtamTtYsWhZThepOV+ij4pSPgTMm1O4oneyKPkfwTUik0yGlGh/KZjSmZi2rjBLFi9tShqNpipMnmUifqT6IzEppLNpMmxPxkMvCjOmxMDfPdeaE+aORPUjJJcmczlDYYp6LzhMjBoYinnTBMDjL0xSkuKThdj2anaUpSlKP2WWRPbrPQKJ7XAdCGg+RnnjIfM97Y8D6vE3GTpbziWItdSVUjyd6+n3UYt5SyyYnQ1OR/Z+ZxlzgcTyf0adTW3OqI4WZMRF7fcTW40OOTpLlxwMIi5aJLSFSG4stEdchochzPUxUpwHE71nK1DWmZK0OhoNblIzmpzNBebicdImx2YMUxqQztchi5GZGTGQzmJ79bUuMWc1nrPMcCOryVe3KWWdbOdLJX3iqj/xdyRThQkL/Z7qMA==')
+PAUSE_DEF = LinesB64('QlpoOTFBWSZTWVrPfcMAAXF/gGdtxATG63/2P6/feq/n315AAlZwAAcaMmRhGIBhNBgE0GgZMmjJkMIDEUmajQ2k8oekaZANAAGmEAAGgAyDT1SU9QxDATIMTCaYEYQwjBMhoyMgwVSEIyamU9NMkZMgNADI0ANGmRtQDJiHggAhpkxw06ZUMgiqJSTSKpjxIxQEkRQscZBlIjKOADgMEJCFFEzJwCBAIQAAAACEzNOmN/znhz3MhIRacrNJyc/vDPIT6AB8bsgM0wBQBHPx/XuTnSnKoooqTWFpiSY0Pe/iJorVpLm4jdN1Mo8LI6EOyhNyuNYVNDK1FGNuuY/C5ncib+uVdGtKPYlE9LSvdVZZOUqU9ydVHHwio9p3nCcbzOBkYHAsbZgXKJNDYRsO6kbyJIcRGFGlGqSI+zASOQ4iL0JIuQtVORGAuRe0plSJkyt7ESF5pLEkYGZIekj8IYSJMRgo0kYW31EYS1GNFDJChrrUfdDQjYKkkYERUi0tJDIYEUNUsKlysZEVorNYrRYiSKEkarvOBaawkR4myVm+eZ6zxrn7P05jpOdvNRldDfP8kUY0k00Vm0vZ3tOcznD2szXdD3GNkdLOsRlUZWhqNCNsm6plVqJjpKJrWuddsq0kmQzPUm12IXowouWmJnYTE660qL01EWKNVUzLy5amVLC42TGbiHQ7Ko6U0n1cTNKW0nEXk3/F3JFOFCQWs99wwA==')
 PAUSE_CRC_UPG = CrcKey(0x12CF51B3)				# CRC object of a value
 												# BASE64 of a multiline value
-PAUSE_UPG = LinesB64('QlpoOTFBWSZTWZWiJZAAAqMfgFLvf3Y/r99+r+fffkADHGEAABzTEyZNGEwTE0wCYBDBGBGASapRoQPUADRtQaAAAA0AAc0xMmTRhMExNMAmAQwRgRgCpJAgBEyn6TRpNlBo8o8Q0j1HqB6jMpk+PdPn8n+NNL1rl+F+DESWXsWDrdi9iScJ5j0KXInQjrWf2lya2RTJY8S5wpNWqq525SlHOwGLe2uJ5JFCb2yezd05XxwWUtSGFlVyhUlTcaBdaXUpMYIT5O4oVl+EiSheL5bkJW3iVDgt0FVVVVVVVVVVjFVVVVXXCRhaSQyzaL4SwrMc8Ch7nwYCwrOBhYxaMz8I1lISatu1ShVSrLqu93qK6yYsTIwdZ73UsdTWydTMwZNCynG9aPS6VHxSke8mZO9O4onyZFH6nwJqRSaSTSjQ/RMxpTMxd64wSxYvd6UNR3mKk9uZxKSHSHgjOSmos7yZm5M/lSJm8aNCbkxOA7LzSngjkTmRkkuTOZyhuMU5bzjMjBoYinEmCYG8vTFKS4pxqKdyyyilllnS6tbrKSlKUo7FlkR27D1CidrhOhE0E/Ymef8fMk8B8W5/poPFkeY4jO6E2rloksupKpDyd6+n0WLExbVJZZMRztbe5T7ibibC9wON5PA1a02J5vsSTkNLOmSJMTFwPqZGxvRN8jnLnrvJ6GSSXpZEWJKJOA8y5ckn3kmxynM5mKlOAm98FnKw1jYkzJWh7WsxJTaSZxqZPZStAwHmHJSSbXuwYpjRJoZiTF6W3OkZmRJoMh27GtcYt2k2nOcJekfy/p6fJWLzUvXLmD8E0lsFfazq+hKpH/i7kinChIStESyA')
+PAUSE_UPG = LinesB64('QlpoOTFBWSZTWVvEL9EAAel/gGftwAbG63/2P6/feq/n315AAsjgAAEU1PU9TEbJqaDJo0GQAZAAAAAAAZqkp6mag0YQaGm1DINADJoA0MhkaaAxxkaZMTQZMmE0yBkNAaA0yaGAE0BgqiTQTRMU9NJ6JtU9QGjJo9Jo/Ug9Q9TDU2UDNGKEGD8BkNFhntoqnnCWTAl0sRIS7CsZdFwqRBIJgNApzAwtCNRzqE6jQkpJpvSQhDpCbcBjEDEACGIAAAAAAQ23oCSl1/8BksRCLWQ4QT5YoLirwUI4xxIUaAQxRkBbo3I2pRoEpAep2dH8tlKRZVTri2YoqsWv4ehVkMo3ku8hzvaiiMy4lcodZY8iIy5Znc0JSk3LRc5W+7UQ+lEKPe9ii4VUeBwO8irU3NRHEyuF0qPc62MNcxzSUmmxwtLyM7wXpvpSZsssfO5kq2VdHpIqYFz0nQ8qhztK9zsFraYMViWxxocbwpPMiUPWRgjqRqJI9i8k6T1kZkJRihkVdKLzFGZ1KFUUKFr80SMx1FyUXtaSNwf2hgRLKX2OojByaUYGRGdFhohYbGRH9Id9HGVSi9EVRkMhI0F6LDUXFWK0aEWotNZai5EosJakkuVRRJKiijxOdicAkj7G0tI3EeV7zzjlZXtMD/lx3DQdj70Z1jtec+C0oRVoSiiiLhyN5wO+dhGkjOej5d9sdrmNCNKO5xGK9GpaWtTYvM7YhyFHERqXLEUI0HcVWMziNratSloI1vMo4WYbyIwRiymJEt5gMq+NqcgtGZRVF6xvqta8YsihVcYm0znhRDmfq7XzLjuVWKLXQj1Q4Jn5FAzluCav/F3JFOFCQW8Qv0Q=')
 PAUSE_CRC_GRU = CrcKey(0x5EFFB30C)				# CRC object of a value
 												# BASE64 of a multiline value
-PAUSE_GRU = LinesB64('QlpoOTFBWSZTWXuLJn0AAzEfgFrvf3Y/r99+v/ff/lAEXgcgAAABxkyZMRiYATJgmQA0YRgCGA4yZMmIxMAJkwTIAaMIwBDANT/VVRoaZAA0DQDRo0MgaDQAADjJkyYjEwAmTBMgBowjAEMAVJIBAmmmQqfoaKPT0o2mptMo9R6an6mUNppqe1TN9P39/vU+tv2beeWurBfheyywyyUzSC5hgrJZv3qpqfk9jYssyZM1Pga5ByPBNynmXpJ3Jxo9i16980wTiaFGjRcunUP2Omrt17VRdNalKdHN9LxffZ3KNRkh88XW3Ox+h8DkYvsDBIeWLt1uR3dXs2Xzr7rXB6aLMMbmF9saLVWVjKrprSSdjmWbCG0WZu2ZWJSUhIShsa8VpjSjdxZMKQAACAAAEQAAA3KUhQuqSMsHO3p6HkHaP0ODNZYeIfR/RO56HPPVU89WpaptfeQ5rl1sLrWuuu/DtV7UYuKZGZi9p7nrWettZN69i1rKcmtkUh1vxWLH+UpHuJonenvKJ+bMo/0f4JtRSeJskGxGt8E0NiaMXeuMEsWL3elDad5ipNbNxUiPUk+SNCU2FneTNvTT1M7QqoivnRqTemJzl35Ua0+KOtP4IySXJoaFDeYp2XnIyMGpiKjimCYHUXpilJcUOT3LCyyyz709O3+tKSlKUpR+Ky0kUUqiqKKUolinr3HiFEwescHzLjsHsUp9CzAdwLhuHyGU/c+sg+Q4+4ch9sfi3aH1OYXjA8BseNmnFcptcfD7YkMDGpKqQ44O9hTIeG8xVeNSzg0uSjoRgwDp7MEL3ocnkeY9MTrGxNrzHUXMl7a6Tm5x8S3MmcnjJ0nlOSPREKNzZBoIZ4jtOl4cSbrO0bjy9KpJO2F9DW/N5jBzqS8vUXmKmTzsRsGEQpF8KhGNiykVBdIKkHSX9ReOj0sYhUg4j+J0HP52r28HZsWUvHjU4qJ5WDCOCHQNVKg123P5HPmKHFBn0mxDW5i+81LqVcOVOF1kqng69QskvdVpIWTi/DcZtTCyg3aWkGDZIMx5HFrBoykGxMh1cBwLuc4Nii4NFlxRdTiuN59x5NOsxB8n+3b9lZvBSyy9g9Scxc1r2i3/pCqif/F3JFOFCQe4smfQ')
+PAUSE_GRU = LinesB64('QlpoOTFBWSZTWVLd2dEAAl//gG/vyQTe73/2f6/fer/33/5QA+9wgAAACKh6htTRkPSMhppoAA0AaANAAAAAA4GjRiDRpkwgxAYjE0aNGgDTTQAAABp6UqfqgaAABoAAA0AAAAAAAA4GjRiDRpkwgxAYjE0aNGgDTTQAAAAqiImQE2kwptU9MmiDRpoaAZGmgMjI0zSBp6htQigwEDMCgYANAxI8+wM46S8QZGiVtDMgGzHy8CEaiRf0CiwI2YsLtLXxbdGGDZpNOvbsyboiBxpSk3SgUlIBAgBCCiNAAIQCQkDbAAQoSVyRFFCTP6Fk48PIkORHtVQmKSgRsNauc050xEkKaBttxM6pJNCFGiQqEQsYCIif0vt/g+51zz5OJutnExwicU9QFQmqSpJVK5VzKgmmuXL0vMbDSjQl9Laj45PEpV6UWI4S8kvXqqx8w/s2TXPY7MlYypSlw8HRYLLKPrSZC5B6cTqOc8xrOVh1XqB3AUa1zILHXcbbxzPEtRjNlG9nR9jqDiHOaV6ig2joZo3zDwpin3o67sM7QuupMTWvhe4rbY8iHl1otPEXPzPK7qjxsFzBY3oXMyqW5mXkoN73VCh86JQxvKRkRzo1EkeZjJPOXfqRoQlGVDItfUi8yozudQsRQoWvAiRnOcxJRc1pI7aI/ZC8iWUuq0vORjcmCMZkRwIqaSsyXsaPQhtRuLEouRFiMZjJHAXIqajEWMi0THAi1FprLEYkSipI1PgUFFFFHtI9B4mU2iSO47Y5H9FTtD30pdBRaOwqMw74uf4fQMO4NQ9VveZ7zoNAsFp0j1N69H+7LJidDZ065d4qOnSWpsGJRqY6ok4RatDbvtQWPYbHG5DphHUGZGdym4q8fZtcDcYcI8BgjHEchG85jciNDLAyLrRym506yM9HKM51tszyiyRld1zGIVKpKoxLBkFyUKwSW0KJEwNZXYWjC1gOsaTR12P4drdlUSsHElqSR1VkMEGoZJTAy6HM05hI4S/WZkGVwFlhszliwbJcNaImWMURqZSxiWUSGWxaOJa2mQaBoKZjQvSVC5RUkrKhkOY4r9h2gd99TxvbXnSolYteRH4xD1pnMoQwMSrE/8XckU4UJBS3dnRA')
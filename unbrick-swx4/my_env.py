@@ -6,9 +6,10 @@
 import sys
 import os
 import logging
+import contextvars
 from typing import TYPE_CHECKING
 
-__all__ = ["GetMainScriptPath", "GetAssetsFolder", "GetIniFileName", "GetLogFileName", "GetBackupFolder", "GetLocalePath", "Debug", "Info", "Warn", "Error"]
+__all__ = ["GetMainScriptPath", "GetAssetsFolder", "GetIniFileName", "GetLogFileName", "GetBackupFolder", "GetLocalePath", "Debug", "Info", "Warn", "Error", "OpenThreadLog", "CloseThreadLog"]
 
 
 TEST_MODE = os.getenv("USWX4_TEST")
@@ -85,3 +86,26 @@ def Warn(msg : str) -> None:
 
 def Error(msg : str) -> None:
 	logger.error(msg)
+
+# Owner of the messages being logged; threads started for the owner's tasks carry a copy of it
+# (see `my_scheduler.TaskScheduler`)
+_log_owner_ : contextvars.ContextVar[object|None] = contextvars.ContextVar('log_owner', default=None)
+_thread_logs_ : dict[logging.Handler, contextvars.Token] = {}
+
+def OpenThreadLog(fname : str) -> logging.Handler:
+	" Copies the messages logged by the calling thread, and by the tasks it runs, into a separate file "
+	handler = logging.FileHandler(fname, encoding="utf-8")
+	handler.setLevel(logging.DEBUG)
+	handler.setFormatter(_formatter)
+	owner = object()
+	_thread_logs_[handler] = _log_owner_.set(owner)
+	handler.addFilter(lambda record : _log_owner_.get() is owner)
+	logger.addHandler(handler)
+	return handler
+
+def CloseThreadLog(handler : logging.Handler) -> None:
+	logger.removeHandler(handler)
+	handler.close()
+	token = _thread_logs_.pop(handler, None)
+	if token is not None:
+		_log_owner_.reset(token)
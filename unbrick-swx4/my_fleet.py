@@ -0,0 +1,174 @@
+#
+# -*- coding: UTF-8 -*-
+#
+# Spellchecker: words USWX unbrick
+
+"""
+Runs the complete workflow on a fleet of printers, a few of them at the same time.
+
+The fleet is described by an INI file, where each section is a printer. Options of the
+section override the ones of the 'unbrick-swx4.ini' file, for example:
+
+	[printer-01]
+	ip_addr = 192.168.0.171
+	printer = 0
+
+	[printer-02]
+	ip_addr = 192.168.0.172
+	printer = 1
+	nozzle_wipe = 0
+"""
+
+import os
+import sys
+import copy
+import time
+import argparse
+import configparser
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from .user_options import UserOptions
+	from .my_workflow import Workflow
+	from .my_env import Info, Error, OpenThreadLog, CloseThreadLog, GetBackupFolder, GetIniFileName
+	from .my_lib import FmtByteSize
+	from .edit_cfg import CRC_CACHE_STATS
+	from .backup_store import BackupStore, STORE_FOLDER
+else:
+	from user_options import UserOptions
+	from my_workflow import Workflow
+	from my_env import Info, Error, OpenThreadLog, CloseThreadLog, GetBackupFolder, GetIniFileName
+	from my_lib import FmtByteSize
+	from edit_cfg import CRC_CACHE_STATS
+	from backup_store import BackupStore, STORE_FOLDER
+
+
+# Printers handled at the same time
+MAX_WORKERS = 4
+
+
+class PrinterJob:
+	"""
+	A printer of the fleet, with its options and the outcome of the workflow.
+	"""
+	def __init__(self, name : str, opts : UserOptions, folder : str) -> None:
+		self.name = name
+		self.opts = opts
+		# Log file and local copy of the configuration file; backups go to the store of the fleet
+		self.folder = folder
+		self.ok = False
+		self.errors : list[str] = []
+		# Root partition space recovered, in KiB
+		self.recovered = 0
+		self.elapsed = 0.0
+		# Dry-run: steps that would change the configuration file
+		self.changes = 0
+		# Tasks that were run
+		self.steps = 0
+
+
+class Fleet:
+	"""
+	Runs the workflow on many printers, using a bounded pool of worker threads.
+	"""
+	def __init__(self, base : UserOptions, folder : str, max_workers = MAX_WORKERS, dry_run = False) -> None:
+		self.base = base
+		self.folder = folder
+		self.max_workers = max_workers
+		# Just preview the changes; printers stay online
+		self.dry_run = dry_run
+		self.jobs : list[PrinterJob] = []
+		# A single store for all printers, so identical files are kept once for the whole fleet
+		self.store = BackupStore(os.path.join(folder, STORE_FOLDER))
+
+	def Add(self, name : str, overrides : dict[str, str|int|bool]) -> PrinterJob:
+		" Adds a printer; options not overridden are taken from the base options "
+		opts = copy.copy(self.base)
+		for key, value in overrides.items():
+			opts.SetOption(key, value)
+		job = PrinterJob(name, opts, os.path.join(self.folder, name))
+		self.jobs.append(job)
+		return job
+
+	def LoadIni(self, fname : str) -> None:
+		" Adds every section of the INI file as a printer "
+		config = configparser.ConfigParser()
+		if not config.read(fname, encoding="utf-8"):
+			raise FileNotFoundError(fname)
+		for name in config.sections():
+			self.Add(name, dict(config[name]))
+
+	def _run_job_(self, job : PrinterJob) -> PrinterJob:
+		if not os.path.isdir(job.folder):
+			os.makedirs(job.folder)
+		log = OpenThreadLog(os.path.join(job.folder, f"{job.name}.log"))
+		start = time.perf_counter()
+		try:
+			Info(f"Fleet: starting {job.name} ({job.opts.ip_addr})")
+			wf = Workflow(job.opts, self.dry_run)
+			wf.work_folder = job.folder
+			wf.backup_store = self.store
+			job.ok = wf.Run()
+			job.errors = wf.errors
+			job.changes = len(wf.changes)
+			job.steps = len(wf.timeline.entries)
+			if wf.end_space.root_free > wf.start_space.root_free:
+				job.recovered = wf.end_space.root_free - wf.start_space.root_free
+		except Exception as e:
+			job.ok = False
+			job.errors.append(str(e))
+			Error(f"Fleet: {job.name} failed: {e}")
+		finally:
+			job.elapsed = time.perf_counter() - start
+			Info(f"Fleet: {job.name} finished in {job.elapsed:.1f}s")
+			CloseThreadLog(log)
+		return job
+
+	def Run(self) -> list[PrinterJob]:
+		" Runs the workflow on all printers; results follow the order printers were added "
+		CRC_CACHE_STATS.Reset()
+		with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="fleet") as pool:
+			res = list(pool.map(self._run_job_, self.jobs))
+		Info(str(CRC_CACHE_STATS))
+		return res
+
+	def Summary(self) -> str:
+		lines = []
+		for job in self.jobs:
+			state = job.ok and "OK" or "FAILED"
+			if self.dry_run:
+				lines.append(f"{job.name:20} {job.opts.ip_addr:16} {state:8} {job.changes:>6} changes {job.elapsed:8.1f}s")
+			else:
+				lines.append(f"{job.name:20} {job.opts.ip_addr:16} {state:8} {FmtByteSize(job.recovered):>14} {job.elapsed:8.1f}s")
+			for err in job.errors:
+				lines.append(f"\t{err}")
+		ok = len([job for job in self.jobs if job.ok])
+		total = sum([job.recovered for job in self.jobs])
+		if self.dry_run:
+			lines.append(f"{ok} of {len(self.jobs)} printers checked; {len([job for job in self.jobs if job.changes])} would change.")
+		else:
+			lines.append(f"{ok} of {len(self.jobs)} printers succeeded; {len(self.jobs) - ok} failed. Recovered disk space: {FmtByteSize(total)}")
+		return '\n'.join(lines)
+
+
+def main() -> int:
+	parser = argparse.ArgumentParser(description="Runs the un-brick workflow on a fleet of printers")
+	parser.add_argument("fleet", help="INI file with a section for each printer")
+	parser.add_argument("-j", "--jobs", type=int, default=MAX_WORKERS, help="printers handled at the same time")
+	parser.add_argument("-o", "--output", default=os.path.join(GetBackupFolder(), "fleet"), help="folder for logs and backups")
+	parser.add_argument("-n", "--dry-run", action="store_true", help="just write the changes of each printer to a diff file")
+	args = parser.parse_args()
+	base = UserOptions()
+	base.LoadIni(GetIniFileName())
+	fleet = Fleet(base, args.output, args.jobs, args.dry_run)
+	fleet.LoadIni(args.fleet)
+	fleet.Run()
+	summary = fleet.Summary()
+	Info(summary)
+	print(summary)
+	return (all([job.ok for job in fleet.jobs]) and 0) or 1
+
+
+if __name__ == "__main__":
+	sys.exit(main())
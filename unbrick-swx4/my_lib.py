@@ -2,6 +2,7 @@
 # -*- coding: UTF-8 -*-
 
 import locale
+import hashlib
 from i18n import _
 
 def TryParseInt(s, default=0) -> int:
@@ -22,3 +23,8 @@ def FmtByteSize(num : int) -> str:
 		sc = _("KBi")
 	res = locale.format_string("%5.3f", num_f, grouping=True)
 	return res + ' ' + sc
+
+def FileSha256(fname : str) -> str:
+	" Returns the SHA-256 of a file, in the same format as `sha256sum` "
+	with open(fname, 'rb') as fr:
+		return hashlib.sha256(fr.read()).hexdigest()
@@ -0,0 +1,153 @@
+#
+# -*- coding: UTF-8 -*-
+#
+# Spellchecker: words
+
+"""
+Runs the tasks of a workflow concurrently, following their dependencies and the resources they use.
+
+Each task may declare, as class attributes:
+	- `DEPENDS`: names of the task classes that have to complete before it starts. Only tasks that
+	  come earlier in the list are considered; the ones that are not in the list are ignored.
+	  The default `None` turns the task into a fence: it waits for all tasks before it and all
+	  tasks after it wait for it, which is the classic sequential behavior.
+	- `RESOURCES`: names of the resources it uses. Tasks sharing a resource never overlap and
+	  run in the order of the list.
+"""
+
+import time
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Any, Callable
+
+
+# Interactive SSH shell; a single command at a time
+RES_SHELL = "shell"
+# SFTP channel, used to transfer the configuration file
+RES_SFTP = "sftp"
+# Local copy of the configuration file and its editor
+RES_EDITOR = "editor"
+
+# Tasks running at the same time
+MAX_WORKERS = 4
+
+
+class TimelineEntry:
+	def __init__(self, label : str, start : float, end : float, worker : str) -> None:
+		self.label = label
+		# Seconds relative to the start of the timeline
+		self.start = start
+		self.end = end
+		self.worker = worker
+	@property
+	def elapsed(self) -> float:
+		return self.end - self.start
+
+
+class Timeline:
+	"""
+	Trace of the execution of the tasks, used to compare the wall clock with a sequential run.
+	"""
+	BAR_WIDTH = 40
+
+	def __init__(self) -> None:
+		self.origin = time.perf_counter()
+		self.entries : list[TimelineEntry] = []
+		self.lock = threading.Lock()
+	def Add(self, label : str, start : float, end : float) -> None:
+		" Adds a task execution; times are `time.perf_counter()` values "
+		with self.lock:
+			self.entries.append(TimelineEntry(label, start - self.origin, end - self.origin, threading.current_thread().name))
+	@property
+	def wall_clock(self) -> float:
+		return max([e.end for e in self.entries], default=0.0)
+	@property
+	def sequential(self) -> float:
+		" Time that the same tasks would take one after the other "
+		return sum([e.elapsed for e in self.entries])
+	@property
+	def saved(self) -> float:
+		return self.sequential - self.wall_clock
+	def __str__(self) -> str:
+		wall = self.wall_clock
+		scale = (wall > 0) and (self.BAR_WIDTH / wall) or 0.0
+		lines = [f"Timeline: wall clock {wall:.2f}s, sequential {self.sequential:.2f}s, saved {self.saved:.2f}s"]
+		for e in sorted(self.entries, key=lambda e : e.start):
+			first = int(e.start * scale)
+			last = max(int(e.end * scale), first + 1)
+			bar = ' ' * first + '#' * (last - first)
+			lines.append(f"\t{e.label[:40]:40} {e.start:8.2f}s {e.elapsed:8.2f}s |{bar:{self.BAR_WIDTH}}|")
+		return '\n'.join(lines)
+
+
+class TaskScheduler:
+	"""
+	Starts each task as soon as its dependencies are complete and its resources are free.
+	"""
+	def __init__(self, tasks : list[Any], max_workers = MAX_WORKERS) -> None:
+		self.tasks = tasks
+		self.max_workers = max_workers
+		self.timeline = Timeline()
+
+	def Dependencies(self) -> list[set[int]]:
+		" Returns, for each task, the indexes of the tasks it waits for "
+		res : list[set[int]] = []
+		fence = None
+		for i, task in enumerate(self.tasks):
+			depends = getattr(task, 'DEPENDS', None)
+			resources = set(getattr(task, 'RESOURCES', ()))
+			if depends is None:
+				deps = set(range(i))
+				fence = i
+			else:
+				deps = set([j for j in range(i) if type(self.tasks[j]).__name__ in depends])
+				if fence is not None:
+					deps.add(fence)
+				# Tasks sharing a resource keep the order of the list
+				deps.update([j for j in range(i) if resources & set(getattr(self.tasks[j], 'RESOURCES', ()))])
+			res.append(deps)
+		return res
+
+	def _execute_(self, context : contextvars.Context, task : Any, run : Callable[[Any], None]) -> None:
+		" Runs a task in the context of the thread that started the scheduler, so it logs to the same place "
+		start = time.perf_counter()
+		try:
+			context.run(run, task)
+		finally:
+			self.timeline.Add(task.label, start, time.perf_counter())
+
+	def Run(self, prepare : Callable[[Any], bool], run : Callable[[Any], None]) -> Timeline:
+		"""
+		Runs all tasks. `prepare` is called on this thread just before a task would start and returns
+		False to skip it; `run` is called on a worker thread to execute it.
+		"""
+		deps = self.Dependencies()
+		pending = list(range(len(self.tasks)))
+		done : set[int] = set()
+		busy : set[str] = set()
+		running : dict[Future, int] = {}
+		with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="task") as pool:
+			while pending or running:
+				for i in list(pending):
+					if len(running) >= self.max_workers:
+						break
+					task = self.tasks[i]
+					resources = set(getattr(task, 'RESOURCES', ()))
+					if (not deps[i] <= done) or (resources & busy):
+						continue
+					pending.remove(i)
+					if prepare(task):
+						busy |= resources
+						running[pool.submit(self._execute_, contextvars.copy_context(), task, run)] = i
+					else:
+						done.add(i)
+				if running:
+					finished, _ = wait(running, return_when=FIRST_COMPLETED)
+					for f in finished:
+						i = running.pop(f)
+						busy -= set(getattr(self.tasks[i], 'RESOURCES', ()))
+						done.add(i)
+						# Errors are handled by `run`; anything else is a bug
+						f.result()
+		return self.timeline
@@ -1,13 +1,15 @@
 #
 # -*- coding: UTF-8 -*-
 #
-# spellchecker:words stty makerbase mkspi timelapse USWX
+# spellchecker:words stty makerbase mkspi timelapse USWX diskstats mmcblk
 
 
 import os
 import time
 import re
 import shlex
+import select
+import secrets
 from typing import Callable, Optional
 from typing import TYPE_CHECKING
 
@@ -27,7 +29,6 @@ TEST_MODE = os.getenv("USWX4_TEST")
 
 if (TEST_MODE is None):
 	import paramiko
-	import select # Use the standard select module for checking readiness
 
 
 class ArtSW4:
@@ -55,6 +56,110 @@ class DiskUsage:
 		self.root_free = 0
 
 
+class UnitState:
+	"""
+	State of a systemd unit, as reported by `systemctl show`.
+	"""
+	PROPERTIES = ("Id", "LoadState", "ActiveState", "SubState", "UnitFileState")
+	def __init__(self, props : dict[str, str]) -> None:
+		self.id = props.get("Id", "")
+		self.load = props.get("LoadState", "")
+		self.active = props.get("ActiveState", "")
+		self.sub = props.get("SubState", "")
+		self.unit_file = props.get("UnitFileState", "")
+	@property
+	def found(self) -> bool:
+		return self.load == "loaded"
+	@property
+	def running(self) -> bool:
+		return self.active in ("active", "activating", "reloading", "deactivating")
+	def __str__(self) -> str:
+		return f"{self.id}: {self.load} {self.active} ({self.sub}) {self.unit_file}"
+
+
+class ExecResult:
+	"""
+	Outcome of a command run on an exec channel.
+	"""
+	def __init__(self, cmd : str, exit_code : int|None, stdout : list[str], stderr : list[str]) -> None:
+		self.cmd = cmd
+		# `None` when the command did not complete within the timeout
+		self.exit_code = exit_code
+		self.stdout = stdout
+		self.stderr = stderr
+	@property
+	def ok(self) -> bool:
+		return self.exit_code == 0
+
+
+# Longest wait for data on an exec channel, before checking its exit status again
+EXEC_POLL = 0.1
+
+
+class ExecChannel:
+	"""
+	A non-interactive command started on its own channel of the SSH transport.
+	Many channels may run at the same time, independently of the interactive shell.
+	"""
+	def __init__(self, channel, cmd : str, timeout : float) -> None:
+		self.cmd = cmd
+		self.timeout = timeout
+		# `None` in test mode
+		self.channel = channel
+	def Wait(self) -> ExecResult:
+		" Waits for the command to complete and collects its output. Both streams are read as data "
+		" arrives, since a command blocks when the window of the stream not being read is full. "
+		" The timeout restarts every time data is received. "
+		channel = self.channel
+		if channel is None:
+			return ExecResult(self.cmd, 0, [], [])
+		stdout = bytearray()
+		stderr = bytearray()
+		start_time = time.monotonic()
+		while True:
+			# Output is sent before the exit status, so all of it is buffered once the status is ready
+			done = channel.exit_status_ready()
+			got = False
+			while channel.recv_ready():
+				stdout += channel.recv(65535)
+				got = True
+			while channel.recv_stderr_ready():
+				stderr += channel.recv_stderr(65535)
+				got = True
+			if done:
+				break
+			now = time.monotonic()
+			if got:
+				start_time = now
+			elif now - start_time >= self.timeout:
+				Error(f"Timeout running: {self.cmd}")
+				channel.close()
+				return ExecResult(self.cmd, None, [], [])
+			else:
+				select.select([channel], [], [], min(self.timeout - (now - start_time), EXEC_POLL))
+		exit_code = channel.recv_exit_status()
+		out = stdout.decode('utf-8', errors='ignore').splitlines()
+		err = stderr.decode('utf-8', errors='ignore').splitlines()
+		for line in out:
+			Debug(f'\t\t{line.strip()}')
+		for line in err:
+			Debug(f'\t\t! {line.strip()}')
+		if exit_code:
+			Debug(f'\texit code: {exit_code}')
+		return ExecResult(self.cmd, exit_code, out, err)
+
+
+# End marker of a framed command that timed out; it shows up on the output of the next command
+STALE_END_MARKER = re.compile(r'__END_[0-9a-f]{12}_\d+$')
+# Shell prompt at the end of the login banner, like 'root@mkspi:~# '
+SHELL_PROMPT = re.compile(rb'@\S+:[^\n]*[#$] $')
+# Time to wait for the shell prompt after login
+PROMPT_DEADLINE = 10.0
+# Readiness polls start with this delay, which doubles up to the maximum
+WAIT_FIRST_DELAY = 0.25
+WAIT_MAX_DELAY = 4.0
+
+
 class ArtillerySideWinder(object):
 	" SSH Connection to Artillery SideWinder 4 "
 	def __init__(self) -> None:
@@ -64,10 +169,13 @@ class ArtillerySideWinder(object):
 			self.shell : paramiko.Channel | None = None
 			self.sftp : paramiko.SFTPClient | None = None
 		else:
+			self.client = None
 			self.sftp = None
 		self.reboot_on_exit = False
 		self.motd_output : list[str] = []
 		self.failed_connection = False
+		# Exit code of the last framed command; `None` if the end marker was not seen
+		self.exit_code : int | None = None
 
 	# --- Helper Function to Clear the Buffer ---
 	def _drain_shell_buffer(self, timeout=1.0) -> str:
@@ -78,7 +186,7 @@ class ArtillerySideWinder(object):
 		start_time_2 = start_time = time.time()
 		
 		# We will accumulate all the "garbage" data here, mostly the old prompt
-		drained_data = b''
+		drained_data = bytearray()
 		
 		while True:
 			cur_time = time.time()
@@ -90,8 +198,7 @@ class ArtillerySideWinder(object):
 				# Reset timeout since we received data
 				start_time = cur_time
 				# Try to optimize timeout, when input ends with a login prompt
-				tmp = drained_data.rsplit(b'\n')
-				tail = tmp[-1].decode('utf-8', errors='ignore')
+				tail = drained_data[drained_data.rfind(b'\n') + 1:].decode('utf-8', errors='ignore')
 				for p in ArtSW4.LOGIN_PROMPTS:
 					# login prompt cancel the timeout
 					if tail.startswith(p):
@@ -128,12 +235,13 @@ class ArtillerySideWinder(object):
 
 			# 1. Open an interactive shell (use dumb terminal to eliminate soft-breaks)
 			self.shell = self.client.invoke_shell(term='dumb', width=0, height=0)
-			time.sleep(2)
-			# 3. Read everything currently in the buffer. This should be the MOTD + prompt.
-			tmp = self._drain_shell_buffer()
+			# 2. Read the MOTD, up to the prompt
+			tmp = self._wait_prompt_(PROMPT_DEADLINE)
 			self.motd_output = tmp.splitlines()
 			# Disable echo
 			self.ExecCommand('stty -echo')
+			# Prompts would interleave with the output of framed commands
+			self.ExecCommand("export PS1='' PS2=''")
 			# Make sure messages are in English/US for correct parsing
 			self.ExecCommand('export LC_ALL=en_US.UTF-8')
 			# Open sftp channel for file transfer
@@ -157,27 +265,90 @@ class ArtillerySideWinder(object):
 					self.client.close()
 				self.client = None
 
-	def ExecCommand(self, cmd : str, timeout = 10, can_exit = False) -> list[str]:
+	def _wait_prompt_(self, deadline : float) -> str:
+		" Reads the login banner, returning as soon as the shell prompt shows up or when the deadline expires "
+		assert self.shell is not None
+		data = bytearray()
+		end = time.monotonic() + deadline
+		while not SHELL_PROMPT.search(data):
+			remain = end - time.monotonic()
+			if remain <= 0:
+				Debug("Shell prompt not seen")
+				break
+			r, w, e = select.select([self.shell], [], [], remain)
+			if self.shell.recv_ready():
+				data += self.shell.recv(65535)
+			elif self.shell.closed or self.shell.eof_received:
+				break
+		return data.decode('utf-8', errors='ignore')
+
+	def _discard_pending_(self) -> None:
+		" Discards output left in the channel, without waiting "
+		assert self.shell is not None
+		while self.shell.recv_ready():
+			tmp = self.shell.recv(65535)
+			Debug(f"\tDiscarded: {tmp.decode('utf-8', errors='ignore')}")
+
+	def _read_frame_(self, marker : re.Pattern[bytes], timeout : float) -> tuple[bytes, int|None]:
+		" Reads the output of a framed command, returning as soon as the end marker arrives "
+		" The timeout restarts every time data is received "
+		assert self.shell is not None
+		data = bytearray()
+		start_time = time.time()
+		while True:
+			if self.shell.recv_ready():
+				# Marker may be split between chunks
+				pos = max(len(data) - 64, 0)
+				data += self.shell.recv(65535)
+				m = marker.search(data, pos)
+				if m:
+					return bytes(data[:m.start()]), int(m[1])
+				start_time = time.time()
+			elif self.shell.closed or self.shell.eof_received:
+				break
+			else:
+				remain = timeout - (time.time() - start_time)
+				if remain <= 0:
+					break
+				r, w, e = select.select([self.shell], [], [], remain)
+				if not r:
+					break
+		return bytes(data), None
+
+	def ExecCommand(self, cmd : str, timeout = 10, can_exit = False, check = False) -> list[str]:
+		" Runs a command on the remote shell and returns its output lines. "
+		" The command is followed by an `echo` of a unique end marker carrying its exit code, so the output "
+		" is complete as soon as the marker arrives. The exit code is stored on `self.exit_code` and raises "
+		" an exception if `check` is set and it is not zero. "
+		" Commands that end the session (`can_exit`) have no marker and wait for the timeout. "
 		if (TEST_MODE is None):
 			if self.client is None:
 				raise Exception(N_("Connection is invalid to complete the command!"))
 			if self.shell is None:
 				raise Exception(N_("Connection is invalid to complete the command!"))
-			self._drain_shell_buffer(0.2)
+			self.exit_code = None
 			Debug(f'# {cmd}')
-			if not cmd.endswith('\n'):
-				cmd += '\n'
-			self.shell.send(cmd.encode('utf-8'))
-			output = self._drain_shell_buffer(timeout=timeout)
+			cmd = cmd.rstrip('\n')
+			if can_exit:
+				self._drain_shell_buffer(0.2)
+				self.shell.send((cmd + '\n').encode('utf-8'))
+				output = self._drain_shell_buffer(timeout=timeout)
+			else:
+				self._discard_pending_()
+				nonce = secrets.token_hex(6)
+				marker = re.compile(rb'__END_' + nonce.encode('ascii') + rb'_(\d+)\r?\n')
+				self.shell.send(f'{cmd}\necho __END_{nonce}_$?\n'.encode('utf-8'))
+				data, self.exit_code = self._read_frame_(marker, timeout)
+				output = data.decode('utf-8', errors='ignore')
 			# At least the shell prompt was expected!
-			if (len(output) == 0) and (can_exit == False):
+			if (len(output) == 0) and (self.exit_code is None) and (can_exit == False):
 				msg = N_("No response seen during the specified timeout!")
 				Error(msg)
 				raise Exception(_(msg))
 
-			output = output.splitlines()
+			output = [l for l in output.splitlines() if not STALE_END_MARKER.search(l)]
 			# Remove the command echo
-			if len(output) and (output[0] == cmd[:-1]):
+			if len(output) and (output[0] == cmd):
 				del output[0]
 			# Remove the prompt at tail
 			while len(output) and ArtSW4.IsShellPrompt(output[-1]):
@@ -185,10 +356,111 @@ class ArtillerySideWinder(object):
 			# Write to log
 			for line in output:
 				Debug(f'\t\t{line.strip()}')
+			if self.exit_code:
+				Debug(f'\texit code: {self.exit_code}')
+				if check:
+					msg = N_("Command '{0}' failed with exit code {1}!")
+					Error(msg.format(cmd, self.exit_code))
+					raise Exception(_(msg).format(cmd, self.exit_code))
 			return output
 		else:
 			return []
 	
+	def _open_channel_(self, cmd : str, timeout : float):
+		" Starts a command on a new channel of the SSH transport; `None` in test mode "
+		if (TEST_MODE is None):
+			transport = self.client and self.client.get_transport()
+			if transport is None:
+				raise Exception(N_("Connection is invalid to complete the command!"))
+			channel = transport.open_session(timeout=timeout)
+			channel.exec_command(cmd)
+			return channel
+		return None
+
+	def ExecStart(self, cmd : str, timeout = 10) -> ExecChannel:
+		" Starts a non-interactive command on a new channel; call `Wait()` on the result to get its outcome "
+		Debug(f'#& {cmd}')
+		return ExecChannel(self._open_channel_(cmd, timeout), cmd, timeout)
+
+	def Exec(self, cmd : str, timeout = 10) -> ExecResult:
+		" Runs a non-interactive command, with separate stdout/stderr and exit status "
+		return self.ExecStart(cmd, timeout).Wait()
+
+	def ExecParallel(self, cmds : list[str], timeout = 10) -> list[ExecResult]:
+		" Runs independent commands at the same time over the SSH transport; results follow the input order "
+		channels = [self.ExecStart(cmd, timeout) for cmd in cmds]
+		return [ch.Wait() for ch in channels]
+
+	def WaitFor(self, probe : Callable[[], bool], deadline : float) -> bool:
+		" Calls `probe` with exponential backoff until it returns True; returns False if the deadline (in seconds) expires "
+		delay = WAIT_FIRST_DELAY
+		end = time.monotonic() + deadline
+		while not probe():
+			remain = end - time.monotonic()
+			if remain <= 0:
+				return False
+			time.sleep(min(delay, remain))
+			delay = min(delay * 2, WAIT_MAX_DELAY)
+		return True
+
+	def WaitCommand(self, cmd : str, deadline : float) -> bool:
+		" Polls a command on an exec channel until it exits with code 0 "
+		return self.WaitFor(lambda : self.Exec(cmd).ok, deadline)
+
+	def WaitServiceActive(self, service : str, deadline : float) -> bool:
+		return self.WaitCommand(f"systemctl is-active --quiet {shlex.quote(service)}", deadline)
+
+	def WaitUnixSocket(self, path : str, deadline : float) -> bool:
+		" Waits for a process to accept connections on a unix socket; a stale socket file does not count "
+		probe = f"import socket; socket.socket(socket.AF_UNIX).connect({path!r})"
+		return self.WaitCommand(f"python3 -c {shlex.quote(probe)}", deadline)
+
+	def WaitTcpPort(self, port : int, deadline : float) -> bool:
+		" Waits for a process to accept connections on a local TCP port "
+		return self.WaitCommand(f"bash -c 'exec 3<>/dev/tcp/127.0.0.1/{port}'", deadline)
+
+	def WaitDiskIdle(self, deadline : float) -> bool:
+		" Waits until the eMMC has no I/O in flight "
+		return self.WaitCommand("awk '$3 ~ /^mmcblk[0-9]+$/ { n += $12 } END { exit (n > 0) }' /proc/diskstats", deadline)
+
+	def SystemCtl(self, verb : str, units : list[str], timeout = 60, wait = True) -> dict[str, UnitState]:
+		" Applies a `systemctl` verb to many units and reads back their state, in a single round-trip. "
+		" Units that are not installed are skipped, since they would abort `enable` for all the others. "
+		" With `wait` cleared the jobs are just queued. Returns the state of each unit found. "
+		" Before a start, units left failed by an earlier run are reset, so a failure is a new one. "
+		names = ' '.join([shlex.quote(u) for u in units])
+		no_block = (not wait) and "--no-block " or ""
+		reset = (verb == "start") and "systemctl reset-failed $u; " or ""
+		res = self.ExecCommand(
+			f"u=$(for s in {names}; do [ \"$(systemctl show -p LoadState --value $s)\" = loaded ] && echo $s; done); "
+			f"[ -n \"$u\" ] && {{ {reset}systemctl {no_block}{verb} $u; }}; "
+			f"systemctl show -p {','.join(UnitState.PROPERTIES)} {names}", timeout)
+		# Each unit is a block of 'Property=value' lines; blocks are separated by an empty line
+		blocks : list[dict[str, str]] = [{}]
+		for line in res + ['']:
+			if not line.strip():
+				if blocks[-1]:
+					blocks.append({})
+				continue
+			m = re.match(r'(\w+)=(.*)$', line.strip())
+			if m and (m[1] in UnitState.PROPERTIES):
+				blocks[-1][m[1]] = m[2]
+		states = {}
+		for props in blocks[:-1]:
+			state = UnitState(props)
+			Debug(f"\t{state}")
+			for u in units:
+				if state.id in (u, u + '.service'):
+					states[u] = state
+		return states
+
+	def RemoteSha256(self, path : str) -> str|None:
+		" Returns the SHA-256 of a file on the printer, or None if it cannot be read "
+		res = self.Exec(f"sha256sum {shlex.quote(path)}", 30)
+		if res.ok and res.stdout:
+			return res.stdout[0].split()[0]
+		return None
+
 	def SftpGet(self, src : str, dest : str) -> None:
 		if (TEST_MODE is None):
 			if self.sftp is None:
@@ -232,20 +504,23 @@ class ArtillerySideWinder(object):
 			return []
 
 	def DelFileMatch(self, names : str|list[str], info: Optional[Callable[[str, bool], None]] = None) -> int:
+		" Deletes all files matching the names, using a single `find` command for each name "
 		cnt = 0
 		if (TEST_MODE is None):
-			if names is str:
+			if isinstance(names, str):
 				names = [names]
 			for name in names:
 				if info:
 					info(name, True)
-				res = self.FindFiles(name)
-				if res:
-					cnt += len(res)
-					for f in res:
-						if info:
-							info(f, False)
-						self.ExecCommand("rm {}".format(shlex.quote(f)))
+				# `-print` only runs after a successful `-delete`, so output lists files actually removed
+				res = self.ExecCommand("find {} -type f -delete -print".format(name), 60)
+				for f in res:
+					# Skips messages like: find: ‘/home/mks/Videos/’: No such file or directory
+					if f.startswith('find: '):
+						continue
+					cnt += 1
+					if info:
+						info(f, False)
 		return cnt
 
 	def DelTreeMatch(self, names : str|list[str], info: Optional[Callable[[str, bool], None]] = None) -> int:
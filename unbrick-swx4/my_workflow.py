@@ -19,14 +19,18 @@ if TYPE_CHECKING:
 	from .user_options import UserOptions
 	from .i18n import _, N_
 	from .my_env import Info, Error, GetBackupFolder, GetMainScriptPath, YELLOW, NORMAL, BOLD, RED, GREEN
-	from .my_shell import ArtillerySideWinder, DiskUsage
-	from .edit_cfg import Commands
+	from .my_shell import ArtillerySideWinder, DiskUsage, UnitState
+	from .edit_cfg import Commands, ContentsSnapshot, CRC_CACHE_STATS
+	from .my_scheduler import TaskScheduler, Timeline, RES_SHELL, RES_SFTP, RES_EDITOR
+	from .backup_store import BackupStore
 else:
 	from user_options import UserOptions
 	from i18n import _, N_
 	from my_env import Info, Error, GetBackupFolder, GetMainScriptPath, YELLOW, NORMAL, BOLD, RED, GREEN
-	from my_shell import ArtillerySideWinder, DiskUsage
-	from edit_cfg import Commands
+	from my_shell import ArtillerySideWinder, DiskUsage, UnitState
+	from edit_cfg import Commands, ContentsSnapshot, CRC_CACHE_STATS
+	from my_scheduler import TaskScheduler, Timeline, RES_SHELL, RES_SFTP, RES_EDITOR
+	from backup_store import BackupStore
 
 
 
@@ -50,12 +54,16 @@ class TaskState(Enum):
 	READY = 1		# task is waiting for its time
 	ALWAYS = 2		# run always, regardless of connection/error state
 	CONNECTED = 3	# run always if a connection was established, regardless of error state
-	RUNNING = 4		# Task being run (one at a time)
+	RUNNING = 4		# Task being run (independent tasks may run at the same time)
 	DONE = 5		#  task 
 	CANCELLED = 6
 	FAIL = 7
 
 class Task(ABC):
+	# Names of task classes that have to complete first; `None` waits for all previous tasks (see `my_scheduler`)
+	DEPENDS : tuple[str, ...] | None = None
+	# Resources used by the task; tasks sharing a resource do not overlap
+	RESOURCES : tuple[str, ...] = ()
 	def __init__(self, workflow : "Workflow", label : str, state : TaskState) -> None:
 		self.workflow = workflow
 		self.label = label
@@ -101,9 +109,11 @@ class Task(ABC):
 
 class Workflow(ArtillerySideWinder):
 	" Class to run all operations "
-	def __init__(self, opts : UserOptions) -> None:
+	def __init__(self, opts : UserOptions, dry_run = False) -> None:
 		super().__init__()
 		self.opts = opts
+		# Dry-runs just fetch the configuration file and preview the changes of the edits
+		self.dry_run = dry_run
 		self.exception = False
 		self.cancel_flag = False
 		self.resizing_issue = False
@@ -111,6 +121,21 @@ class Workflow(ArtillerySideWinder):
 			self.queue : queue.Queue
 			self.thread : threading.Thread
 			self.dlg : tk.Misc
+		# Headless runs (fleet mode) have no UI; messages go to the log only
+		self.headless = False
+		self.errors : list[str] = []
+		# Local folder for the configuration file copy and its backups
+		self.work_folder = GetBackupFolder()
+		# Backup store shared by many workflows (fleet mode); `None` uses a store in the work folder
+		self.backup_store : BackupStore|None = None
+		# Output of tasks running at the same time (see `_begin_output_()`)
+		self._ui_lock = threading.RLock()
+		self._local = threading.local()
+		self._console : Task|None = None
+		self._held : list[Message] = []
+		self._started = 0
+		# Execution trace of the last run
+		self.timeline : Timeline|None = None
 		self.start_space = DiskUsage()
 		self.end_space = DiskUsage()
 		self.editor : Commands|None = None
@@ -122,6 +147,10 @@ class Workflow(ArtillerySideWinder):
 		self.upgraded_cfg = False		# The cfg file has already upgraded Artillery gcode
 		self.modify_cfg = 0				# A counter having the number of edits on the configuration file
 		self.persistence_upd = False	# Indicates that persistence area has been updated
+		self.remote_sha256 : str|None = None	# Hash of the configuration file on the printer
+		self.cfg_uploaded = False		# The configuration file on the printer was replaced
+		self.unit_states : dict[str, dict[str, UnitState]] = {}	# Result of the `systemctl` batch of each verb
+		self.changes : list[tuple[str, ContentsSnapshot, ContentsSnapshot]] = []	# Dry-run: contents before/after each task
 
 		if (TEST_MODE is None):
 			if TYPE_CHECKING:
@@ -141,15 +170,17 @@ class Workflow(ArtillerySideWinder):
 		if TYPE_CHECKING:
 			from .task_config import BackupConfig, ConfigReset, ConfigValidate, FixModelSettings, StepperZCurrent, ExtruderAccel, ExtruderCurrent, \
 						ProbeOffset, ProbeSampling, ProbeValidation, ScrewsTiltAdjust, FanRename, MbFanFix, MbFanSpeed, HbFanSpeed, TempMCU, \
-						NozzleWipe, PurgeLine, M600Support, PauseMacro, ExcludeObject, SaveConfig, InputPinPolarity
+						NozzleWipe, PurgeLine, M600Support, PauseMacro, ExcludeObject, SaveConfig, InputPinPolarity, DryRunReport
 		else:
 			from task_config import BackupConfig, ConfigReset, ConfigValidate, FixModelSettings, StepperZCurrent, ExtruderAccel, ExtruderCurrent, \
 						ProbeOffset, ProbeSampling, ProbeValidation, ScrewsTiltAdjust, FanRename, MbFanFix, MbFanSpeed, HbFanSpeed, TempMCU, \
-						NozzleWipe, PurgeLine, M600Support, PauseMacro, ExcludeObject, SaveConfig, InputPinPolarity
+						NozzleWipe, PurgeLine, M600Support, PauseMacro, ExcludeObject, SaveConfig, InputPinPolarity, DryRunReport
 
 		if (TEST_MODE is None):
 			self.tasks.append(Connect(self))
 			self.tasks.append(CheckConnect(self))
+		# Services keep running and the printer is left untouched on dry-runs
+		if (TEST_MODE is None) and not dry_run:
 			self.tasks.append(GetInitialDiskSpace(self))
 			self.tasks.append(StopUserInterface(self))
 			self.tasks.append(StopWebCam(self))
@@ -187,9 +218,12 @@ class Workflow(ArtillerySideWinder):
 		self.tasks.append(M600Support(self))
 		self.tasks.append(PauseMacro(self))
 		# Always the last of this block
-		self.tasks.append(SaveConfig(self))
+		if dry_run:
+			self.tasks.append(DryRunReport(self))
+		else:
+			self.tasks.append(SaveConfig(self))
 
-		if (TEST_MODE is None):
+		if (TEST_MODE is None) and not dry_run:
 			self.tasks.append(TrimDisk(self))
 			self.tasks.append(GetFinalDiskSpace(self))
 			self.tasks.append(EnableUserInterface(self))
@@ -200,28 +234,46 @@ class Workflow(ArtillerySideWinder):
 			self.tasks.append(StartMoonraker(self))
 			self.tasks.append(StartWebCam(self))
 			self.tasks.append(StartUserInterface(self))
+		if (TEST_MODE is None):
 			# Always the Last
 			self.tasks.append(Disconnect(self))
 
+	def NeedsReboot(self) -> bool:
+		" Printer is rebooted when its configuration file changed or to complete the file-system resize "
+		return self.cfg_uploaded or self.resizing_issue
+
 	def UpdateUI(self, task: Task|Message|int|None):
-		if (TEST_MODE is None):
-			self.queue.put(task)
-			self.dlg.event_generate("<<UpdateUI>>", when="tail")
-		elif isinstance(task, Message):
-			if task.type == MessageType.BOLD:
-				print(BOLD, end='')
-			elif task.type == MessageType.ERROR:
-				print(RED, end='')
-			elif task.type == MessageType.SUCCESS:
-				print(GREEN, end='')
-			elif task.type == MessageType.WARNING:
-				print(YELLOW, end='')
-			print(task.msg, end='')
-			if task.type != MessageType.NORMAL:
-				print(NORMAL, end='')
+		held = getattr(self._local, 'messages', None)
+		if isinstance(task, Message) and (held is not None):
+			# Task running in background; its messages are shown when it completes
+			held.append(task)
+			return
+		with self._ui_lock:
+			if self.headless:
+				# Step begin/end and errors are already in the log
+				if isinstance(task, Message) and task.msg.strip() and (task.type not in (MessageType.ACTION, MessageType.ERROR)):
+					Info(task.msg.strip())
+			elif (TEST_MODE is None):
+				self.queue.put(task)
+				self.dlg.event_generate("<<UpdateUI>>", when="tail")
+			elif isinstance(task, Message):
+				if task.type == MessageType.BOLD:
+					print(BOLD, end='')
+				elif task.type == MessageType.ERROR:
+					print(RED, end='')
+				elif task.type == MessageType.SUCCESS:
+					print(GREEN, end='')
+				elif task.type == MessageType.WARNING:
+					print(YELLOW, end='')
+				print(task.msg, end='')
+				if task.type != MessageType.NORMAL:
+					print(NORMAL, end='')
 
 	def _update_states(self):
 		for task in self.tasks:
+			# A running task reports its own state when it completes
+			if task.state == TaskState.RUNNING:
+				continue
 			try:
 				task.UpdateState()
 			except Exception as e:
@@ -233,45 +285,98 @@ class Workflow(ArtillerySideWinder):
 
 	def _update_progress(self, cnt : int):
 		for task in self.tasks:
-			cnt += task.CanRun()
+			cnt += task.CanRun() and (task.state != TaskState.RUNNING)
 		return cnt
 
 	def _set_task_state(self, task : Task, state : TaskState) -> None:
 		task.state = state
 		self.UpdateUI(task)
 
+	def _begin_output_(self, task : Task) -> None:
+		" The first task to start shows its messages live; the ones overlapping it hold them until they complete "
+		msg = Message(MessageType.ACTION, _('Begin Step: ') + _(task.label) + '...  ')
+		with self._ui_lock:
+			if self._console is None:
+				self._console = task
+				self._local.messages = None
+				self.UpdateUI(msg)
+			else:
+				self._local.messages = [msg]
+
+	def _end_output_(self, task : Task, msg : Message) -> None:
+		with self._ui_lock:
+			held = self._local.messages
+			self._local.messages = None
+			if held is None:
+				self.UpdateUI(msg)
+				self._console = None
+			else:
+				self._held.extend(held)
+				self._held.append(msg)
+			if self._console is None:
+				held, self._held = self._held, []
+				for m in held:
+					self.UpdateUI(m)
+
+	def _prepare_task_(self, task : Task) -> bool:
+		" Called by the scheduler before a task starts; returns False if the task has to be skipped "
+		self._update_states()
+		if not task.CanRun():
+			return False
+		total = self._update_progress(self._started)
+		self._started += 1
+		if total == 0:
+			self.UpdateUI(100)
+		else:
+			self.UpdateUI((self._started * 100 + total//2) // total)
+		return True
+
+	def _editor_snapshot_(self, task : Task) -> ContentsSnapshot|None:
+		" On dry-runs, state of the configuration file around the tasks that edit it "
+		if self.dry_run and (self.editor is not None) and (RES_EDITOR in task.RESOURCES):
+			return self.editor.contents.Snapshot()
+		return None
+
+	def _run_task_(self, task : Task) -> None:
+		" Called by the scheduler to run a task on a worker thread "
+		self._begin_output_(task)
+		try:
+			Info(f'Begin Step: {task.label}...')
+			self._set_task_state(task, TaskState.RUNNING)
+			before = self._editor_snapshot_(task)
+			task.Do()
+			after = self._editor_snapshot_(task)
+			if (before is not None) and (after is not None) and (before != after):
+				self.changes.append((task.label, before, after))
+			Info(f'  OK! ({task.label})')
+			self._set_task_state(task, TaskState.DONE)
+			self._end_output_(task, Message(MessageType.ACTION, _('OK!') + '\n'))
+		except Exception as e:
+			error_message = str(e)
+			self.exception = True
+			self.errors.append(f"{task.label}: {error_message}")
+			self._set_task_state(task, TaskState.FAIL)
+			Error(f'{error_message}\n')
+			self._end_output_(task, Message(MessageType.ERROR, _('ERROR!') + '\n\t' + _(error_message) + '\n'))
+
+	def _schedule_(self) -> Timeline:
+		" Runs all tasks, overlapping the ones that are independent "
+		self._started = 0
+		self.timeline = TaskScheduler(self.tasks).Run(self._prepare_task_, self._run_task_)
+		Info(str(self.timeline))
+		return self.timeline
+
 	if (TEST_MODE is None):
 		def _worker_thread(self):
-			cnt = 0
-			for i, task in enumerate(self.tasks):
-				self._update_states()
-				if task.CanRun():
-					total = self._update_progress(cnt)
-					cnt += 1
-					if total == 0:
-						self.UpdateUI(100)
-					else:
-						self.UpdateUI((cnt * 100 + total//2) // total)
-					try:
-						Info(f'Begin Step: {task.label}...')
-						self.UpdateUI(Message(MessageType.ACTION, _('Begin Step: ') + _(task.label) + '...  '))
-						self._set_task_state(task, TaskState.RUNNING)
-						task.Do()
-						self.UpdateUI(Message(MessageType.ACTION, _('OK!') + '\n'))
-						Info('  OK!')
-						self._set_task_state(task, TaskState.DONE)
-					except Exception as e:
-						error_message = str(e)
-						self.exception = True
-						self._set_task_state(task, TaskState.FAIL)
-						Error(f'{error_message}\n')
-						self.UpdateUI(Message(MessageType.ERROR, _('ERROR!') + '\n\t' + _(error_message) + '\n'))
+			CRC_CACHE_STATS.Reset()
+			self._schedule_()
 			self.UpdateUI(100)
 			if self.persistence_upd:
 				msg = N_("Printer configuration has been reset, printer needs recalibration.")
 				Warning(msg)
 				self.UpdateUI(Message(MessageType.BOLD, _(msg)))
 			self._update_states()
+			Info(str(CRC_CACHE_STATS))
 			time.sleep(0.5)			# give time for user knowledge
 			self.UpdateUI(None)
 
@@ -282,6 +387,20 @@ class Workflow(ArtillerySideWinder):
 			self.thread = threading.Thread(target=self._worker_thread)
 			self.thread.start()
 
+	def Run(self) -> bool:
+		" Runs all tasks without UI; the calling thread waits for completion. Returns True if no task failed "
+		self.headless = True
+		self._schedule_()
+		self._update_states()
+		return not self.exception
+
+	def DryRunDiff(self) -> list[str]:
+		" Changes of a dry-run as an unified diff, where the hunks of each task are labeled by its name "
+		res = []
+		for label, before, after in self.changes:
+			res.extend(before.UnifiedDiff(after, 'printer.cfg', label))
+		return res
+
 	def Test(self, test_name : str):
 		import fnmatch
 		temp_dir = os.path.join(GetMainScriptPath(), "temp")
@@ -290,6 +409,9 @@ class Workflow(ArtillerySideWinder):
 			if fnmatch.fnmatch(f, pat):
 				fp = os.path.join(temp_dir, f)
 				os.unlink(fp)
+		CRC_CACHE_STATS.Reset()
+		# Contents after each modifying step; snapshots share unchanged text and are saved at the end
+		steps : list[tuple[str, ContentsSnapshot]] = []
 		i = 0
 		for task in self.tasks:
 			cnt_ref = self.modify_cfg
@@ -302,11 +424,9 @@ class Workflow(ArtillerySideWinder):
 					self.UpdateUI(Message(MessageType.ACTION, _('OK!') + '\n'))
 					self._set_task_state(task, TaskState.DONE)
 					if (i == 0) or (cnt_ref != self.modify_cfg):
-						if not os.path.isdir(temp_dir):
-							os.makedirs(temp_dir)
 						fname = os.path.join(temp_dir, f"{test_name}-{i:02}-{type(task).__name__}.cfg")
 						if self.editor:
-							self.editor.contents.file_buffer.Save(fname)
+							steps.append((fname, self.editor.contents.Snapshot()))
 						i += 1
 				except Exception as e:
 					error_message = str(e)
@@ -314,10 +434,15 @@ class Workflow(ArtillerySideWinder):
 					self._set_task_state(task, TaskState.FAIL)
 					Error(f'{error_message}\n')
 					self.UpdateUI(Message(MessageType.ERROR, _('ERROR!') + '\n\t' + _(error_message) + '\n'))
+		if steps and not os.path.isdir(temp_dir):
+			os.makedirs(temp_dir)
+		for fname, snapshot in steps:
+			snapshot.Save(fname)
 		if self.editor:
 			self.editor.Save()
 		if self.persistence_upd:
 			msg = N_("Printer configuration has been reset, printer needs recalibration.")
 			Warning(msg)
 			self.UpdateUI(Message(MessageType.BOLD, '\n' + _(msg) + '\n'))
+		Info(str(CRC_CACHE_STATS))
 
@@ -16,18 +16,27 @@ import random
 TEST_MODE = os.getenv("USWX4_TEST")
 
 if TYPE_CHECKING:
-	from .my_env import GetBackupFolder, GetAssetsFolder, Debug, Info
+	from .my_env import GetAssetsFolder, Debug, Info
+	from .my_lib import FileSha256
+	from .backup_store import BackupStore, STORE_FOLDER
 	from .i18n import _, N_
 	from .encoded_data import *
-	from .my_workflow import Task, TaskState, Workflow  # type: ignore
+	from .my_workflow import Task, TaskState, Workflow, RES_SHELL, RES_SFTP, RES_EDITOR  # type: ignore
 	from .edit_cfg import *
 else:
-	from my_env import GetBackupFolder, GetAssetsFolder, Debug, Info
+	from my_env import GetAssetsFolder, Debug, Info
+	from my_lib import FileSha256
+	from backup_store import BackupStore, STORE_FOLDER
 	from i18n import _, N_
 	from encoded_data import *
-	from my_workflow import Task, TaskState, Workflow # type: ignore
+	from my_workflow import Task, TaskState, Workflow, RES_SHELL, RES_SFTP, RES_EDITOR # type: ignore
 	from edit_cfg import *
 
+# Changes of a dry-run, stored in the work folder
+DRY_RUN_FILE = 'printer.dry-run.diff'
+# Copy of the factory file that a dry-run reset edits; assets and the fetched file stay untouched
+DRY_RUN_RESET = 'printer.dry-run.cfg'
+
 SECTIONS = [
 	("stepper_x", 									True ),
 	("stepper_y", 									True ),
@@ -178,14 +187,23 @@ _exclude_obj_ = K("exclude_object", "")
 
 
 class EditConfig_(Task):
+	# Edits of the local copy overlap with the remote cleanup
+	DEPENDS = ("BackupConfig",)
+	RESOURCES = (RES_EDITOR,)
 	def __init__(self, workflow : Workflow, label : str, state : TaskState) -> None:
 		super().__init__(workflow, label, state)
-		self.work_folder = GetBackupFolder()
-		self.target = os.path.join(self.work_folder, 'printer.cfg')
 		# Modified flag
 		self.modified_cnt = self.workflow.modify_cfg
 		self.combo_val = 0
 		self.has_log = False
+	@property
+	def work_folder(self) -> str:
+		" Folder of the workflow; may be changed after tasks are created (e.g. fleet mode) "
+		return self.workflow.work_folder
+	@property
+	def target(self) -> str:
+		" Local copy of the configuration file being edited "
+		return os.path.join(self.work_folder, 'printer.cfg')
 	def Do(self):
 		super().Do()
 		if not os.path.isdir(self.work_folder):
@@ -205,7 +223,7 @@ class EditConfig_(Task):
 		assert isinstance(editor, Commands), "Invalid object state"
 		heat_break = Pair_()
 		main_board = Pair_()
-		for s in editor.ListSections("heater_fan *"):
+		for s in editor.ListSections("heater_fan *", with_crc=False):
 			v = editor.GetKey(s.label, "pin")
 			if isinstance(v, str):
 				if v == "PC7":
@@ -213,7 +231,7 @@ class EditConfig_(Task):
 				elif v == "PC9":
 					main_board = Pair_(s.label)
 		if main_board.IsEmpty():
-			for s in editor.ListSections("controller_fan *"):
+			for s in editor.ListSections("controller_fan *", with_crc=False):
 				v = editor.GetKey(s.label, "pin")
 				if v == "PC9":
 					main_board = Pair_(s.label)
@@ -294,7 +312,7 @@ class EditConfig_(Task):
 			if not ns and isinstance(l, SectionLine):
 				ns = l.section_name
 		assert ns is not None, "Invalid input argument"
-		sections = self.workflow.editor.ListSections()
+		sections = self.workflow.editor.ListSections(with_crc=False)
 		w = InsertAfterSection(ns, sections)
 		self.workflow.editor.AddSec(w, ml)
 		self._modified_inc_()
@@ -308,24 +326,24 @@ class EditConfig_(Task):
 		assert self.workflow.editor is not None, "Invalid object state"
 		if isinstance(k, K):
 			k = k.section
-		self.workflow.editor.OvrSec(k, b64)
+		ml = b64.Extract()
+		self.workflow.editor.OvrSec(k, ml)
 		self._modified_inc_()
 		msg = N_("The section {0} was replaced.")
 		Info(msg.format(f"[{k}]"))
-		for l in b64.Extract():
+		for l in ml:
 			Info('\t' + repr(l))
 		self._start_log_()
 		self.Bold('\t' + _(msg).format(f"[{k}]") + '\n')
 	def _upd_sec_(self, k : K, crc_pro : CrcKey|None, b64_pro : LinesB64|None, crc_plus : CrcKey|None, b64_plus : LinesB64|None) -> None:
 		" Update section for pro/plus. A `None` value indicates section delete "
-		assert self.workflow.editor is not None, "Invalid object state"
 		if self.workflow.opts.IsArtillerySWX4Pro():
-			crc = crc_pro
-			b64 = b64_pro
+			self._put_sec_(k, crc_pro, b64_pro)
 		else:
-			crc = crc_plus
-			b64 = b64_plus
-
+			self._put_sec_(k, crc_plus, b64_plus)
+	def _put_sec_(self, k : K, crc : CrcKey|None, b64 : LinesB64|None) -> None:
+		" Update section of the selected model "
+		assert self.workflow.editor is not None, "Invalid object state"
 		info = self.workflow.editor.ListSection(k.section)
 		if crc is None:
 			assert b64 is None, "Invalid function argument"
@@ -371,9 +389,10 @@ class EditConfig_(Task):
 			self.Bold('\t' + _(msg).format(f"[{k.section}]", k.key, repr(value)) + '\n')
 			return True
 		return False
-	def _set_key_ml_(self, k : K, value : LinesB64) -> bool:
+	def _set_key_ml_(self, k : K, value : LinesB64, crc : CrcKey|None = None) -> bool:
+		" Replaces a multi-line value; if `crc` is given, a value with the same CRC is kept "
 		assert self.workflow.editor is not None, "Invalid object state"
-		if self.workflow.editor.EditKeyML(k.section, k.key, value):
+		if self.workflow.editor.EditKeyML(k.section, k.key, value, crc):
 			self._modified_inc_()
 			msg : str = N_("The value {0}/{1} was added/updated.")
 			Info(msg.format(f"[{k.section}]", k.key))
@@ -397,9 +416,11 @@ class EditConfig_(Task):
 		assert val_pro is None or isinstance(val_pro, str), "Invalid function argument"
 		assert val_plus is None or isinstance(val_plus, str), "Invalid function argument"
 		if self.workflow.opts.IsArtillerySWX4Pro():
-			v = val_pro
+			self._put_val_(k, val_pro)
 		else:
-			v = val_plus
+			self._put_val_(k, val_plus)
+	def _put_val_(self, k : K, v : str|None) -> None:
+		" Update value of the selected model "
 		if v is None:
 			self._del_key_(k)
 		else:
@@ -409,18 +430,18 @@ class EditConfig_(Task):
 		assert crc_pro is None or isinstance(crc_pro, CrcKey), "Invalid function argument"
 		assert crc_plus is None or isinstance(crc_plus, CrcKey), "Invalid function argument"
 		if self.workflow.opts.IsArtillerySWX4Pro():
-			crc = crc_pro
-			b64 = b64_pro
+			self._put_ml_(k, crc_pro, b64_pro)
 		else:
-			crc = crc_plus
-			b64 = b64_plus
+			self._put_ml_(k, crc_plus, b64_plus)
+	def _put_ml_(self, k : K, crc : CrcKey|None, b64 : LinesB64|None) -> None:
+		" Update multiline value of the selected model "
 		if crc is None:
 			assert b64 is None, "Invalid function argument"
 			self._del_key_(k)
 		else:
 			assert isinstance(b64, LinesB64), "Invalid function argument"
-			if self._get_crc_ne_(k, crc):
-				self._set_key_ml_(k, b64)
+			# A single lookup both compares the CRC and replaces the value
+			self._set_key_ml_(k, b64, crc)
 
 	##### PERSISTENCE BLOCK ######
 	def _save_persistence_(self, data : LinesB64) -> None:
@@ -443,6 +464,8 @@ class EditConfig_(Task):
 
 
 class BackupConfig(EditConfig_):
+	DEPENDS = ("StopKlipper",)
+	RESOURCES = (RES_SFTP, RES_EDITOR)
 	def __init__(self, workflow : Workflow) -> None:
 		super().__init__(workflow, N_("Backup Current Configuration"), TaskState.READY)
 	def Do(self):
@@ -451,19 +474,16 @@ class BackupConfig(EditConfig_):
 			if workflow.sftp is None:
 				raise Exception(N_("Connection is invalid to complete the command!"))
 		super().Do()
+		workflow.backup_file = datetime.now().strftime('printer-%Y%m%d_%H%M%S.cfg')
 		if TEST_MODE is None:
-			workflow.backup_file = datetime.now().strftime('printer-%Y%m%d_%H%M%S.cfg')
-			backup = os.path.join(self.work_folder, workflow.backup_file)
-			workflow.SftpGet(CONFIG_FILE, self.target)
-			self.Info(_("\n\tSuccessfully copy file '{}'").format(CONFIG_FILE))
-			if os.path.isfile(backup):
-				os.unlink(backup)
-			Debug(f"copy '{self.target}' '{backup}'")
-			if os.path.exists(backup):
-				Debug(f"Remove preexisting '{backup}' file.")
-				os.unlink(backup)
-			shutil.copyfile(self.target, backup)
-			self.Info(_("\n\tCreated a backup in '{}'\n").format(backup))
+			# Transfer is skipped if the local copy is the same as the file on the printer
+			workflow.remote_sha256 = workflow.RemoteSha256(CONFIG_FILE)
+			if (workflow.remote_sha256 is not None) and os.path.isfile(self.target) \
+				and (FileSha256(self.target) == workflow.remote_sha256):
+				self.Info(_("\n\tLocal copy of '{}' is up to date").format(CONFIG_FILE))
+			else:
+				workflow.SftpGet(CONFIG_FILE, self.target)
+				self.Info(_("\n\tSuccessfully copy file '{}'").format(CONFIG_FILE))
 		else:
 			# In test mode, upper word contains the initial printer configuration file
 			start = workflow.opts.printer >>  16
@@ -490,6 +510,26 @@ class BackupConfig(EditConfig_):
 			# Not copy the start configuration file
 			shutil.copyfile(src, self.target)
 		self.workflow.editor = Commands(self.target)
+		# Tests only use a store when one is shared (fleet mode)
+		if (TEST_MODE is None) or (workflow.backup_store is not None):
+			self.StoreBackup()
+	def StoreBackup(self) -> None:
+		" Keeps the file in the backup store and reports the changes since the previous backup "
+		workflow = self.workflow
+		assert workflow.editor is not None, "Invalid object state"
+		store = workflow.backup_store or BackupStore(os.path.join(self.work_folder, STORE_FOLDER))
+		sections = [(s.label, int(s.crc)) for s in workflow.editor.ListSections() if s.is_head]
+		entry = store.Put(self.target, workflow.opts.ip_addr, workflow.backup_file, sections)
+		self.Info(_("\n\tCreated a backup in '{}'\n").format(store.BlobPath(entry.sha256)))
+		prev = store.Previous(entry)
+		if prev is None:
+			return
+		if prev.sha256 == entry.sha256:
+			self.Info(_("\tSame contents as the backup '{}'\n").format(prev.name))
+			return
+		diff = store.Diff(prev, entry)
+		if (diff is not None) and not diff.IsEmpty():
+			self.Info(_("\tChanges since the backup '{0}': {1}\n").format(prev.name, diff))
 
 
 class ConfigReset(EditConfig_):
@@ -513,9 +553,8 @@ class ConfigReset(EditConfig_):
 				cal = RESET_CFG_PLUS
 		# Reset settings, but preserve calibration
 		if workflow.opts.reset == 2:
-			tmp = Commands(self.target)
-			cal = tmp.GetPersistenceB64()
-			tmp = None
+			# The file as it was loaded, without reading it again
+			cal = LinesB64(workflow.editor.original.GetPersistence())
 		# Reset settings to factory default
 		if workflow.opts.reset in (2, 3):
 			# Use the latest Artillery upgrade file, according to printer model
@@ -523,12 +562,19 @@ class ConfigReset(EditConfig_):
 				source = os.path.join(GetAssetsFolder(), 'artillery_X4_pro.upg.cfg')
 			else:
 				source = os.path.join(GetAssetsFolder(), 'artillery_X4_plus.upg.cfg')
-			# Replace current settings file
-			os.unlink(self.target)
-			shutil.copyfile(source, self.target)
+			if workflow.dry_run:
+				# The local copy is kept as fetched and the editor must never save over the asset
+				scratch = os.path.join(self.work_folder, DRY_RUN_RESET)
+				shutil.copyfile(source, scratch)
+				workflow.editor = Commands(scratch)
+			else:
+				# Replace current settings file
+				os.unlink(self.target)
+				shutil.copyfile(source, self.target)
 		# Apply calibration
 		if cal is not None:
-			workflow.editor = Commands(self.target)
+			if not workflow.dry_run:
+				workflow.editor = Commands(self.target)
 			workflow.editor.SavePersistenceB64(cal)
 
 
@@ -542,7 +588,7 @@ class ConfigValidate(EditConfig_):
 		upg = 0
 		# Build a list with required sections
 		watch = [s for s, f in SECTIONS if f]
-		for info in workflow.editor.ListSections():
+		for info in workflow.editor.ListSections(with_crc=False):
 			if info.label in watch:
 				watch.remove(info.label)
 			# These sections indicates a firmware upgrade
@@ -572,6 +618,15 @@ _upd_sec_ = "_upd_sec_"					# (_upd_sec_, K, crc_pro, b64_pro, crc_plus, b64_plu
 _persist_ = "_persist_"					# (_persist_, b64_pro, b64_plus)
 
 
+class PlanOp_(object):
+	" A statement of a plan with its methods resolved "
+	__slots__ = ('cond', 'call', 'args')
+	def __init__(self, cond : Callable, call : Callable, args : tuple) -> None:
+		self.cond = cond
+		self.call = call
+		self.args = args
+
+
 class StmtList_(EditConfig_):
 	"""
 	Semi automated configuration fix.
@@ -596,22 +651,51 @@ class StmtList_(EditConfig_):
 		Callable return `bool` for filters and `None` for the others.
 	"""
 	IDX_ARG_PAT = re.compile(r'@(\d+)#')
+	# Commands selecting a value by printer model: method that applies it and argument positions for pro and plus
+	MODEL_COMMANDS = {
+		_upd_val_ : ("_put_val_", (0, 1), (0, 2)),
+		_upd_ml_ : ("_put_ml_", (0, 1, 2), (0, 3, 4)),
+		_upd_sec_ : ("_put_sec_", (0, 1, 2), (0, 3, 4)),
+		_persist_ : ("_save_persistence_", (0,), (1,)),
+	}
+	# Compiled plans by class, plan table and printer model. The class is part of the key, since methods
+	# are resolved on it; the plan is kept with the result, so its `id()` is not reused while cached
+	_compiled_ : dict[tuple[type, int, bool], tuple[Any, tuple[PlanOp_, ...]]] = {}
 
 	def __init__(self, workflow: Workflow, label: str, state: TaskState) -> None:
 		super().__init__(workflow, label, state)
 	def Do(self):
 		super().Do()
 		super().Validate()
-	def RunPlan(self, plan, opt_idx : int):
-		self._set_combobox_opt_(opt_idx)
-		# Run the correction plan
+	@classmethod
+	def CompilePlan(cls, plan, is_pro : bool) -> tuple[PlanOp_, ...]:
+		" Resolves the methods of a plan once and selects the values of the printer model "
+		key = (cls, id(plan), is_pro)
+		entry = cls._compiled_.get(key)
+		if (entry is not None) and (entry[0] is plan):
+			return entry[1]
+		res = []
 		for op in plan:
 			assert isinstance(op, tuple), "Invalid table"
-			cond : Callable = getattr(self, op[0])
-			if cond():
-				call : Callable = getattr(self, op[1])
-				args = op[2:]
-				call(*args)
+			cond : Callable = getattr(cls, op[0])
+			args = op[2:]
+			if op[1] in cls.MODEL_COMMANDS:
+				name, pro, plus = cls.MODEL_COMMANDS[op[1]]
+				call : Callable = getattr(cls, name)
+				args = tuple([args[i] for i in (is_pro and pro or plus)])
+			else:
+				call = getattr(cls, op[1])
+			res.append(PlanOp_(cond, call, args))
+		cls._compiled_[key] = (plan, tuple(res))
+		return tuple(res)
+	def RunPlan(self, plan, opt_idx : int):
+		assert self.workflow.editor is not None, "Invalid object state"
+		self._set_combobox_opt_(opt_idx)
+		# Run the correction plan; a failure leaves the file as it was before the plan
+		with self.workflow.editor.Batch():
+			for op in self.CompilePlan(plan, self.workflow.opts.IsArtillerySWX4Pro()):
+				if op.cond(self):
+					op.call(self, *op.args)
 
 
 class FixModelSettings(StmtList_):
@@ -906,7 +990,7 @@ class TempMCU(EditConfig_):
 		super().Validate()
 		host = Pair_()
 		mcu = Pair_()
-		for s in editor.ListSections("temperature_sensor *"):
+		for s in editor.ListSections("temperature_sensor *", with_crc=False):
 			v = editor.GetKey(s.label, "sensor_type")
 			v2 = editor.GetKey(s.label, "sensor_mcu")
 			if isinstance(v, str):
@@ -1000,6 +1084,7 @@ class PauseMacro(StmtList_):
 
 
 class SaveConfig(EditConfig_):
+	RESOURCES = (RES_SFTP, RES_SHELL, RES_EDITOR)
 	def __init__(self, workflow : Workflow) -> None:
 		super().__init__(workflow, N_("Save Configuration"), TaskState.READY)
 	def Do(self):
@@ -1010,14 +1095,43 @@ class SaveConfig(EditConfig_):
 		super().Do()
 		if (workflow.editor is not None) and (workflow.modify_cfg or workflow.persistence_upd):
 			workflow.editor.Save()
-			if TEST_MODE is None:
+			local_sha256 = FileSha256(self.target)
+			if (TEST_MODE is None) and (local_sha256 == workflow.remote_sha256):
+				# Edits restored the original contents
+				self.Info(_("\n\tFile '{}' is unchanged").format(CONFIG_FILE))
+			elif TEST_MODE is None:
 				dirname = Path(CONFIG_FILE).parent
 				fname = dirname / workflow.backup_file
 				workflow.ExecCommand(f"cp -f {CONFIG_FILE} {fname.as_posix()}")
 				fname = dirname / f"printer.{str(random.randint(0, 9999999))}"
 				workflow.SftpPut(self.target, fname.as_posix())
+				uploaded = workflow.RemoteSha256(fname.as_posix())
+				if (uploaded is not None) and (uploaded != local_sha256):
+					workflow.ExecCommand(f"rm {fname.as_posix()}")
+					raise Exception(N_("Upload of the configuration file is corrupt!"))
 				workflow.ExecCommand(f"cp -f {fname.as_posix()} {CONFIG_FILE}")
 				workflow.ExecCommand(f"chown mks:mks {CONFIG_FILE}")
 				workflow.ExecCommand(f"rm {fname.as_posix()}")
+				workflow.remote_sha256 = local_sha256
+				workflow.cfg_uploaded = True
 				self.Info(_("\n\tSuccessfully saved file '{}'").format(CONFIG_FILE))
 
+
+class DryRunReport(EditConfig_):
+	" Takes the place of `SaveConfig` on dry-runs: changes are written to a diff file and nothing is uploaded "
+	def __init__(self, workflow : Workflow) -> None:
+		super().__init__(workflow, N_("Preview Configuration Changes"), TaskState.READY)
+	@property
+	def diff_file(self) -> str:
+		return os.path.join(self.work_folder, DRY_RUN_FILE)
+	def Do(self):
+		workflow = self.workflow
+		super().Do()
+		diff = workflow.DryRunDiff()
+		with open(self.diff_file, 'wt', encoding="utf-8") as fw:
+			for line in diff:
+				print(line, file=fw)
+		if workflow.changes:
+			self.Info(_("\n\t{0} steps would change '{1}'; see '{2}'\n").format(len(workflow.changes), CONFIG_FILE, self.diff_file))
+		else:
+			self.Info(_("\n\tFile '{}' would not change\n").format(CONFIG_FILE))
@@ -4,7 +4,6 @@
 # Spellchecker: words mkspi, klipper, rockchip
 
 import os
-import time
 import re
 
 from my_env import Debug
@@ -36,12 +35,17 @@ class CheckConnect(Task):
 
 		if found != 1:
 			Debug('\n'.join(self.workflow.motd_output))
+			uname = get_id = ls = []
 		else:
-			time.sleep(0.2)
+			# The checks are independent, so they run at the same time on their own channels
+			uname, get_id, ls = [r.stdout for r in self.workflow.ExecParallel([
+				'uname -a',
+				'./get_id',
+				'ls -1 /home/mks/Desktop/myfile/others/artillery_X4_*.cfg',
+			])]
 			# Check `uname -a` results
-			res = self.workflow.ExecCommand('uname -a')
-			if len(res):
-				m = re.match(r'Linux mkspi (\d+\.\d+\.\d+)-rockchip64 .*', res[0])
+			if len(uname):
+				m = re.match(r'Linux mkspi (\d+\.\d+\.\d+)-rockchip64 .*', uname[0])
 				if m:
 					msg = _('\n\tDetected OS is Linux mkspi {0}\n').format(m[1])
 					self.Info(msg)
@@ -49,10 +53,8 @@ class CheckConnect(Task):
 		if found != 2:
 			self.Warning(_("Failed to retrieve OS version information!\n"))
 		else:
-			time.sleep(0.2)
 			# Check `./get_id` mkspi utility and verify MCU model
-			res = self.workflow.ExecCommand('./get_id')
-			for line in res:
+			for line in get_id:
 				line = line.strip()
 				m = re.match(r'/dev/serial/by-id/usb-Klipper_stm32f401xc_[A-Z0-9]{24}-if00', line)
 				if m:
@@ -63,10 +65,8 @@ class CheckConnect(Task):
 		if found != 3:
 			self.Warning(_("Failed to retrieve MCU Klipper connection!\n"))
 		else:
-			time.sleep(0.2)
 			# Check `ls -1 /home/mks/Desktop/myfile/others/artillery_X4_*.cfg` to find configuration restore files
-			res = self.workflow.ExecCommand('ls -1 /home/mks/Desktop/myfile/others/artillery_X4_*.cfg')
-			for line in res:
+			for line in ls:
 				line = line.strip()
 				m = re.match(r'/home/mks/Desktop/myfile/others/artillery_X4_(.+)\.cfg', line)
 				if m:
@@ -92,7 +92,10 @@ class Disconnect(Task):
 		if (workflow.exception == False) \
 			and (workflow.failed_connection == False) \
 			and (workflow.cancel_flag == False):
-			workflow.reboot_on_exit = True
-			Warning('Rebooting printer')
-			self.Warning(_("\n\tRebooting printer\n"))
+			if workflow.NeedsReboot():
+				workflow.reboot_on_exit = True
+				Warning('Rebooting printer')
+				self.Warning(_("\n\tRebooting printer\n"))
+			else:
+				self.Info(_("\n\tConfiguration was not changed; printer does not need a reboot\n"))
 		self.workflow.Disconnect()
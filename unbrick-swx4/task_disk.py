@@ -1,13 +1,15 @@
 #
 # -*- coding: UTF-8 -*-
 
-import time
-
 from my_lib import FmtByteSize
 from i18n import _, N_
 from my_workflow import Workflow, Task, TaskState
 
 
+# Time for the eMMC to complete pending writes
+IDLE_DEADLINE = 10.0
+
+
 class GetInitialDiskSpace(Task):
 	def __init__(self, workflow : Workflow) -> None:
 		super().__init__(workflow, N_("Reading initial disk space"), TaskState.READY)
@@ -39,8 +41,9 @@ class TrimDisk(Task):
 		super().Do()
 		self.Info(_('\n\tFlushing file data...\n'))
 		self.workflow.ExecCommand("sync", 20)
-		time.sleep(1)
+		self.workflow.WaitDiskIdle(IDLE_DEADLINE)
 		self.Info(_('\n\tTrimming eMMC...\n'))
 		self.workflow.ExecCommand("fstrim /", 60)
-		# Lets give a resting time for file-system
-		time.sleep(4)
+		# File-system settles after the trim
+		if not self.workflow.WaitDiskIdle(IDLE_DEADLINE):
+			self.Warning(_("\n\tDisk is still busy\n"))
@@ -3,7 +3,7 @@
 
 
 from i18n import _, N_
-from my_workflow import Workflow, Task, TaskState
+from my_workflow import Workflow, Task, TaskState, RES_SHELL
 
 
 # spellchecker: disable
@@ -54,6 +54,9 @@ DELETE_CLUTTER_FOLDERS = [
 ]
 
 class _EraseFileList(Task):
+	# Services are stopped, so files are not in use
+	DEPENDS = ("StopKlipper",)
+	RESOURCES = (RES_SHELL,)
 	def __init__(self, workflow : "Workflow", title : str, state : TaskState) -> None:
 		super().__init__(workflow, title, state)
 	def _info(self, fname : str, qry : bool):
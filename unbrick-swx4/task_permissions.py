@@ -3,11 +3,10 @@
 #
 # Spellchecker: words klipper, obico
 
-import fnmatch
 import shlex
 
 from i18n import _, N_
-from my_workflow import Workflow, Task, TaskState
+from my_workflow import Workflow, Task, TaskState, RES_SHELL
 
 
 # spellchecker: disable
@@ -27,39 +26,50 @@ FIX_PERMISSION = [
 	( "a-x", "/usr/lib/systemd/system/systemd-journald.service.d/override.conf" ),
 	( "a-x", "/usr/lib/systemd/system/systemd-modules-load.service.d/10-timeout.conf" ),
 ]
+# Files used by 'root' services, that keep their ownership
+KEEP_OWNER = [
+	'/home/mks/klipper_logs/moonraker-obico.*',
+	'/home/mks/Desktop/myfile/ws/yuntu_plr*',
+]
 # spellchecker: enable
 
 
 class FixFilePermission(Task):
+	DEPENDS = ("StopKlipper",)
+	RESOURCES = (RES_SHELL,)
 	def __init__(self, workflow : "Workflow") -> None:
 		super().__init__(workflow, N_("Fix file permission"), workflow.opts.file_permissions and TaskState.READY or TaskState.DISABLED)
 	def Do(self):
 		super().Do()
-		# Standard collection (boot messages reports them)
+		# Standard collection (boot messages reports them); a single command for each permission
+		groups : dict[str, list[str]] = {}
 		for perm, fname in FIX_PERMISSION:
 			self.Info(_("\n\tApplying default permission for {}").format(shlex.quote(fname)))
-			self.workflow.ExecCommand(f"chmod {perm} {shlex.quote(fname)}")
+			groups.setdefault(perm, []).append(shlex.quote(fname))
+		cnt = 0
+		for perm, fnames in groups.items():
+			# Only files actually changed are listed, as: mode of '...' changed from 0755 (rwxr-xr-x) to 0644 (rw-r--r--)
+			res = self.workflow.ExecCommand(f"chmod -c {perm} {' '.join(fnames)}")
+			# Files that cannot be changed are reported as `chmod: cannot access ...` and are not counted
+			cnt += len([l for l in res if l.startswith('mode of ')])
+		self.Bold(_('\n\t{} files fixed\n').format(cnt))
 
 
 class FixHomePermission(Task):
+	# Shell tasks run in list order, so files are already erased
+	DEPENDS = ("StopKlipper",)
+	RESOURCES = (RES_SHELL,)
 	def __init__(self, workflow : "Workflow") -> None:
 		super().__init__(workflow, N_("Fix home folder permissions"), workflow.opts.file_permissions and TaskState.READY or TaskState.DISABLED)
 	def Do(self):
 		super().Do()
 		# spellchecker: enable
 		self.Info(_("\n\tSearching for locked files on user folder...  "))
-		files = self.workflow.ExecCommand("find /home/mks/ -not -user mks -not -group mks", 120)
-		# Filter files used by 'root' services
-		sel = []
-		for f in files:
-			if fnmatch.fnmatch(f, '/home/mks/klipper_logs/moonraker-obico.*'):
-				continue
-			# spellchecker:disable-next-line
-			if fnmatch.fnmatch(f, '/home/mks/Desktop/myfile/ws/yuntu_plr*'):
-				continue
-			sel.append(f)
+		# Files used by 'root' services are filtered by find; selected files are listed and fixed in batches
+		keep = ' '.join([f"-not -path {shlex.quote(pat)}" for pat in KEEP_OWNER])
+		res = self.workflow.ExecCommand(f"find /home/mks/ -not -user mks -not -group mks {keep} -print -exec chown mks:mks {{}} +", 120)
+		sel = [f for f in res if not f.startswith(('find: ', 'chown: '))]
 		# After filtering, this is the remainder
 		self.Bold(_('{} files found\n').format(len(sel)))
 		for f in sel:
 			self.Info(_("\tFixing file {}...\n").format(f))
-			self.workflow.ExecCommand("chown mks:mks {}".format(shlex.quote(f)))
@@ -1,118 +1,167 @@
 #
 # -*- coding: UTF-8 -*-
 #
-# Spellchecker: words klipper, makerbase, obico
-
-import time
+# Spellchecker: words klipper, makerbase, obico, klippy
 
+import shlex
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
 	from .i18n import _, N_
-	from .my_workflow import Workflow, Task, TaskState
+	from .my_workflow import Workflow, Task, TaskState, RES_SHELL
+	from .my_shell import UnitState
 else:
 	from i18n import _, N_
-	from my_workflow import Workflow, Task, TaskState
+	from my_workflow import Workflow, Task, TaskState, RES_SHELL
+	from my_shell import UnitState
+
+
+# Services handled by the workflow, in the order they are stopped
+SERVICES = ["makerbase-client", "makerbase-webcam", "moonraker-obico", "moonraker", "klipper"]
+# Time for a service to become ready after it was started
+START_DEADLINE = 60.0
+WEBCAM_DEADLINE = 150.0
+# Klipper API socket (see `klippy_uds_address` on moonraker.conf) and Moonraker TCP port
+KLIPPY_UDS = "/tmp/klippy_uds"
+MOONRAKER_PORT = 7125
+
+
+class Service_(Task):
+	"""
+	A service task of a group applying the same `systemctl` verb. The first task of the group that runs
+	applies it to all `SERVICES` at once; each task then checks the state of its own units.
+	"""
+	VERB = ""
+	UNITS : tuple[str, ...] = ()
+	def Batch(self, timeout = 60, wait = True) -> dict[str, UnitState]:
+		workflow = self.workflow
+		if self.VERB not in workflow.unit_states:
+			workflow.unit_states[self.VERB] = workflow.SystemCtl(self.VERB, SERVICES, timeout, wait)
+		return workflow.unit_states[self.VERB]
+	def States(self, timeout = 60, wait = True) -> list[UnitState]:
+		" States of the units of the task, skipping the ones not installed "
+		states = self.Batch(timeout, wait)
+		return [states[u] for u in self.UNITS if (u in states) and states[u].found]
+
+class Stop_(Service_):
+	VERB = "stop"
+	def Do(self):
+		super().Do()
+		for state in self.States(300):
+			if state.running:
+				raise Exception(_("Service '{0}' could not be stopped!").format(state.id))
 
+class Enable_(Service_):
+	VERB = "enable"
+	def Do(self):
+		super().Do()
+		for state in self.States(60):
+			if state.unit_file not in ("enabled", "enabled-runtime", "static"):
+				self.Warning(_("\n\tService '{0}' is {1}.\n").format(state.id, state.unit_file))
 
-class StopUserInterface(Task):
+class Start_(Service_):
+	VERB = "start"
+	def Do(self):
+		super().Do()
+		# Jobs are just queued, so the state read back may still be the one of an earlier run;
+		# each task waits for its own service to be ready and only then looks for a failure
+		self.Batch(60, False)
+	def CheckReady(self, ready : bool, service : str) -> None:
+		" Raises if the service did not become ready, telling a failure from a slow start "
+		if ready:
+			return
+		if self.workflow.Exec(f"systemctl is-failed --quiet {shlex.quote(service)}").ok:
+			raise Exception(_("Service '{0}' failed to start!").format(service))
+		raise Exception(_("Service '{0}' did not start in time!").format(service))
+
+class StopUserInterface(Stop_):
+	UNITS = ("makerbase-client",)
 	def __init__(self, workflow : "Workflow") -> None:
 		super().__init__(workflow, N_("Stopping User Interface Service"), TaskState.READY)
 	def Do(self):
 		super().Do()
-		self.workflow.ExecCommand("systemctl stop makerbase-client", 60)
 		self.Info(_("\n\tPrinter display is now unresponsive.\n"))
 
-class StopWebCam(Task):
+class StopWebCam(Stop_):
+	UNITS = ("makerbase-webcam",)
 	def __init__(self, workflow : "Workflow") -> None:
 		super().__init__(workflow, N_("Stopping WebCam Service"), TaskState.READY)
-	def Do(self):
-		super().Do()
-		self.workflow.ExecCommand("systemctl stop makerbase-webcam", 60)
 
-class StopMoonraker(Task):
+class StopMoonraker(Stop_):
+	UNITS = ("moonraker-obico", "moonraker")
 	def __init__(self, workflow : "Workflow") -> None:
 		super().__init__(workflow, N_("Stopping Moonraker Service"), TaskState.READY)
 	def Do(self):
 		super().Do()
-		self.workflow.ExecCommand("systemctl stop moonraker-obico", 60)
-		self.workflow.ExecCommand("systemctl stop moonraker", 60)
 		self.Info(_("\n\tWeb access is down.\n"))
 
-class StopKlipper(Task):
+class StopKlipper(Stop_):
+	UNITS = ("klipper",)
 	def __init__(self, workflow : "Workflow") -> None:
 		super().__init__(workflow, N_("Stopping Klipper Service"), TaskState.READY)
 	def Do(self):
 		super().Do()
-		self.workflow.ExecCommand("systemctl stop klipper", 60)
 		self.Info(_("\n\tKlipper is down.\n"))
 
-class EnableUserInterface(Task):
+class EnableUserInterface(Enable_):
+	UNITS = ("makerbase-client",)
 	def __init__(self, workflow : "Workflow") -> None:
 		super().__init__(workflow, N_("Enabling User Interface Service"), TaskState.CONNECTED)
-	def Do(self):
-		super().Do()
-		self.workflow.ExecCommand("systemctl enable makerbase-client", 60)
 
-class EnableWebCam(Task):
+class EnableWebCam(Enable_):
+	UNITS = ("makerbase-webcam",)
 	def __init__(self, workflow : "Workflow") -> None:
 		super().__init__(workflow, N_("Enabling WebCam Service"), TaskState.CONNECTED)
-	def Do(self):
-		super().Do()
-		self.workflow.ExecCommand("systemctl enable makerbase-webcam", 60)
 
-class EnableMoonraker(Task):
+class EnableMoonraker(Enable_):
+	UNITS = ("moonraker-obico", "moonraker")
 	def __init__(self, workflow : "Workflow") -> None:
 		super().__init__(workflow, N_("Enabling Moonraker Service"), TaskState.CONNECTED)
-	def Do(self):
-		super().Do()
-		self.workflow.ExecCommand("systemctl enable moonraker-obico", 60)
-		self.workflow.ExecCommand("systemctl enable moonraker", 60)
 
-class EnableKlipper(Task):
+class EnableKlipper(Enable_):
+	UNITS = ("klipper",)
 	def __init__(self, workflow : "Workflow") -> None:
 		super().__init__(workflow, N_("Enabling Klipper Service"), TaskState.CONNECTED)
-	def Do(self):
-		super().Do()
-		self.workflow.ExecCommand("systemctl enable klipper", 60)
 
-class StartKlipper(Task):
+class StartKlipper(Start_):
+	UNITS = ("klipper",)
 	def __init__(self, workflow : "Workflow") -> None:
 		super().__init__(workflow, N_("Starting Klipper Service"), TaskState.CONNECTED)
 	def Do(self):
 		super().Do()
-		self.workflow.ExecCommand("systemctl start klipper", 120)
 		self.Info(_("\n\tWaiting for Klipper to start..."))
-		time.sleep(5)
+		self.CheckReady(self.workflow.WaitUnixSocket(KLIPPY_UDS, START_DEADLINE), "klipper")
 
-class StartMoonraker(Task):
+class StartMoonraker(Start_):
+	UNITS = ("moonraker", "moonraker-obico")
 	def __init__(self, workflow : "Workflow") -> None:
 		super().__init__(workflow, N_("Starting Moonraker Service"), TaskState.CONNECTED)
 	def Do(self):
 		super().Do()
-		self.workflow.ExecCommand("systemctl start moonraker", 120)
-		self.workflow.ExecCommand("systemctl start moonraker-obico", 120)
 		self.Info(_("\n\tWaiting for Moonraker to start..."))
-		time.sleep(3)
+		self.CheckReady(self.workflow.WaitTcpPort(MOONRAKER_PORT, START_DEADLINE), "moonraker")
 
-class StartWebCam(Task):
+class StartWebCam(Start_):
+	UNITS = ("makerbase-webcam",)
 	def __init__(self, workflow : "Workflow") -> None:
 		super().__init__(workflow, N_("Starting WebCam Service"), TaskState.CONNECTED)
 	def Do(self):
 		super().Do()
 		self.Info(_("\n\tBe patient...\n"))
-		self.workflow.ExecCommand("systemctl start makerbase-webcam", 150)
+		self.CheckReady(self.workflow.WaitServiceActive("makerbase-webcam", WEBCAM_DEADLINE), "makerbase-webcam")
 
-class StartUserInterface(Task):
+class StartUserInterface(Start_):
+	UNITS = ("makerbase-client",)
 	def __init__(self, workflow : "Workflow") -> None:
 		super().__init__(workflow, N_("Starting User Interface Service"), TaskState.CONNECTED)
 	def Do(self):
 		super().Do()
-		self.workflow.ExecCommand("systemctl start makerbase-client", 120)
 		self.Info(_("\n\tWaiting for User Interface to start..."))
-		time.sleep(10)
+		self.CheckReady(self.workflow.WaitServiceActive("makerbase-client", START_DEADLINE), "makerbase-client")
 
 class FixCardResizeBug(Task):
+	DEPENDS = ("StopKlipper",)
+	RESOURCES = (RES_SHELL,)
 	def __init__(self, workflow : "Workflow") -> None:
 		super().__init__(workflow, N_("Fix for card resize bug"), workflow.opts.resize_bug and TaskState.READY or TaskState.DISABLED)
 	def UpdateState(self):
@@ -0,0 +1,293 @@
+#
+# -*- coding: UTF-8 -*-
+#
+# Spellchecker: words USWX gcode
+
+import os
+import sys
+import glob
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
+
+# Enable test environment
+os.environ["USWX4_TEST"] = "bench_edit_cfg"
+
+
+# Get the directory of the current script
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# Construct the path to the 'project' directory
+project_dir = os.path.normpath(os.path.join(current_dir, '..'))
+assets_dir = os.path.normpath(os.path.join(project_dir, 'assets'))
+
+bench_file = os.path.join(current_dir, 'bench.cfg')
+
+# Add the 'project_dir' directory to sys.path
+sys.path.append(project_dir)
+
+if TYPE_CHECKING:
+	from ..edit_cfg import *
+	from .test_utils import *
+else:
+	from edit_cfg import *
+	from test_utils import *
+
+
+# Approximate size of the synthetic configuration files, in lines
+SIZES = [10000, 30000, 100000]
+# Number of lines of the G-Code of each macro
+MACRO_LINES = 60
+# Number of edits of each kind applied on a single run
+EDITS = 100
+# Number of repetitions for each measure
+LOOPS = 3
+
+
+def MakeMacro(i : int, tag : str = 'old') -> list[str]:
+	" Generates a macro section with a `MACRO_LINES` long G-Code "
+	res = [
+		f"[gcode_macro MACRO_{i}]",
+		f"description: Synthetic macro {i}",
+		"gcode:",
+	]
+	for j in range(MACRO_LINES):
+		res.append(f"\tG1 X{j} Y{i % 100} F3000 ; {tag}")
+	res.append("")
+	return res
+
+
+def MakeStepper(i : int) -> list[str]:
+	" Generates a section with simple values "
+	return [
+		f"[stepper_{i}]",
+		"# Comment for the step pin",
+		f"step_pin: PA{i % 16}",
+		f"dir_pin: !PB{i % 16}",
+		f"enable_pin: !PC{i % 16}",
+		"microsteps: 16",
+		"rotation_distance: 40",
+		f"position_max: {i}",
+		"",
+	]
+
+
+def MakeConfig(size : int) -> list[str]:
+	" Generates a configuration file with approximately `size` lines "
+	res = []
+	i = 0
+	while len(res) < size:
+		res.extend(MakeMacro(i))
+		res.extend(MakeStepper(i))
+		i += 1
+	return res
+
+
+def Spread(count : int, n : int) -> list[int]:
+	" Selects `n` indexes evenly spread over `count` items "
+	step = max(count // n, 1)
+	return list(range(0, count, step))[:n]
+
+
+def ReplaceMacros(contents : Contents, count : int) -> None:
+	" Replaces the G-Code of some macros, like `Commands.EditKeyML` "
+	for i in Spread(count, EDITS):
+		buffer = contents.FindSection(f"gcode_macro MACRO_{i}")
+		assert buffer is not None
+		ml = buffer.GetMultiLine('gcode', False)
+		assert ml is not None
+		nl = FileBuffer(MakeMacro(i, 'new')[2:-1]).lines
+		pos = contents.file_buffer.RemoveLineList(ml)
+		contents.file_buffer.InsertLineList(pos, nl, buffer)
+
+
+def DeleteKeys(contents : Contents, count : int) -> None:
+	" Removes values of some sections, like `Commands.DelKey` "
+	for i in Spread(count, EDITS):
+		buffer = contents.FindSection(f"stepper_{i}")
+		assert buffer is not None
+		ml = buffer.FindValueRange('step_pin')
+		contents.file_buffer.RemoveLineList(ml)
+
+
+def DeleteSections(contents : Contents, count : int) -> None:
+	" Removes entire sections, like `Commands.DelSec` "
+	for i in Spread(count, EDITS):
+		buffer = contents.FindSection(f"gcode_macro MACRO_{i}")
+		assert buffer is not None
+		contents.RemoveSection(buffer)
+
+
+def AddSections(contents : Contents, count : int) -> None:
+	" Inserts new sections, like `Commands.AddSec` "
+	for i in range(EDITS):
+		nl = FileBuffer(MakeStepper(count + i)).lines
+		contents.AddSectionAfter(f"stepper_{(i * 37) % count}", nl)
+
+
+OPERATIONS = [
+	("Replace macro", ReplaceMacros),
+	("Delete key", DeleteKeys),
+	("Delete section", DeleteSections),
+	("Add section", AddSections),
+]
+
+
+def OverwriteLarge(contents : Contents, nl : Lines) -> None:
+	" Replaces a single section containing the entire macro G-Code, like `Commands.OvrSec` "
+	contents.OverwriteSection("gcode_macro LARGE", nl)
+
+
+def MakeLargeMacro(count : int, tag : str = 'old') -> list[str]:
+	" Generates a single macro with `count` lines of G-Code "
+	res = [
+		"[gcode_macro LARGE]",
+		"gcode:",
+	]
+	for j in range(count):
+		res.append(f"\tG1 X{j % 300} Y{j % 200} F3000 ; {tag}")
+	return res
+
+
+def Measure(data : list[str], arg, op, setup = None) -> float:
+	" Returns the best time of the operation on a fresh copy of the file "
+	best = None
+	for _ in range(LOOPS):
+		contents = Contents()
+		contents.EnterList(data)
+		# Parsing of new contents is not part of the measure
+		param = (setup is not None) and setup(arg) or arg
+		start = time.perf_counter()
+		op(contents, param)
+		# Line numbers must be consistent when the work is done
+		contents.file_buffer.lines[-1].line_no
+		t = time.perf_counter() - start
+		if (best is None) or (t < best):
+			best = t
+	assert best is not None
+	return best
+
+
+def MeasureDiff(data : list[str], count : int) -> tuple[float, float]:
+	" Returns the best time to compare a file with an edited copy, on the first and on a second comparison "
+	cold = warm = None
+	for _ in range(LOOPS):
+		old = Contents()
+		old.EnterList(data)
+		new = Contents()
+		new.EnterList(data)
+		DeleteKeys(new, count)
+		start = time.perf_counter()
+		diff = DiffContents(old, new)
+		t1 = time.perf_counter() - start
+		start = time.perf_counter()
+		DiffContents(old, new)
+		t2 = time.perf_counter() - start
+		assert len(diff) == len(Spread(count, EDITS))
+		if (cold is None) or (t1 < cold):
+			cold = t1
+		if (warm is None) or (t2 < warm):
+			warm = t2
+	assert (cold is not None) and (warm is not None)
+	return cold, warm
+
+
+def LoadStreamed() -> Contents:
+	" Single pass loader "
+	contents = Contents()
+	contents.Load(bench_file)
+	return contents
+
+
+def LoadListed() -> Contents:
+	" Reads all lines into a list, then parse and group them "
+	with open(bench_file, 'rt', encoding="utf-8") as fr:
+		return Contents(fr.readlines())
+
+
+def MeasureLoad(loader) -> tuple[float, int]:
+	" Returns the best time and the peak memory use of a loader "
+	best = None
+	for _ in range(LOOPS):
+		start = time.perf_counter()
+		loader()
+		t = time.perf_counter() - start
+		if (best is None) or (t < best):
+			best = t
+	assert best is not None
+	tracemalloc.start()
+	contents = loader()
+	peak = tracemalloc.get_traced_memory()[1]
+	tracemalloc.stop()
+	del contents
+	return best, peak
+
+
+def MeasureParse() -> tuple[int, float]:
+	" Returns the number of lines of all assets and the best time to parse them "
+	files = sorted(glob.glob(os.path.join(assets_dir, "*.cfg")))
+	files.append(os.path.join(current_dir, "test-reference.cfg"))
+	data = []
+	for fname in files:
+		with open(fname, 'rt', encoding="utf-8") as fr:
+			data.append(fr.readlines())
+	best = None
+	for _ in range(LOOPS * 3):
+		start = time.perf_counter()
+		for lines in data:
+			FileBuffer(lines)
+		t = time.perf_counter() - start
+		if (best is None) or (t < best):
+			best = t
+	assert best is not None
+	return sum([len(lines) for lines in data]), best
+
+
+def main():
+	print(BOLD + f"{'Operation':16}" + ''.join([f"{str(s) + ' lines':>16}" for s in SIZES]) + NORMAL)
+	configs = []
+	for size in SIZES:
+		data = MakeConfig(size)
+		count = len(data) // (len(MakeMacro(0)) + len(MakeStepper(0)))
+		configs.append((data, count))
+	for title, op in OPERATIONS:
+		row = f"{title:16}"
+		for data, count in configs:
+			t = Measure(data, count, op)
+			row += f"{t * 1000000.0 / EDITS:12.1f}us/op"
+		print(row)
+	# Bulk operations over a single section should scale linearly
+	row = f"{'Overwrite large':16}"
+	for size in SIZES:
+		data = MakeLargeMacro(size)
+		t = Measure(data, MakeLargeMacro(size, 'new'), OverwriteLarge, lambda new : FileBuffer(new).lines)
+		row += f"{t * 1000.0:14.1f}ms"
+	print(row)
+	# Structural diff of a file and an edited copy
+	row1 = f"{'Diff contents':16}"
+	row2 = f"{'Diff again':16}"
+	for data, count in configs:
+		cold, warm = MeasureDiff(data, count)
+		row1 += f"{cold * 1000.0:14.1f}ms"
+		row2 += f"{warm * 1000.0:14.1f}ms"
+	print(row1)
+	print(row2)
+	# Loading files
+	rows = [(title, loader, f"{title:16}", f"{'':16}") for title, loader in (("Load streamed", LoadStreamed), ("Load listed", LoadListed))]
+	for data, count in configs:
+		with open(bench_file, 'wt', encoding="utf-8") as fw:
+			for line in data:
+				print(line, file=fw)
+		for i, (title, loader, row, mem) in enumerate(rows):
+			t, peak = MeasureLoad(loader)
+			rows[i] = (title, loader, row + f"{t * 1000.0:14.1f}ms", mem + f"{peak / 1048576.0:14.1f}MB")
+	for title, loader, row, mem in rows:
+		print(row)
+		print(mem)
+	os.unlink(bench_file)
+	# Line classification throughput
+	count, t = MeasureParse()
+	print(f"{'Parse assets':16}{count:>10} lines{count / t:14.0f} lines/s")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,115 @@
+#
+# -*- coding: UTF-8 -*-
+#
+# Spellchecker: words USWX deepcopy
+
+import os
+import sys
+import copy
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
+
+# Enable test environment
+os.environ["USWX4_TEST"] = "bench_snapshot"
+
+
+# Get the directory of the current script
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# Construct the path to the 'project' directory
+project_dir = os.path.normpath(os.path.join(current_dir, '..'))
+assets_dir = os.path.normpath(os.path.join(project_dir, 'assets'))
+
+# Add the 'project_dir' directory to sys.path
+sys.path.append(project_dir)
+
+if TYPE_CHECKING:
+	from ..edit_cfg import *
+	from .test_utils import *
+else:
+	from edit_cfg import *
+	from test_utils import *
+
+
+# All configuration files of the printer models
+ASSETS = [
+	"artillery_X4_pro.def.cfg",
+	"artillery_X4_pro.upg.cfg",
+	"artillery_X4_pro.grumat.cfg",
+	"artillery_X4_plus.def.cfg",
+	"artillery_X4_plus.upg.cfg",
+	"artillery_X4_plus.grumat.cfg",
+]
+# Number of repetitions for each measure
+LOOPS = 5
+
+
+def TakeSnapshot(cmd : Commands, fname : str):
+	return cmd.contents.Snapshot()
+
+def DeepCopy(cmd : Commands, fname : str):
+	return copy.deepcopy(cmd.contents)
+
+def ReRead(cmd : Commands, fname : str):
+	" What `ConfigReset` used to do to get the persistence block of the file "
+	return Commands(fname)
+
+
+METHODS = [
+	("Snapshot", TakeSnapshot),
+	("Deep copy", DeepCopy),
+	("Re-read", ReRead),
+]
+
+
+def Measure(cmd : Commands, fname : str, method) -> tuple[float, int]:
+	" Returns the best time and the memory retained by the copy "
+	best = None
+	for _ in range(LOOPS):
+		start = time.perf_counter()
+		method(cmd, fname)
+		t = time.perf_counter() - start
+		if (best is None) or (t < best):
+			best = t
+	assert best is not None
+	tracemalloc.start()
+	res = method(cmd, fname)
+	size = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	del res
+	return best, size
+
+
+def main():
+	# Copies hold references to the whole structure
+	sys.setrecursionlimit(100000)
+	print(BOLD + f"{'Method':12}" + ''.join([f"{a.replace('artillery_X4_', '').replace('.cfg', ''):>22}" for a in ASSETS]) + NORMAL)
+	rows = [(f"{title:12}", f"{'':12}") for title, _ in METHODS]
+	for asset in ASSETS:
+		fname = os.path.join(assets_dir, asset)
+		cmd = Commands(fname)
+		for i, (title, method) in enumerate(METHODS):
+			t, size = Measure(cmd, fname, method)
+			row, mem = rows[i]
+			rows[i] = (row + f"{t * 1000.0:20.3f}ms", mem + f"{size / 1024.0:20.1f}KB")
+	for row, mem in rows:
+		print(row)
+		print(mem)
+	# A snapshot after each edit, like the per-step dumps of `Workflow.Test`
+	cmd = Commands(os.path.join(assets_dir, ASSETS[2]))
+	snapshots = []
+	size = 0
+	tracemalloc.start()
+	for sec in cmd.ListSections():
+		if sec.is_head:
+			cmd.EditKey(sec.label, 'bench_key', '1')
+			# Just the memory of the snapshot, not the one of the edit
+			before = tracemalloc.get_traced_memory()[0]
+			snapshots.append(cmd.contents.Snapshot())
+			size += tracemalloc.get_traced_memory()[0] - before
+	tracemalloc.stop()
+	print(f"{len(snapshots)} snapshots of {len(snapshots[-1])} lines, one per edit: {size / 1024.0:.1f}KB")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,111 @@
+#
+# -*- coding: UTF-8 -*-
+#
+# Spellchecker: words USWX
+
+import os
+import sys
+import io
+import shutil
+import time
+import contextlib
+from typing import TYPE_CHECKING
+
+# Enable test environment
+os.environ["USWX4_TEST"] = "bench_task_config"
+
+
+# Get the directory of the current script
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# Construct the path to the 'assets' directory
+project_dir = os.path.normpath(os.path.join(current_dir, '..'))
+assets_dir = os.path.normpath(os.path.join(project_dir, 'assets'))
+
+# Add the 'project_dir' directory to sys.path
+sys.path.append(project_dir)
+
+if TYPE_CHECKING:
+	from ..user_options import UserOptions
+	from ..my_workflow import Workflow
+	from ..edit_cfg import Commands
+	from .. import task_config
+	from .test_utils import *
+else:
+	from user_options import UserOptions
+	from my_workflow import Workflow
+	from edit_cfg import Commands
+	import task_config
+	from test_utils import *
+
+
+# All configuration files of the printer models
+ASSETS = [
+	"artillery_X4_pro.def.cfg",
+	"artillery_X4_pro.upg.cfg",
+	"artillery_X4_pro.grumat.cfg",
+	"artillery_X4_plus.def.cfg",
+	"artillery_X4_plus.upg.cfg",
+	"artillery_X4_plus.grumat.cfg",
+]
+# Number of repetitions for each measure
+LOOPS = 5
+
+bench_file = os.path.join(current_dir, 'bench.cfg')
+
+
+def GetPlanClasses() -> list[type]:
+	" Collects every `StmtList_` subclass that has a `PLAN` table "
+	res = []
+	for obj in vars(task_config).values():
+		if isinstance(obj, type) \
+			and issubclass(obj, task_config.StmtList_) \
+			and hasattr(obj, 'PLAN'):
+			res.append(obj)
+	return res
+
+
+def RunPlan(wf : Workflow, cls : type, asset : str) -> float:
+	" Applies all combo options of a plan to a fresh copy of the asset and returns the elapsed time "
+	elapsed = 0.0
+	for combo in range(4):
+		shutil.copyfile(os.path.join(assets_dir, asset), bench_file)
+		wf.editor = Commands(bench_file)
+		wf.modify_cfg = 0
+		wf.upgraded_cfg = ('upg' in asset) or ('grumat' in asset)
+		task = cls(wf)
+		start = time.perf_counter()
+		task.RunPlan(task.PLAN, combo)
+		elapsed += time.perf_counter() - start
+	return elapsed
+
+
+def main():
+	opts = UserOptions()
+	classes = GetPlanClasses()
+	print(BOLD + f"{'Plan':24}" + ''.join([f"{a.replace('artillery_X4_', '').replace('.cfg', ''):>14}" for a in ASSETS]) + f"{'Total':>12}" + NORMAL)
+	grand = 0.0
+	for cls in classes:
+		row = f"{cls.__name__:24}"
+		total = 0.0
+		for asset in ASSETS:
+			opts.printer = ('plus' in asset) and 1 or 0
+			wf = Workflow(opts)
+			best = None
+			for _ in range(LOOPS):
+				# Plans are verbose in test mode; we are just interested in the timing
+				with contextlib.redirect_stdout(io.StringIO()):
+					t = RunPlan(wf, cls, asset)
+				if (best is None) or (t < best):
+					best = t
+			assert best is not None
+			total += best
+			row += f"{best * 1000.0:12.3f}ms"
+		grand += total
+		print(row + f"{total * 1000.0:10.3f}ms")
+	print(BOLD + f"{'All plans':24}" + ' ' * (14 * len(ASSETS)) + f"{grand * 1000.0:10.3f}ms" + NORMAL)
+	if os.path.exists(bench_file):
+		os.unlink(bench_file)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,118 @@
+#
+# -*- coding: UTF-8 -*-
+#
+# Spellchecker: words USWX
+
+import os
+import sys
+import shutil
+from typing import TYPE_CHECKING
+
+# Enable test environment
+os.environ["USWX4_TEST"] = "test_backup_store"
+
+
+# Get the directory of the current script
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# Construct the path to the 'assets' directory
+project_dir = os.path.normpath(os.path.join(current_dir, '..'))
+assets_dir = os.path.normpath(os.path.join(project_dir, 'assets'))
+
+store_dir = os.path.join(current_dir, 'store')
+
+# Add the 'project_dir' directory to sys.path
+sys.path.append(project_dir)
+
+if TYPE_CHECKING:
+	from ..backup_store import BackupStore
+	from ..edit_cfg import Commands
+	from .test_utils import *
+else:
+	from backup_store import BackupStore
+	from edit_cfg import Commands
+	from test_utils import *
+
+
+PRO_DEF = os.path.join(assets_dir, "artillery_X4_pro.def.cfg")
+PRO_UPG = os.path.join(assets_dir, "artillery_X4_pro.upg.cfg")
+PLUS_DEF = os.path.join(assets_dir, "artillery_X4_plus.def.cfg")
+DAY = 24 * 3600.0
+
+
+def Sections(fname : str) -> list[tuple[str, int]]:
+	return [(s.label, int(s.crc)) for s in Commands(fname).ListSections() if s.is_head]
+
+
+def Test_Dedup() -> bool:
+	store = BackupStore(store_dir)
+	a = store.Put(PRO_DEF, "printer-1", "a.cfg", Sections(PRO_DEF), 1000.0)
+	b = store.Put(PRO_DEF, "printer-1", "b.cfg", Sections(PRO_DEF), 2000.0)
+	c = store.Put(PRO_DEF, "printer-2", "c.cfg", Sections(PRO_DEF), 3000.0)
+	if not (a.sha256 == b.sha256 == c.sha256) or (len(store.blobs) != 1) or (len(store.entries) != 3):
+		print(RED + "Identical files were stored twice" + NORMAL)
+		return False
+	if not files_equal(store.Get(a), PRO_DEF):
+		print(RED + "Stored file differs" + NORMAL)
+		return False
+	# A new instance reads the index back
+	store = BackupStore(store_dir)
+	if [e.name for e in store.History("printer-1")] != ["a.cfg", "b.cfg"]:
+		print(RED + "Index was not saved" + NORMAL)
+		return False
+	return True
+
+
+def Test_Diff() -> bool:
+	store = BackupStore(store_dir)
+	new = store.Put(PRO_UPG, "printer-1", "d.cfg", Sections(PRO_UPG), 4000.0)
+	prev = store.Previous(new)
+	if (prev is None) or (prev.name != "b.cfg"):
+		print(RED + f"Wrong previous backup: {prev}" + NORMAL)
+		return False
+	diff = store.Diff(prev, new)
+	if (diff is None) or diff.IsEmpty():
+		print(RED + "Changes were not found" + NORMAL)
+		return False
+	print(f"Changes: {diff}")
+	# Reference values, parsing both files
+	old = dict(Sections(PRO_DEF))
+	cur = dict(Sections(PRO_UPG))
+	if sorted(diff.changed) != sorted([s for s in cur if (s in old) and (old[s] != cur[s])]) \
+		or sorted(diff.added) != sorted([s for s in cur if s not in old]) \
+		or sorted(diff.removed) != sorted([s for s in old if s not in cur]):
+		print(RED + "Diff does not match the files" + NORMAL)
+		return False
+	return True
+
+
+def Test_Retention() -> bool:
+	store = BackupStore(store_dir, max_bytes = os.path.getsize(PRO_UPG) + os.path.getsize(PLUS_DEF))
+	# Over the size limit; the least recently used is evicted
+	store.Put(PLUS_DEF, "printer-2", "e.cfg", None, 5000.0)
+	if (len(store.blobs) != 2) or store.History("printer-1")[0].name != "d.cfg":
+		print(RED + f"Unexpected eviction: {store.entries}" + NORMAL)
+		return False
+	# Over the age limit, but the latest backup of each printer is kept
+	store.max_bytes = 1 << 30
+	store.Put(PLUS_DEF, "printer-1", "f.cfg", None, 5000.0 + 400 * DAY)
+	names = sorted([e.name for e in store.entries])
+	if names != ["e.cfg", "f.cfg"] or not os.path.isfile(store.BlobPath(store.entries[0].sha256)):
+		print(RED + f"Unexpected entries after aging: {names}" + NORMAL)
+		return False
+	return True
+
+
+def main():
+	if os.path.isdir(store_dir):
+		shutil.rmtree(store_dir)
+	res = Test_Dedup() and Test_Diff() and Test_Retention()
+	if os.path.isdir(store_dir):
+		shutil.rmtree(store_dir)
+	if res:
+		print(GREEN + "Test PASSED!" + NORMAL)
+	else:
+		print(RED + "Test FAILED!" + NORMAL)
+
+
+if __name__ == "__main__":
+	main()
@@ -5,6 +5,7 @@
 
 import os
 import sys
+import glob
 from typing import TYPE_CHECKING
 
 from test_utils import *
@@ -22,9 +23,178 @@ sys.path.append(lib_dir)
 sys.path.append(assets_dir)
 # Now you can import helper_functions as if it were a module
 if TYPE_CHECKING:
-	from ..edit_cfg import Contents
+	from ..edit_cfg import Contents, ContentsSnapshot, Commands, LinesB64, DiffContents
 else:
-	from edit_cfg import Contents
+	from edit_cfg import Contents, ContentsSnapshot, Commands, LinesB64, DiffContents
+
+
+def DumpStructure(contents : Contents) -> list[str]:
+	" Describes every line, including the identity of the buffer that owns it "
+	buffers = {}
+	for b in contents.includes + contents.sections + [contents.persistence]:
+		buffers.setdefault(id(b), len(buffers))
+	res = []
+	for line in contents.file_buffer.lines:
+		owner = None
+		if line.buffer is not None:
+			owner = buffers.get(id(line.buffer))
+		res.append(f"{line.line_no} {owner} {repr(line)}")
+	res.append(f"sections: {[buffers[id(b)] for b in contents.sections]}")
+	for b in contents.includes + contents.sections + [contents.persistence]:
+		res.append(f"{buffers[id(b)]} {b.GetTitle()} {[l.line_no for l in b.lines]}")
+	return res
+
+
+def TestStreamingLoad() -> bool:
+	" The single pass loader has to produce the same structure of the list based one "
+	files = sorted(glob.glob(os.path.join(assets_dir, "*.cfg")))
+	files.append(os.path.join(current_dir, "test-reference.cfg"))
+	ok = True
+	for fname in files:
+		streamed = Contents()
+		streamed.Load(fname)
+		with open(fname, 'rt', encoding="utf-8") as fr:
+			listed = Contents(fr.readlines())
+		if DumpStructure(streamed) != DumpStructure(listed):
+			print(RED + f"Structure mismatch loading {os.path.basename(fname)}" + NORMAL)
+			ok = False
+	return ok
+
+
+def ApplyEdits(cmd : Commands) -> None:
+	" Values, sections and renames, so every kind of change has to be undone "
+	cmd.EditKey('printer', 'max_velocity', '500')
+	cmd.EditKey('printer', 'new_key', '1')
+	cmd.DelKey('extruder', 'rotation_distance')
+	cmd.AddSec(0, LinesB64(Contents(['\n', '[top]\n', 'success:1\n']).sections[0].lines))
+	cmd.AddSec(-1, LinesB64(Contents(['\n', '[bottom]\n', 'success:1\n']).sections[0].lines))
+	cmd.OvrSec('extruder', LinesB64(Contents(['\n', '[extruder]\n', 'bye_bye:1\n']).sections[0].lines))
+	cmd.DelSec('bed_mesh')
+	cmd.RenSec('probe', 'probe_renamed')
+
+
+def TestTransaction() -> bool:
+	" Edits in a batch give the same result, and are undone when an exception escapes the block "
+	source = os.path.join(assets_dir, "artillery_X4_pro.grumat.cfg")
+	ok = True
+	# Reference: edits applied one by one
+	plain = Commands(source)
+	ApplyEdits(plain)
+	expected = DumpStructure(plain.contents)
+	# Same edits in a batch
+	batch = Commands(source)
+	with batch.Batch():
+		ApplyEdits(batch)
+	if DumpStructure(batch.contents) != expected:
+		print(RED + "Batch edits differ from single edits" + NORMAL)
+		ok = False
+	# Rollback, also for a nested batch that already completed
+	undo = Commands(source)
+	original = DumpStructure(undo.contents)
+	try:
+		with undo.Batch():
+			with undo.Batch():
+				ApplyEdits(undo)
+			raise RuntimeError("abort")
+	except RuntimeError:
+		pass
+	if DumpStructure(undo.contents) != original:
+		print(RED + "Batch was not rolled back" + NORMAL)
+		ok = False
+	if (undo.ListSection('bed_mesh') is None) or (undo.GetKey('printer', 'max_velocity') != '1000'):
+		print(RED + "Commands do not see the restored contents" + NORMAL)
+		ok = False
+	# Contents stay usable after the rollback
+	ApplyEdits(undo)
+	if DumpStructure(undo.contents) != expected:
+		print(RED + "Edits after a rollback differ from single edits" + NORMAL)
+		ok = False
+	return ok
+
+
+def TestSnapshot() -> bool:
+	" Snapshots keep the state they were taken, sharing the text of lines that were not edited "
+	source = os.path.join(assets_dir, "artillery_X4_pro.grumat.cfg")
+	ok = True
+	cmd = Commands(source)
+	before = cmd.contents.Snapshot()
+	ApplyEdits(cmd)
+	after = cmd.contents.Snapshot()
+	reference = Contents()
+	reference.Load(source)
+	if (before.text != tuple([l.raw_content for l in reference.file_buffer.lines])) or (cmd.original != before):
+		print(RED + "Snapshot does not match the loaded file" + NORMAL)
+		ok = False
+	if DumpStructure(before.Materialize()) != DumpStructure(reference):
+		print(RED + "Materialized snapshot differs from the loaded file" + NORMAL)
+		ok = False
+	if LinesB64(before.GetPersistence()) != LinesB64(reference.persistence.lines):
+		print(RED + "Persistence block of the snapshot differs from the loaded file" + NORMAL)
+		ok = False
+	# Unchanged lines are the same objects
+	known = set([id(t) for t in before.text])
+	shared = len([t for t in after.text if id(t) in known])
+	if shared < len(after) * 0.9:
+		print(RED + f"Only {shared} of {len(after)} lines are shared" + NORMAL)
+		ok = False
+	# Changed ranges rebuild the new state
+	if before.ChangedLines(before) != []:
+		print(RED + "A snapshot differs from itself" + NORMAL)
+		ok = False
+	rebuilt = list(before.text)
+	for i1, i2, j1, j2 in reversed(before.ChangedLines(after)):
+		rebuilt[i1:i2] = after.text[j1:j2]
+	if tuple(rebuilt) != after.text:
+		print(RED + "Changed lines do not rebuild the edited contents" + NORMAL)
+		ok = False
+	return ok
+
+
+def TestDiff() -> bool:
+	" Structural diff reports the sections and keys changed by `ApplyEdits()` "
+	source = os.path.join(assets_dir, "artillery_X4_pro.grumat.cfg")
+	ok = True
+	old = Commands(source)
+	new = Commands(source)
+	if not DiffContents(old.contents, new.contents).IsEmpty():
+		print(RED + "Same file is reported as different" + NORMAL)
+		ok = False
+	ApplyEdits(new)
+	diff = DiffContents(old.contents, new.contents)
+	expected = [('+', 'top'), ('*', 'extruder'), ('+', 'probe_renamed'), ('*', 'printer'), ('+', 'bottom'), ('-', 'probe'), ('-', 'bed_mesh')]
+	if sorted([(s.kind, s.section) for s in diff]) != sorted(expected):
+		print(RED + f"Unexpected sections:\n{diff}" + NORMAL)
+		ok = False
+	printer = diff.Find('printer')
+	if (printer is None) or (sorted([(k.kind, k.key, k.old, k.new) for k in printer.keys]) \
+			!= [('*', 'max_velocity', '1000', '500'), ('+', 'new_key', None, '1')]):
+		print(RED + f"Unexpected changes in [printer]: {printer}" + NORMAL)
+		ok = False
+	extruder = diff.Find('extruder')
+	if (extruder is None) or (extruder.Find('bye_bye') is None) or (extruder.Find('rotation_distance') is None) \
+			or (extruder.Find('rotation_distance').kind != '-'):	# type: ignore
+		print(RED + f"Unexpected changes in [extruder]: {extruder}" + NORMAL)
+		ok = False
+	# Only comments changed
+	new = Commands(source)
+	new.OvrSec('printer', LinesB64(Contents(['[printer]\n', '# A comment\n'] \
+		+ [l.raw_content + '\n' for l in old.contents.FindSection('printer').lines[1:]]).sections[0].lines))	# type: ignore
+	if not DiffContents(old.contents, new.contents).IsEmpty():
+		print(RED + "A comment is reported as a change" + NORMAL)
+		ok = False
+	# Only separators and spaces changed
+	for left, right in (("k: 1", "k:1"), ("k: 1", "k = 1"), ("k: 1 2", "k:  1   2"), ("k: 1", "k: 1   "), ("k: 1", "k :1 # one")):
+		diff = DiffContents(Contents(["[a]\n", left + "\n"]), Contents(["[a]\n", right + "\n"]))
+		if not diff.IsEmpty():
+			print(RED + f"Formatting of '{left}' and '{right}' is reported as a change: {repr(diff.sections)}" + NORMAL)
+			ok = False
+	diff = DiffContents(Contents(["[a]\n", "k: 1\n"]), Contents(["[a]\n", "k:2\n"]))
+	change = diff.Find('a')
+	k = change and change.Find('k')
+	if (k is None) or (k.old, k.new) != ('1', '2'):
+		print(RED + f"Change of value not reported: {repr(diff.sections)}" + NORMAL)
+		ok = False
+	return ok
 
 
 def main():
@@ -52,6 +222,22 @@ def main():
 		print(GREEN + "Test PASSED!" + NORMAL)
 	else:
 		print(RED + "Test FAILED!" + NORMAL)
+	if TestStreamingLoad():
+		print(GREEN + "Test PASSED!" + NORMAL)
+	else:
+		print(RED + "Test FAILED!" + NORMAL)
+	if TestTransaction():
+		print(GREEN + "Test PASSED!" + NORMAL)
+	else:
+		print(RED + "Test FAILED!" + NORMAL)
+	if TestSnapshot():
+		print(GREEN + "Test PASSED!" + NORMAL)
+	else:
+		print(RED + "Test FAILED!" + NORMAL)
+	if TestDiff():
+		print(GREEN + "Test PASSED!" + NORMAL)
+	else:
+		print(RED + "Test FAILED!" + NORMAL)
 
 
 if __name__ == "__main__":
@@ -151,7 +151,7 @@ def Test_Close_():
 	print()
 
 
-res_empty_list = lambda res : str(res).endswith("KxdyRThQkB+mXYgA==")	# spellchecker: disable-line
+res_empty_list = lambda res : res.Extract() == []
 
 
 def Test_ListSec(cmd : Commands):
@@ -160,9 +160,9 @@ def Test_ListSec(cmd : Commands):
 	Validate(cmd, 'ListSectionsB64', ['no_no_no'], res_empty_list)
 	Validate(cmd, 'ListSectionsB64', ['include *'], res_empty_list)
 
-	Validate(cmd, 'ListSectionsB64', ['printer'], lambda res : str(res).endswith("xdyRThQkIRkQBs"))
-	Validate(cmd, 'ListSectionsB64', ['stepper_?'], lambda res : str(res).endswith("X4u5IpwoSEsm4ee"))	# spellchecker: disable-line
-	Validate(cmd, 'ListSectionsB64', ['*home*'], lambda res : str(res).endswith("u5IpwoSAevd+OA=="))	# spellchecker: disable-line
+	Validate(cmd, 'ListSectionsB64', ['printer'], lambda res : str(res).endswith("x+LuSKcKEhQ3uP4A="))
+	Validate(cmd, 'ListSectionsB64', ['stepper_?'], lambda res : str(res).endswith("Rb8LuSKcKEgcz2ieg"))	# spellchecker: disable-line
+	Validate(cmd, 'ListSectionsB64', ['*home*'], lambda res : str(res).endswith("uL8XckU4UJBGTjfuA=="))	# spellchecker: disable-line
 
 	Test_Close_()
 
@@ -172,9 +172,9 @@ def Test_ListKeys(cmd : Commands):
 	Validate(cmd, 'ListKeysB64', ['no_no_no'], res_empty_list)
 	Validate(cmd, 'ListKeysB64', ['pause_resume'], res_empty_list)
 
-	Validate(cmd, 'ListKeysB64', ['idle_timeout'], lambda res : str(res).endswith("PxdyRThQkO6W9Ew="))		# spellchecker: disable-line
-	Validate(cmd, 'ListKeysB64', ['gcode_macro nozzle_wipe'], lambda res : str(res).endswith("P8XckU4UJAIWKOg"))	# spellchecker: disable-line
-	Validate(cmd, 'ListKeysB64', ['printer'], lambda res : str(res).endswith("Qu5IpwoSC9tKcCA"))			# spellchecker: disable-line
+	Validate(cmd, 'ListKeysB64', ['idle_timeout'], lambda res : str(res).endswith("/Bvi7kinChIeHuGTwA="))		# spellchecker: disable-line
+	Validate(cmd, 'ListKeysB64', ['gcode_macro nozzle_wipe'], lambda res : str(res).endswith("GjSZsC7kinChIWcvXu4"))	# spellchecker: disable-line
+	Validate(cmd, 'ListKeysB64', ['printer'], lambda res : str(res).endswith("ws/i7kinChIQ28zDY="))			# spellchecker: disable-line
 
 	Test_Close_()
 
@@ -201,9 +201,9 @@ def Test_GetKey(cmd : Commands):
 	Validate(cmd, 'GetKey', ['stepper_y', 'endstop_pin'], "tmc2209_stepper_y:virtual_endstop")
 	Validate(cmd, 'GetKey', ['stepper_y', 'step_pulse_duration'], "0.000002")
 	Validate(cmd, 'GetKey', ['extruder', 'sensor_type'], "EPCOS 100K B57560G104F")
-	Validate(cmd, 'GetKey', ['homing_override', 'gcode'], lambda res : str(res).endswith("qif+LuSKcKEgfPVerg=="))	# spellchecker: disable-line
-	Validate(cmd, 'GetKey', ['gcode_macro G29', 'gcode'], lambda res : str(res).endswith("Q0dMBdyRThQkAw3lao"))		# spellchecker: disable-line
-	Validate(cmd, 'GetKey', ['gcode_macro M600', 'gcode'], lambda res : str(res).endswith("lV/4u5IpwoSAzd/lIA"))	# spellchecker: disable-line
+	Validate(cmd, 'GetKey', ['homing_override', 'gcode'], lambda res : str(res).endswith("dJ+4u5IpwoSCznwJcA"))	# spellchecker: disable-line
+	Validate(cmd, 'GetKey', ['gcode_macro G29', 'gcode'], lambda res : str(res).endswith("WkIi7kinChIJs8gKYA="))		# spellchecker: disable-line
+	Validate(cmd, 'GetKey', ['gcode_macro M600', 'gcode'], lambda res : str(res).endswith("q3/xdyRThQkDKDsuA="))	# spellchecker: disable-line
 
 	Test_Close_()
 
@@ -296,9 +296,9 @@ def Test_ReadSec(cmd : Commands):
 
 	Validate(cmd, 'ReadSec', ['no_no_no'], None)
 
-	Validate(cmd, 'ReadSec', ['pause_resume'], lambda res : str(res).endswith("Jgq0EBHwu5IpwoSAecMju"))	# spellchecker: disable-line
-	Validate(cmd, 'ReadSec', ['input_shaper'], lambda res : str(res).endswith("UjajsfxdyRThQkEpxYmUA="))	# spellchecker: disable-line
-	Validate(cmd, 'ReadSec', ['extruder'], lambda res : str(res).endswith("TcnXHBKfYxf+LuSKcKEglExVSA"))
+	Validate(cmd, 'ReadSec', ['pause_resume'], lambda res : str(res).endswith("Ax2OScF3JFOFCQFiseZQ="))	# spellchecker: disable-line
+	Validate(cmd, 'ReadSec', ['input_shaper'], lambda res : str(res).endswith("UBWGIfi7kinChIYCM0KQA="))	# spellchecker: disable-line
+	Validate(cmd, 'ReadSec', ['extruder'], lambda res : str(res).endswith("yIl8qz/xdyRThQkN3+8sU="))
 
 	Test_Close_()
 
@@ -349,9 +349,9 @@ def Test_OvrSec(cmd : Commands):
 def Test_Persistence(cmd : Commands):
 	Test_Begin_("Persistence Test")
 
-	Validate(cmd, 'GetPersistenceB64', [], lambda res : str(res).endswith("CPAf8XckU4UJAuPxkB"))
+	Validate(cmd, 'GetPersistenceB64', [], lambda res : str(res).endswith("LwyFs/xdyRThQkIjn7OcA="))
 	Validate(cmd, 'SavePersistenceB64', [encoded_data.RESET_CFG_PLUS], None)
-	Validate(cmd, 'GetPersistenceB64', [], lambda res : str(res).endswith("Ng2osw1f2LuSKcKEgK1Qy8A="))
+	Validate(cmd, 'GetPersistenceB64', [], lambda res : str(res).endswith("AFN4Euf4u5IpwoSHRfZFkA"))
 
 	Test_Checkpoint(cmd, 8)
 	Test_Close_()
@@ -0,0 +1,252 @@
+#
+# -*- coding: UTF-8 -*-
+#
+# Spellchecker: words USWX
+
+import os
+import re
+import sys
+import shutil
+from typing import TYPE_CHECKING
+
+# Enable test environment
+os.environ["USWX4_TEST"] = "test_fleet"
+
+
+# Get the directory of the current script
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# Construct the path to the 'assets' directory
+project_dir = os.path.normpath(os.path.join(current_dir, '..'))
+
+fleet_dir = os.path.join(current_dir, 'fleet')
+
+# Add the 'project_dir' directory to sys.path
+sys.path.append(project_dir)
+
+if TYPE_CHECKING:
+	from ..user_options import UserOptions
+	from ..my_fleet import Fleet, PrinterJob
+	from ..my_workflow import Workflow
+	from ..my_env import GetAssetsFolder
+	from ..my_lib import FileSha256
+	from ..edit_cfg import Contents
+	from ..task_config import DRY_RUN_FILE, DRY_RUN_RESET
+	from .test_utils import *
+else:
+	from user_options import UserOptions
+	from my_fleet import Fleet, PrinterJob
+	from my_workflow import Workflow
+	from my_env import GetAssetsFolder
+	from my_lib import FileSha256
+	from edit_cfg import Contents
+	from task_config import DRY_RUN_FILE, DRY_RUN_RESET
+	from test_utils import *
+
+
+START_WITH_PRO_UPG = 1 << 16
+START_WITH_PRO_GRUMAT = 2 << 16
+START_WITH_PLUS_DEF = 3 << 16
+START_WITH_PLUS_UPG = 4 << 16
+
+# Same options of the `test_task_config.py` steps, relative to the defaults of `UserOptions`
+DISABLED = {
+	'exclude_object': False, 'stepper_z_current': 0, 'extruder_accel': 0, 'extruder_current': 0,
+	'probe_offset': 0, 'probe_sampling': 0, 'probe_validation': 0, 'screws_tilt_adjust': 0,
+	'fan_rename': False, 'mb_fan_fix': False, 'temp_mcu': False,
+	'nozzle_wipe': 0, 'purge_line': 0, 'enable_m600': 0, 'pause': 0,
+}
+PRINTERS = [
+	DISABLED | { 'printer': 1 + START_WITH_PRO_UPG },
+	DISABLED | { 'printer': START_WITH_PLUS_UPG, 'exclude_object': True, 'hb_fan_speed': 1, 'mb_fan_speed': 1 },
+	{ 'printer': START_WITH_PRO_UPG, 'model_attr': False, 'exclude_object': False, 'hb_fan_speed': 2, 'mb_fan_speed': 2,
+		'temp_mcu': False, 'nozzle_wipe': 0, 'purge_line': 0, 'enable_m600': 0, 'pause': 1 },
+	# Options as they would come from the INI file
+	{ 'printer': str(START_WITH_PRO_UPG), 'model_attr': 'False', 'exclude_object': 'False', 'stepper_z_current': '2',
+		'extruder_accel': '2', 'extruder_current': '2', 'probe_offset': '2', 'probe_sampling': '1', 'probe_validation': '2',
+		'screws_tilt_adjust': '2', 'fan_rename': 'False', 'mb_fan_fix': 'False', 'hb_fan_speed': '3', 'mb_fan_speed': '3',
+		'temp_mcu': 'False', 'nozzle_wipe': '1', 'purge_line': '1' },
+	{ 'printer': START_WITH_PRO_GRUMAT, 'exclude_object': False, 'stepper_z_current': 0, 'extruder_accel': 3, 'extruder_current': 3,
+		'probe_offset': 0, 'probe_sampling': 0, 'probe_validation': 0, 'fan_rename': False, 'mb_fan_fix': False,
+		'hb_fan_speed': 5, 'mb_fan_speed': 5, 'purge_line': 2, 'enable_m600': 1, 'pause': 2 },
+	{ 'printer': 1 + START_WITH_PLUS_DEF, 'extruder_current': 2, 'probe_offset': 2, 'probe_validation': 2,
+		'screws_tilt_adjust': 2, 'hb_fan_speed': 4, 'mb_fan_speed': 6 },
+]
+
+
+def Test_Fleet(max_workers : int) -> bool:
+	" Runs all printers concurrently and compares each result with the one of the sequential test "
+	if os.path.isdir(fleet_dir):
+		shutil.rmtree(fleet_dir)
+	fleet = Fleet(UserOptions(), fleet_dir, max_workers)
+	for i, overrides in enumerate(PRINTERS):
+		fleet.Add(f"printer-{i + 1:03d}", overrides)
+	fleet.Run()
+	print(fleet.Summary())
+	res = True
+	for i, job in enumerate(fleet.jobs):
+		left = os.path.join(job.folder, 'printer.cfg')
+		right = os.path.join(current_dir, 'results', f'printer-{i + 1:03d}.cfg')
+		if not job.ok or not files_equal(left, right):
+			print(RED + f"Printer {job.name} FAILED" + NORMAL)
+			res = False
+		elif not CheckLog(fleet, job):
+			res = False
+	return res
+
+
+def CheckLog(fleet : Fleet, job : PrinterJob) -> bool:
+	" The log of a printer has the messages of all its tasks and nothing from the other printers "
+	fname = os.path.join(job.folder, f"{job.name}.log")
+	if not os.path.isfile(fname):
+		print(RED + f"Log file of {job.name} is missing" + NORMAL)
+		return False
+	with open(fname, 'rt', encoding="utf-8") as fr:
+		lines = fr.readlines()
+	begin = len([l for l in lines if ' - Begin Step: ' in l])
+	ok = len([l for l in lines if ' -   OK! (' in l])
+	if (job.steps == 0) or (begin != job.steps) or (ok != job.steps):
+		print(RED + f"Log of {job.name} has {begin} steps and {ok} completions, instead of {job.steps}" + NORMAL)
+		return False
+	others = [j.name for j in fleet.jobs if j is not job]
+	for l in lines:
+		if any([f"Fleet: starting {o} " in l or f"Fleet: {o} " in l for o in others]):
+			print(RED + f"Log of {job.name} has a message of another printer: {l.strip()}" + NORMAL)
+			return False
+	return True
+
+
+HUNK = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+
+def ApplyDiff(lines : list[str], diff : list[str]) -> list[str]:
+	" Applies, in sequence, the unified diffs of all tasks "
+	res = lines[:]
+	offset = 0
+	i = 0
+	while i < len(diff):
+		if diff[i].startswith('--- '):
+			# Diff of the next task, relative to the result of the previous one
+			offset = 0
+			i += 2
+			continue
+		m = HUNK.match(diff[i])
+		assert m is not None, f"Unexpected diff line: {diff[i]}"
+		old_cnt = int(m.group(2) or 1)
+		new_cnt = int(m.group(4) or 1)
+		pos = int(m.group(1)) - (old_cnt > 0) + offset
+		i += 1
+		old, new = [], []
+		while (len(old) < old_cnt) or (len(new) < new_cnt):
+			tag, text = diff[i][:1], diff[i][1:]
+			if tag != '+':
+				old.append(text)
+			if tag != '-':
+				new.append(text)
+			i += 1
+		assert res[pos:pos+len(old)] == old, f"Hunk does not match at line {pos + 1}"
+		res[pos:pos+len(old)] = new
+		offset += len(new) - len(old)
+	return res
+
+
+def Test_DryRun() -> bool:
+	" The diff of a dry-run turns the fetched file into the result of a real run, which is not touched "
+	if os.path.isdir(fleet_dir):
+		shutil.rmtree(fleet_dir)
+	fleet = Fleet(UserOptions(), fleet_dir, len(PRINTERS), dry_run=True)
+	for i, overrides in enumerate(PRINTERS):
+		fleet.Add(f"printer-{i + 1:03d}", overrides)
+	fleet.Run()
+	print(fleet.Summary())
+	assets = ["artillery_X4_pro.def.cfg", "artillery_X4_pro.upg.cfg", "artillery_X4_pro.grumat.cfg",
+		"artillery_X4_plus.def.cfg", "artillery_X4_plus.upg.cfg", "artillery_X4_plus.grumat.cfg"]
+	res = True
+	for i, job in enumerate(fleet.jobs):
+		fname = os.path.join(job.folder, 'printer.cfg')
+		source = os.path.join(GetAssetsFolder(), assets[int(PRINTERS[i]['printer']) >> 16])
+		if (not job.ok) or (not files_equal(fname, source)):
+			print(RED + f"Printer {job.name} FAILED or its file was changed" + NORMAL)
+			res = False
+			continue
+		contents = Contents()
+		contents.Load(fname)
+		with open(os.path.join(job.folder, DRY_RUN_FILE), 'rt', encoding="utf-8") as fr:
+			diff = [l.rstrip('\n') for l in fr]
+		lines = ApplyDiff([l.raw_content for l in contents.file_buffer.lines], diff)
+		with open(os.path.join(current_dir, 'results', f'printer-{i + 1:03d}.cfg'), 'rt', encoding="utf-8") as fr:
+			expected = [l.rstrip('\n') for l in fr]
+		if lines != expected:
+			print(RED + f"Diff of {job.name} does not give the result of a real run" + NORMAL)
+			res = False
+		if len([l for l in diff if l.startswith('--- ')]) != job.changes:
+			print(RED + f"Diff of {job.name} should have a block for each of its {job.changes} changes" + NORMAL)
+			res = False
+	return res
+
+
+def Test_DryRunReset() -> bool:
+	" A dry-run reset edits a copy of the factory file, so saving the editor changes no asset "
+	if os.path.isdir(fleet_dir):
+		shutil.rmtree(fleet_dir)
+	opts = UserOptions()
+	for key, value in (DISABLED | { 'printer': START_WITH_PRO_UPG, 'reset': 2 }).items():
+		opts.SetOption(key, value)
+	assets = {f : FileSha256(os.path.join(GetAssetsFolder(), f)) for f in os.listdir(GetAssetsFolder()) if f.endswith('.cfg')}
+	wf = Workflow(opts, dry_run=True)
+	wf.work_folder = fleet_dir
+	if (not wf.Run()) or (wf.editor is None):
+		print(RED + f"Dry-run with reset failed: {wf.errors}" + NORMAL)
+		return False
+	wf.editor.Save()
+	res = True
+	if wf.editor.fname != os.path.join(fleet_dir, DRY_RUN_RESET):
+		print(RED + f"Editor would save to '{wf.editor.fname}'" + NORMAL)
+		res = False
+	for f, sha256 in assets.items():
+		if FileSha256(os.path.join(GetAssetsFolder(), f)) != sha256:
+			print(RED + f"Asset '{f}' was changed" + NORMAL)
+			res = False
+	if not files_equal(os.path.join(fleet_dir, 'printer.cfg'), os.path.join(GetAssetsFolder(), "artillery_X4_pro.upg.cfg")):
+		print(RED + "Fetched file was changed" + NORMAL)
+		res = False
+	return res
+
+
+def Test_SharedStore() -> bool:
+	" Printers with the same configuration file share a single backup blob "
+	if os.path.isdir(fleet_dir):
+		shutil.rmtree(fleet_dir)
+	fleet = Fleet(UserOptions(), fleet_dir, 2)
+	fleet.Add("printer-a", PRINTERS[0] | { 'ip_addr': '192.168.0.201' })
+	fleet.Add("printer-b", PRINTERS[0] | { 'ip_addr': '192.168.0.202' })
+	fleet.Run()
+	blobs = [f for _, _, files in os.walk(os.path.join(fleet.store.folder, 'blobs')) for f in files]
+	printers = sorted([e.printer for e in fleet.store.entries])
+	if (not all([job.ok for job in fleet.jobs])) or (len(blobs) != 1) or (len(fleet.store.blobs) != 1) \
+			or (printers != ['192.168.0.201', '192.168.0.202']):
+		print(RED + f"Expected a single blob for both printers: {blobs}, {printers}" + NORMAL)
+		return False
+	return True
+
+
+def Test_UnknownOption() -> bool:
+	fleet = Fleet(UserOptions(), fleet_dir)
+	try:
+		fleet.Add("bad", { 'no_such_option': 1 })
+	except ValueError:
+		return True
+	print(RED + "Unknown option was accepted" + NORMAL)
+	return False
+
+
+def main():
+	res = Test_Fleet(1) and Test_Fleet(len(PRINTERS)) and Test_DryRun() and Test_DryRunReset() and Test_SharedStore() and Test_UnknownOption()
+	if os.path.isdir(fleet_dir):
+		shutil.rmtree(fleet_dir)
+	if res:
+		print(GREEN + "Test PASSED!" + NORMAL)
+	else:
+		print(RED + "Test FAILED!" + NORMAL)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,87 @@
+#
+# -*- coding: UTF-8 -*-
+#
+# Spellchecker: words USWX
+
+import os
+import sys
+from typing import TYPE_CHECKING
+
+# Enable test environment
+os.environ["USWX4_TEST"] = "test_plan"
+
+
+# Get the directory of the current script
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# Construct the path to the 'assets' directory
+project_dir = os.path.normpath(os.path.join(current_dir, '..'))
+
+# Add the 'project_dir' directory to sys.path
+sys.path.append(project_dir)
+
+if TYPE_CHECKING:
+	from ..task_config import StmtList_
+	from .test_utils import *
+else:
+	from task_config import StmtList_
+	from test_utils import *
+
+
+# A plan used by two classes with different handlers
+PLAN = (
+	( "_always_",		"_mark_",		"a" ),
+	( "_always_",		"_upd_val_",	("section", "key"),		"pro",		"plus" ),
+)
+
+
+class First_(StmtList_):
+	def _mark_(self, tag : str) -> str:
+		return "first " + tag
+	def _put_val_(self, key : tuple, value : str) -> str:
+		return "first " + value
+
+
+class Second_(StmtList_):
+	def _mark_(self, tag : str) -> str:
+		return "second " + tag
+	def _put_val_(self, key : tuple, value : str) -> str:
+		return "second " + value
+
+
+def Test_PerClass() -> bool:
+	" Each class runs its own handlers, even when another class compiled the same plan first "
+	res = True
+	for cls, name in ((First_, "first"), (Second_, "second"), (First_, "first")):
+		for is_pro, value in ((True, "pro"), (False, "plus")):
+			ops = cls.CompilePlan(PLAN, is_pro)
+			got = [op.call(None, *op.args) for op in ops]
+			if got != [f"{name} a", f"{name} {value}"]:
+				print(RED + f"{cls.__name__} ({is_pro and 'pro' or 'plus'}) ran {got}" + NORMAL)
+				res = False
+	return res
+
+
+def Test_Cached() -> bool:
+	" A plan is compiled once per class and printer model "
+	ops = First_.CompilePlan(PLAN, True)
+	if First_.CompilePlan(PLAN, True) is not ops:
+		print(RED + "Plan was compiled again" + NORMAL)
+		return False
+	# Same contents, but another table
+	copy = tuple(list(PLAN))
+	if First_.CompilePlan(copy, True) is ops:
+		print(RED + "A different table got the compiled plan of another" + NORMAL)
+		return False
+	return True
+
+
+def main():
+	res = Test_PerClass() and Test_Cached()
+	if res:
+		print(GREEN + "Test PASSED!" + NORMAL)
+	else:
+		print(RED + "Test FAILED!" + NORMAL)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,175 @@
+#
+# -*- coding: UTF-8 -*-
+#
+# Spellchecker: words USWX
+
+import os
+import sys
+import io
+import time
+import contextlib
+from typing import TYPE_CHECKING
+
+# Enable test environment
+os.environ["USWX4_TEST"] = "test_scheduler"
+
+
+# Get the directory of the current script
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# Construct the path to the 'assets' directory
+project_dir = os.path.normpath(os.path.join(current_dir, '..'))
+
+# Add the 'project_dir' directory to sys.path
+sys.path.append(project_dir)
+
+if TYPE_CHECKING:
+	from ..user_options import UserOptions
+	from ..my_workflow import Workflow, Task, TaskState, RES_SHELL, RES_EDITOR
+	from ..my_scheduler import TaskScheduler
+	from .test_utils import *
+else:
+	from user_options import UserOptions
+	from my_workflow import Workflow, Task, TaskState, RES_SHELL, RES_EDITOR
+	from my_scheduler import TaskScheduler
+	from test_utils import *
+
+
+# Duration of each fake task
+STEP = 0.2
+
+
+class Fake_(Task):
+	" A task that just takes some time, recording when it ran "
+	def __init__(self, workflow : Workflow, state = TaskState.READY, fail = False) -> None:
+		super().__init__(workflow, type(self).__name__, state)
+		self.fail = fail
+		self.start = 0.0
+		self.end = 0.0
+	def Do(self):
+		self.start = time.perf_counter()
+		self.Info(f"\n\t{self.label} first message")
+		time.sleep(STEP)
+		self.Info(f"\n\t{self.label} last message\n")
+		self.end = time.perf_counter()
+		if self.fail:
+			raise Exception(f"{self.label} failed")
+
+class Fence(Fake_):
+	pass
+
+class Shell1(Fake_):
+	DEPENDS = ("Fence",)
+	RESOURCES = (RES_SHELL,)
+
+class Shell2(Shell1):
+	pass
+
+class Edit1(Fake_):
+	DEPENDS = ("Fence",)
+	RESOURCES = (RES_EDITOR,)
+
+class Edit2(Edit1):
+	pass
+
+class Save(Fake_):
+	DEPENDS = ("Edit2",)
+	RESOURCES = (RES_SHELL, RES_EDITOR)
+
+class Final(Fake_):
+	pass
+
+
+def MakeWorkflow(*tasks) -> Workflow:
+	wf = Workflow(UserOptions())
+	wf.tasks = []
+	for cls, kwargs in tasks:
+		wf.tasks.append(cls(wf, **kwargs))
+	return wf
+
+
+def Overlap(a : Fake_, b : Fake_) -> bool:
+	return (a.start < b.end) and (b.start < a.end)
+
+
+def Test_Dependencies() -> bool:
+	wf = MakeWorkflow((Fence, {}), (Shell1, {}), (Edit1, {}), (Shell2, {}), (Edit2, {}), (Save, {}), (Final, {}))
+	deps = TaskScheduler(wf.tasks).Dependencies()
+	expected = [set(), {0}, {0}, {0, 1}, {0, 2}, {0, 1, 2, 3, 4}, {0, 1, 2, 3, 4, 5}]
+	if deps != expected:
+		print(RED + f"Unexpected dependencies: {deps}" + NORMAL)
+		return False
+	return True
+
+
+def Test_Concurrency() -> bool:
+	wf = MakeWorkflow((Fence, {}), (Shell1, {}), (Shell2, {}), (Edit1, {}), (Edit2, {}), (Save, {}), (Final, {}))
+	out = io.StringIO()
+	with contextlib.redirect_stdout(out):
+		timeline = wf._schedule_()
+	print(timeline)
+	t = {type(task).__name__ : task for task in wf.tasks}
+	res = True
+	if not all([task.state == TaskState.DONE for task in wf.tasks]):
+		print(RED + "Not all tasks completed" + NORMAL)
+		res = False
+	# Resources are exclusive and follow the list order
+	if Overlap(t['Shell1'], t['Shell2']) or (t['Shell2'].start < t['Shell1'].end):
+		print(RED + "Shell tasks overlapped" + NORMAL)
+		res = False
+	if Overlap(t['Edit1'], t['Edit2']) or (t['Edit2'].start < t['Edit1'].end):
+		print(RED + "Editor tasks overlapped" + NORMAL)
+		res = False
+	# Independent tasks run at the same time
+	if not Overlap(t['Shell1'], t['Edit1']):
+		print(RED + "Independent tasks did not overlap" + NORMAL)
+		res = False
+	# Dependencies and fences
+	for name in ('Shell1', 'Shell2', 'Edit1', 'Edit2'):
+		if (t[name].start < t['Fence'].end) or (t[name].end > t['Final'].start):
+			print(RED + f"{name} did not respect the fences" + NORMAL)
+			res = False
+	if t['Save'].start < max(t['Shell2'].end, t['Edit2'].end):
+		print(RED + "Save started before its dependencies" + NORMAL)
+		res = False
+	if timeline.saved < STEP:
+		print(RED + f"Expected wall clock savings, got {timeline.saved:.2f}s" + NORMAL)
+		res = False
+	# Messages of each task are kept together
+	text = out.getvalue()
+	for task in wf.tasks:
+		block = f"Begin Step: {task.label}...  {NORMAL}\n\t{task.label} first message\n\t{task.label} last message\nOK!\n"
+		if block not in text:
+			print(RED + f"Output of {task.label} is not contiguous" + NORMAL)
+			res = False
+	if not res:
+		print(text)
+	return res
+
+
+def Test_Failure() -> bool:
+	wf = MakeWorkflow((Fence, {}), (Shell1, {'fail' : True}), (Edit1, {}), (Shell2, {}), (Final, {'state' : TaskState.ALWAYS}))
+	with contextlib.redirect_stdout(io.StringIO()):
+		wf._schedule_()
+		wf._update_states()
+	states = [task.state for task in wf.tasks]
+	# Edit1 overlaps the failing task and completes; Shell2 does not start
+	expected = [TaskState.DONE, TaskState.FAIL, TaskState.DONE, TaskState.FAIL, TaskState.DONE]
+	if states != expected:
+		print(RED + f"Unexpected states: {[s.name for s in states]}" + NORMAL)
+		return False
+	if wf.tasks[3].start != 0.0:
+		print(RED + f"{wf.tasks[3].label} should not run" + NORMAL)
+		return False
+	return wf.errors == ["Shell1: Shell1 failed"]
+
+
+def main():
+	res = Test_Dependencies() and Test_Concurrency() and Test_Failure()
+	if res:
+		print(GREEN + "Test PASSED!" + NORMAL)
+	else:
+		print(RED + "Test FAILED!" + NORMAL)
+
+
+if __name__ == "__main__":
+	main()
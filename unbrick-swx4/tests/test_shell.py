@@ -0,0 +1,388 @@
+#
+# -*- coding: UTF-8 -*-
+#
+# Spellchecker: words USWX mkspi rockchip stty gcode
+
+import os
+import re
+import sys
+import time
+from typing import Callable, TYPE_CHECKING
+
+# Enable test environment
+os.environ["USWX4_TEST"] = "test_shell"
+
+
+# Get the directory of the current script
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# Construct the path to the 'assets' directory
+project_dir = os.path.normpath(os.path.join(current_dir, '..'))
+
+# Add the 'project_dir' directory to sys.path
+sys.path.append(project_dir)
+
+if TYPE_CHECKING:
+	from .. import my_shell
+	from ..my_shell import ArtillerySideWinder, ExecChannel
+	from ..user_options import UserOptions
+	from ..my_workflow import Workflow, Message
+	from ..task_connect import CheckConnect
+	from ..task_permissions import FixFilePermission, FixHomePermission, FIX_PERMISSION, KEEP_OWNER
+	from .. import task_services
+	from ..task_services import StartKlipper
+	from .test_utils import *
+else:
+	import my_shell
+	from my_shell import ArtillerySideWinder, ExecChannel
+	from user_options import UserOptions
+	from my_workflow import Workflow, Message
+	from task_connect import CheckConnect
+	from task_permissions import FixFilePermission, FixHomePermission, FIX_PERMISSION, KEEP_OWNER
+	import task_services
+	from task_services import StartKlipper
+	from test_utils import *
+
+
+class FakeExecChannel:
+	"""
+	Stands for a paramiko channel running a command. Output is delivered in chunks and stdout
+	stalls while stderr has more than `window` bytes not read, like a full SSH window.
+	"""
+	def __init__(self, stdout : list[bytes], stderr : list[bytes], exit_code : int|None, window = 1 << 20) -> None:
+		self.stdout = stdout
+		self.stderr = stderr
+		# `None` never completes
+		self.exit_code = exit_code
+		self.window = window
+		self.closed = False
+		# Records the first wait for the command
+		self.log : list[str]|None = None
+		self.name = ""
+		# Always readable, so `select()` returns at once
+		self._r, self._w = os.pipe()
+		os.write(self._w, b'.')
+	def fileno(self) -> int:
+		return self._r
+	def recv_ready(self) -> bool:
+		return bool(self.stdout) and (sum([len(c) for c in self.stderr]) <= self.window)
+	def recv(self, n : int) -> bytes:
+		return self.stdout.pop(0)
+	def recv_stderr_ready(self) -> bool:
+		return bool(self.stderr)
+	def recv_stderr(self, n : int) -> bytes:
+		return self.stderr.pop(0)
+	def exit_status_ready(self) -> bool:
+		if self.log is not None:
+			self.log.append(f"wait {self.name}")
+			self.log = None
+		return (self.exit_code is not None) and not (self.stdout or self.stderr)
+	def recv_exit_status(self) -> int:
+		assert self.exit_code is not None
+		return self.exit_code
+	def close(self) -> None:
+		self.closed = True
+		os.close(self._r)
+		os.close(self._w)
+
+
+class FakeSideWinder(ArtillerySideWinder):
+	" Serves exec channels from a table of command outputs "
+	def __init__(self, outputs : dict[str, tuple[str, str, int]]) -> None:
+		super().__init__()
+		self.outputs = outputs
+		self.log : list[str] = []
+	def _open_channel_(self, cmd : str, timeout : float):
+		self.log.append(f"open {cmd}")
+		out, err, code = self.outputs[cmd]
+		channel = FakeExecChannel([out.encode('utf-8')], err and [err.encode('utf-8')] or [], code)
+		channel.log = self.log
+		channel.name = cmd
+		return channel
+
+
+class ScriptedShell:
+	"""
+	Stands for the interactive shell channel. Each framed command is answered with the output and
+	exit code returned by `handler`, or nothing at all if it returns `None`. Output is delivered
+	in small chunks, so end markers are split between reads.
+	"""
+	FRAME = re.compile(r'^(.*)\necho (__END_[0-9a-f]+)_\$\?\n$', re.S)
+	def __init__(self, handler : Callable[[str], tuple[str, int]|None], chunk = 7) -> None:
+		self.handler = handler
+		self.chunk = chunk
+		self.commands : list[str] = []
+		self.pending = bytearray()
+		self.closed = False
+		self.eof_received = False
+		# Always readable, so `select()` returns at once
+		self._r, self._w = os.pipe()
+		os.write(self._w, b'.')
+	def fileno(self) -> int:
+		return self._r
+	def send(self, data : bytes) -> int:
+		m = self.FRAME.match(data.decode('utf-8'))
+		assert m is not None, f"Command is not framed: {data!r}"
+		self.commands.append(m[1])
+		res = self.handler(m[1])
+		if res is not None:
+			out, code = res
+			self.pending += f"{out}{m[2]}_{code}\n".encode('utf-8')
+		return len(data)
+	def recv_ready(self) -> bool:
+		return bool(self.pending)
+	def recv(self, n : int) -> bytes:
+		res = bytes(self.pending[:min(n, self.chunk)])
+		del self.pending[:len(res)]
+		return res
+
+
+class LiveMode:
+	" Runs code paths that need a printer; the test provides the shell "
+	def __enter__(self) -> None:
+		my_shell.TEST_MODE = None
+	def __exit__(self, *args) -> None:
+		my_shell.TEST_MODE = os.environ["USWX4_TEST"]
+
+
+def Connected(handler : Callable[[str], tuple[str, int]|None]) -> ArtillerySideWinder:
+	sw = ArtillerySideWinder()
+	sw.client = object()
+	sw.shell = ScriptedShell(handler)
+	return sw
+
+
+def Test_Framed() -> bool:
+	" Output is complete as soon as the end marker arrives, even when it is split between reads "
+	sw = Connected(lambda cmd : ("line 1\nline 2\n", 0))
+	start = time.monotonic()
+	with LiveMode():
+		res = sw.ExecCommand("cat file", 10)
+	elapsed = time.monotonic() - start
+	if (res != ["line 1", "line 2"]) or (sw.exit_code != 0) or (elapsed > 0.1):
+		print(RED + f"Unexpected framed output: {res}, exit code {sw.exit_code}, {elapsed:.3f}s" + NORMAL)
+		return False
+	return True
+
+
+def Test_ExitCode() -> bool:
+	" Exit codes are kept and `check` turns failures into exceptions "
+	sw = Connected(lambda cmd : ("failed\n", 2))
+	with LiveMode():
+		res = sw.ExecCommand("false")
+		if (res != ["failed"]) or (sw.exit_code != 2):
+			print(RED + f"Unexpected result: {res}, exit code {sw.exit_code}" + NORMAL)
+			return False
+		try:
+			sw.ExecCommand("false", check=True)
+		except Exception:
+			return True
+	print(RED + "Failure was not raised" + NORMAL)
+	return False
+
+
+def Test_Leftovers() -> bool:
+	" Output left by a command that timed out is discarded, and its late end marker is not output "
+	sw = Connected(lambda cmd : ("__END_0123456789ab_0\nnew\n", 0))
+	sw.shell.pending += b"old output\n"	# type: ignore
+	with LiveMode():
+		res = sw.ExecCommand("echo new")
+	if res != ["new"]:
+		print(RED + f"Unexpected output: {res}" + NORMAL)
+		return False
+	return True
+
+
+def Test_NoResponse() -> bool:
+	" A command without an end marker fails when the timeout expires "
+	sw = Connected(lambda cmd : None)
+	start = time.monotonic()
+	with LiveMode():
+		try:
+			sw.ExecCommand("sleep 100", 0.3)
+		except Exception:
+			elapsed = time.monotonic() - start
+			if (sw.exit_code is not None) or (elapsed < 0.3) or (elapsed > 0.6):
+				print(RED + f"Timeout not respected: {elapsed:.2f}s" + NORMAL)
+				return False
+			return True
+	print(RED + "Missing response was not raised" + NORMAL)
+	return False
+
+
+def Test_DelFileMatch() -> bool:
+	" Each name is deleted by a single command; the count and progress come from its output "
+	outputs = {
+		"/home/mks/gcode_files/*.gcode": "/home/mks/gcode_files/a.gcode\n/home/mks/gcode_files/b b.gcode\n",
+		"/home/mks/Videos/": "find: '/home/mks/Videos/': No such file or directory\n",
+		"/home/mks/*.log": "/home/mks/x.log\n",
+	}
+	def handler(cmd : str) -> tuple[str, int]:
+		m = re.match(r'find (.+) -type f -delete -print$', cmd)
+		assert m is not None, f"Unexpected command: {cmd}"
+		return outputs[m[1]], 0
+	sw = Connected(handler)
+	progress : list[tuple[str, bool]] = []
+	with LiveMode():
+		cnt = sw.DelFileMatch(list(outputs), lambda name, is_pattern : progress.append((name, is_pattern)))
+	expected = [
+		("/home/mks/gcode_files/*.gcode", True), ("/home/mks/gcode_files/a.gcode", False), ("/home/mks/gcode_files/b b.gcode", False),
+		("/home/mks/Videos/", True),
+		("/home/mks/*.log", True), ("/home/mks/x.log", False),
+	]
+	if (cnt != 3) or (progress != expected) or (len(sw.shell.commands) != 3):	# type: ignore
+		print(RED + f"Unexpected deletion: {cnt} files, {progress}, {sw.shell.commands}" + NORMAL)	# type: ignore
+		return False
+	return True
+
+
+class RecordingWorkflow(Workflow):
+	" Keeps the messages of the tasks, on a scripted shell "
+	def __init__(self, handler : Callable[[str], tuple[str, int]|None]) -> None:
+		super().__init__(UserOptions())
+		self.client = object()
+		self.shell = ScriptedShell(handler)
+		self.messages : list[str] = []
+	def UpdateUI(self, task) -> None:
+		if isinstance(task, Message):
+			self.messages.append(task.msg)
+
+
+def Test_FixFilePermission() -> bool:
+	" Files sharing a permission are fixed by a single command; only the ones chmod changed are counted "
+	missing = FIX_PERMISSION[3][1]
+	# Files that already had the right mode are not listed by `chmod -c`
+	changed = [fname for _, fname in FIX_PERMISSION[5:9]]
+	def handler(cmd : str) -> tuple[str, int]:
+		assert cmd.startswith("chmod -c "), f"Unexpected command: {cmd}"
+		return ''.join([f"mode of '{f}' changed from 0755 (rwxr-xr-x) to 0644 (rw-r--r--)\n" for f in changed]) \
+			+ f"chmod: cannot access '{missing}': No such file or directory\n", 1
+	wf = RecordingWorkflow(handler)
+	with LiveMode():
+		FixFilePermission(wf).Do()
+	modes = set([perm for perm, _ in FIX_PERMISSION])
+	expected = f"{len(changed)} files fixed"
+	if (len(wf.shell.commands) != len(modes)) or not any([expected in m for m in wf.messages]):	# type: ignore
+		print(RED + f"Unexpected permission fix: {wf.shell.commands}, {wf.messages[-1:]}" + NORMAL)	# type: ignore
+		return False
+	return True
+
+
+def Test_FixHomePermission() -> bool:
+	" A single `find` selects the files, leaving out the ones of root services, and fixes them in bulk "
+	files = ["/home/mks/printer_data/a.cfg", "/home/mks/gcode_files/b.gcode", "/home/mks/.cache/c"]
+	def handler(cmd : str) -> tuple[str, int]:
+		assert cmd.startswith("find /home/mks/ "), f"Unexpected command: {cmd}"
+		return "find: '/home/mks/lost+found': Permission denied\n" + ''.join([f + '\n' for f in files]), 1
+	wf = RecordingWorkflow(handler)
+	with LiveMode():
+		FixHomePermission(wf).Do()
+	res = True
+	cmd = wf.shell.commands[0]	# type: ignore
+	if (len(wf.shell.commands) != 1) or (not cmd.endswith("-exec chown mks:mks {} +")) \
+			or not all([f"-not -path {pat}" in cmd or f"-not -path '{pat}'" in cmd for pat in KEEP_OWNER]):	# type: ignore
+		print(RED + f"Unexpected commands: {wf.shell.commands}" + NORMAL)	# type: ignore
+		res = False
+	if (not any(["3 files found" in m for m in wf.messages])) or (len([m for m in wf.messages if "Fixing file" in m]) != 3):
+		print(RED + f"Unexpected messages: {wf.messages}" + NORMAL)
+		res = False
+	return res
+
+
+def Test_StartFailedBefore() -> bool:
+	" A unit left failed by an earlier run is reset and does not fail a start that is just queued "
+	# `systemctl show` runs before systemd dispatches the queued start
+	show = "Id=klipper.service\nLoadState=loaded\nActiveState=failed\nSubState=failed\nUnitFileState=enabled\n"
+	deadline = task_services.START_DEADLINE
+	task_services.START_DEADLINE = 0.3
+	res = True
+	try:
+		# Klipper becomes ready, or never does and systemd reports it failed
+		for ready, expected in ((True, None), (False, "Service 'klipper' failed to start!")):
+			wf = RecordingWorkflow(lambda cmd : (show, 0))
+			probes = { 'python3': int(not ready), 'systemctl': 0 }
+			wf._open_channel_ = lambda cmd, timeout : FakeExecChannel([], [], probes[cmd.split()[0]])
+			error = None
+			with LiveMode():
+				try:
+					StartKlipper(wf).Do()
+				except Exception as e:
+					error = str(e)
+			batch = wf.shell.commands[0]	# type: ignore
+			if error != expected:
+				print(RED + f"Unexpected outcome of the start: {error}" + NORMAL)
+				res = False
+			if not re.search(r'systemctl reset-failed \$u; systemctl --no-block start \$u', batch):
+				print(RED + f"Failed units are not reset before the start: {batch}" + NORMAL)
+				res = False
+	finally:
+		task_services.START_DEADLINE = deadline
+	return res
+
+
+def Test_Streams() -> bool:
+	" Stdout, stderr and exit code are kept apart "
+	channel = FakeExecChannel([b'line 1\nli', b'ne 2\n'], [b'warning\n'], 3)
+	res = ExecChannel(channel, "cmd", 1.0).Wait()
+	if (res.stdout != ['line 1', 'line 2']) or (res.stderr != ['warning']) or (res.exit_code != 3) or res.ok:
+		print(RED + f"Unexpected result: {res.stdout} {res.stderr} {res.exit_code}" + NORMAL)
+		return False
+	return True
+
+
+def Test_StderrWindow() -> bool:
+	" A command writing lots of errors does not block its output "
+	errors = [f"error {i}\n".encode('utf-8') * 1000 for i in range(10)]
+	channel = FakeExecChannel([b'done\n'], errors, 0, window=32 * 1024)
+	res = ExecChannel(channel, "cmd", 1.0).Wait()
+	if (res.stdout != ['done']) or (len(res.stderr) != 10 * 1000):
+		print(RED + f"Streams were not read together: {res.stdout}, {len(res.stderr)} errors" + NORMAL)
+		return False
+	return True
+
+
+def Test_Timeout() -> bool:
+	" A command that does not complete is reported with a `None` exit code "
+	channel = FakeExecChannel([], [], None)
+	start = time.monotonic()
+	res = ExecChannel(channel, "cmd", 0.3).Wait()
+	elapsed = time.monotonic() - start
+	if (res.exit_code is not None) or (not channel.closed) or (elapsed < 0.3) or (elapsed > 0.6):
+		print(RED + f"Timeout not respected: {res.exit_code}, {elapsed:.2f}s" + NORMAL)
+		return False
+	return True
+
+
+def Test_CheckConnect() -> bool:
+	" The checks of the printer identity start together, over separate channels "
+	wf = Workflow(UserOptions())
+	wf.headless = True
+	wf.motd_output = ['root@mkspi:~# ']
+	sw = FakeSideWinder({
+		'uname -a': ('Linux mkspi 4.4.179-rockchip64 #1 SMP aarch64 GNU/Linux\n', '', 0),
+		'./get_id': ('/dev/serial/by-id/usb-Klipper_stm32f401xc_0123456789ABCDEF01234567-if00\n', '', 0),
+		'ls -1 /home/mks/Desktop/myfile/others/artillery_X4_*.cfg': (
+			''.join([f"/home/mks/Desktop/myfile/others/artillery_X4_{m}.cfg\n" for m in ('max', 'plus', 'pro')]), '', 0),
+	})
+	wf._open_channel_ = sw._open_channel_
+	CheckConnect(wf).Do()
+	if not wf.connection_valid:
+		print(RED + "Printer was not recognized" + NORMAL)
+		return False
+	if [l.split()[0] for l in sw.log] != ['open'] * 3 + ['wait'] * 3:
+		print(RED + f"Unexpected commands: {sw.log}" + NORMAL)
+		return False
+	return True
+
+
+def main():
+	res = Test_Framed() and Test_ExitCode() and Test_Leftovers() and Test_NoResponse() \
+		and Test_Streams() and Test_StderrWindow() and Test_Timeout() and Test_CheckConnect() \
+		and Test_DelFileMatch() and Test_FixFilePermission() and Test_FixHomePermission() and Test_StartFailedBefore()
+	if res:
+		print(GREEN + "Test PASSED!" + NORMAL)
+	else:
+		print(RED + "Test FAILED!" + NORMAL)
+
+
+if __name__ == "__main__":
+	main()
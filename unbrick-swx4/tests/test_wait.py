@@ -0,0 +1,85 @@
+#
+# -*- coding: UTF-8 -*-
+#
+# Spellchecker: words USWX
+
+import os
+import sys
+import time
+from typing import TYPE_CHECKING
+
+# Enable test environment
+os.environ["USWX4_TEST"] = "test_wait"
+
+
+# Get the directory of the current script
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# Construct the path to the 'assets' directory
+project_dir = os.path.normpath(os.path.join(current_dir, '..'))
+
+# Add the 'project_dir' directory to sys.path
+sys.path.append(project_dir)
+
+if TYPE_CHECKING:
+	from ..my_shell import ArtillerySideWinder, WAIT_FIRST_DELAY
+	from .test_utils import *
+else:
+	from my_shell import ArtillerySideWinder, WAIT_FIRST_DELAY
+	from test_utils import *
+
+
+class Probe:
+	" Becomes ready after a number of calls, recording when it was called "
+	def __init__(self, ready_at : int) -> None:
+		self.ready_at = ready_at
+		self.calls : list[float] = []
+	def __call__(self) -> bool:
+		self.calls.append(time.monotonic())
+		return len(self.calls) >= self.ready_at
+
+
+def Test_Ready() -> bool:
+	" Returns as soon as the probe succeeds, doubling the delay between calls "
+	probe = Probe(4)
+	if not ArtillerySideWinder().WaitFor(probe, 10.0):
+		print(RED + "Probe did not succeed" + NORMAL)
+		return False
+	delays = [b - a for a, b in zip(probe.calls, probe.calls[1:])]
+	expected = [WAIT_FIRST_DELAY, WAIT_FIRST_DELAY * 2, WAIT_FIRST_DELAY * 4]
+	if (len(probe.calls) != 4) or any([abs(d - e) > 0.1 for d, e in zip(delays, expected)]):
+		print(RED + f"Unexpected delays: {delays}" + NORMAL)
+		return False
+	return True
+
+
+def Test_Deadline() -> bool:
+	" Gives up when the deadline expires "
+	probe = Probe(1000)
+	start = time.monotonic()
+	res = ArtillerySideWinder().WaitFor(probe, 1.0)
+	elapsed = time.monotonic() - start
+	if res or (elapsed < 1.0) or (elapsed > 1.3):
+		print(RED + f"Deadline not respected: {res}, {elapsed:.2f}s" + NORMAL)
+		return False
+	return True
+
+
+def Test_Commands() -> bool:
+	" Readiness checks succeed without a printer in test mode "
+	sw = ArtillerySideWinder()
+	return sw.WaitServiceActive("klipper", 1.0) \
+		and sw.WaitUnixSocket("/tmp/klippy_uds", 1.0) \
+		and sw.WaitTcpPort(7125, 1.0) \
+		and sw.WaitDiskIdle(1.0)
+
+
+def main():
+	res = Test_Ready() and Test_Deadline() and Test_Commands()
+	if res:
+		print(GREEN + "Test PASSED!" + NORMAL)
+	else:
+		print(RED + "Test FAILED!" + NORMAL)
+
+
+if __name__ == "__main__":
+	main()
@@ -45,6 +45,18 @@ class UserOptions(object):
 		self.enable_m600 = 2
 		self.pause = 3
 
+	def SetOption(self, key : str, value : str|int|bool) -> None:
+		" Sets an option by name; text values are converted to the type of the option "
+		if key not in vars(self):
+			raise ValueError(f"Unknown option '{key}'")
+		if isinstance(value, str):
+			cur = getattr(self, key)
+			if isinstance(cur, bool):
+				value = value.lower() == 'true'
+			elif isinstance(cur, int):
+				value = int(value)
+		setattr(self, key, value)
+
 	def IsArtillerySWX4Pro(self):
 		return self.printer == 0
 	